@@ -0,0 +1,42 @@
+import sys
+import os
+import random
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Avl import AVLTree
+from src.Models import Book
+from src.Isbn import makeISBN
+
+def time_lookups(search, root, keys, repeats):
+    """Returns the best-of-`repeats` time per lookup in nanoseconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for isbn in keys:
+            search(root, isbn)
+        best = min(best, time.perf_counter() - start)
+    return best / len(keys) * 1e9
+
+def run_benchmark(n=200_000, lookups=100_000, repeats=5):
+    rng = random.Random(42)
+    tree = AVLTree()
+    root = None
+
+    print(f"Building catalog of {n} books...")
+    isbns = [int(makeISBN(i)) for i in rng.sample(range(10**9), n)]
+    for isbn in isbns:
+        root = tree.insertIter(root, isbn, Book(isbn, "Title", "Author", 2000, "Bench", 1))
+    print(f"Tree height: {root.height}")
+
+    keys = [rng.choice(isbns) for _ in range(lookups)]
+    recursive = time_lookups(tree.search, root, keys, repeats)
+    iterative = time_lookups(tree.searchIter, root, keys, repeats)
+
+    print(f"Recursive search: {recursive:8.0f} ns/lookup")
+    print(f"Iterative search: {iterative:8.0f} ns/lookup")
+    print(f"Speed-up:         {recursive / iterative:8.2f}x")
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    run_benchmark(n)
@@ -0,0 +1,70 @@
+import sys
+import os
+import random
+import tempfile
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Models import Book, Member
+from src.Isbn import makeISBN
+from src.System import LibrarySystem
+
+N_MEMBERS = 20_000
+
+def build_library(n_books):
+    library = LibrarySystem()
+    library.bulkAddBooks(Book(makeISBN(i), f"Title {i}", f"Author {i % 500}", 2000, "Bench", 2)
+                         for i in range(n_books))
+    for i in range(N_MEMBERS):
+        library.addMember(Member(f"M{i}", f"Member {i}"))
+    return library
+
+def make_batch(rng, n_books, size, clustered=False):
+    """
+    Random (member, ISBN) requests. Clustered batches draw their ISBNs from a
+    narrow range, like a shelf of returns or a class set of one series.
+    """
+    if clustered:
+        first = rng.randrange(n_books - 3 * size)
+        return [(f"M{rng.randrange(N_MEMBERS)}", makeISBN(first + rng.randrange(3 * size))) for _ in range(size)]
+    return [(f"M{rng.randrange(N_MEMBERS)}", makeISBN(rng.randrange(n_books))) for _ in range(size)]
+
+def time_borrow_return(library, batches, batched):
+    start = time.perf_counter()
+    for batch in batches:
+        if batched:
+            library.borrowMany(batch)
+            library.returnMany(batch)
+        else:
+            for member_id, isbn in batch:
+                library.borrowBook(member_id, isbn)
+            for member_id, isbn in batch:
+                library.returnBooks(member_id, isbn)
+    return time.perf_counter() - start
+
+def run_benchmark(n_books=200_000, total=40_000):
+    library = build_library(n_books)
+    print(f"{n_books} books, {total} borrows + {total} returns")
+    with tempfile.TemporaryDirectory() as tmp:
+        for clustered in (False, True):
+            for size in (10, 100, 1000):
+                rng = random.Random(size)
+                batches = [make_batch(rng, n_books, size, clustered) for _ in range(total // size)]
+                loop = time_borrow_return(library, batches, batched=False)
+                batched = time_borrow_return(library, batches, batched=True)
+                print(f"{'clustered' if clustered else 'random':<9} batch {size:>5}: per-call loop {loop:6.2f} s   "
+                      f"batched {batched:6.2f} s   ({loop / batched:.2f}x)")
+
+        # With a write-ahead log the batch also shares one fsync
+        rng = random.Random(1)
+        batches = [make_batch(rng, n_books, 100) for _ in range(20)]
+        library.openLog(os.path.join(tmp, "library.wal"), sync_every=1)
+        loop = time_borrow_return(library, batches, batched=False)
+        batched = time_borrow_return(library, batches, batched=True)
+        library.closeLog()
+        print(f"random    batch   100, log (sync_every=1): per-call loop {loop:6.2f} s   batched {batched:6.2f} s   "
+              f"({loop / batched:.2f}x)")
+
+if __name__ == "__main__":
+    n_books = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    run_benchmark(n_books)
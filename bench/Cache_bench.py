@@ -0,0 +1,58 @@
+import sys
+import os
+import random
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Models import Book, Member
+from src.Isbn import makeISBN
+from src.System import LibrarySystem
+
+def build(n_books, cache_size, n_authors=2000):
+    library = LibrarySystem(cache_size=cache_size)
+    library.bulkAddBooks(Book(makeISBN(i), f"Title {i % (n_books // 3)}", f"Author {i % n_authors}", 2000,
+                              "Bench", 2) for i in range(n_books))
+    for i in range(100):
+        library.addMember(Member(f"M{i}", f"Member {i}"))
+    return library
+
+def skewed_queries(n, n_authors=2000, n_titles=1000, seed=7):
+    """
+    Author and title queries whose popularity falls off as 1/rank, like real search traffic.
+    """
+    rng = random.Random(seed)
+    authors = rng.choices(range(n_authors), weights=[1 / (r + 1) for r in range(n_authors)], k=n)
+    titles = rng.choices(range(n_titles), weights=[1 / (r + 1) for r in range(n_titles)], k=n)
+    return [("author", f"author {a}") if i % 2 else ("title", f"title {t}")
+            for i, (a, t) in enumerate(zip(authors, titles))]
+
+def run(library, queries, n_books, write_every):
+    rng = random.Random(1)
+    start = time.perf_counter()
+    for i, (kind, value) in enumerate(queries):
+        if kind == "author":
+            library.authorSearch(value)
+        else:
+            library.titleSearchAll(value)
+        if write_every and i % write_every == 0:
+            member, isbn = f"M{rng.randrange(100)}", makeISBN(rng.randrange(n_books))
+            if not library.borrowBook(member, isbn)[0]:
+                library.returnBooks(member, isbn)
+    return time.perf_counter() - start
+
+def run_benchmark(n_books=100_000, n_queries=100_000):
+    queries = skewed_queries(n_queries)
+    for write_every in (0, 10):
+        uncached = run(build(n_books, 0), queries, n_books, write_every)
+        library = build(n_books, 1024)
+        cached = run(library, queries, n_books, write_every)
+        stats = library.cacheStats()
+        label = f"1 write per {write_every} queries" if write_every else "read only"
+        print(f"{label:24s} uncached {uncached * 1e6 / n_queries:6.2f} us/query   "
+              f"cached {cached * 1e6 / n_queries:6.2f} us/query   ({uncached / cached:4.1f}x, "
+              f"hit rate {stats['hit_rate']:.0%}, {stats['evictions']} evictions, "
+              f"{stats['invalidations']} invalidations)")
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    run_benchmark(n)
@@ -0,0 +1,69 @@
+import sys
+import os
+import time
+from collections import Counter
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import src.ColumnStore as ColumnStore
+from src.Models import Book
+from src.Isbn import makeISBN
+from src.System import LibrarySystem
+
+def build(n):
+    library = LibrarySystem()
+    library.bulkAddBooks(Book(makeISBN(i), f"Title {i}", f"Author {i % (n // 20 + 1)}",
+                              str(1950 + i % 70), f"Category {i % 40}", i % 4)
+                         for i in range(n))
+    return library
+
+def scan_reports(library):
+    """
+    The statistics report computed by walking every tree node, as before the column store.
+    """
+    by_category, available, decades, copies = Counter(), Counter(), Counter(), 0
+    for book in library.iterAllSorted():
+        category = book.category.strip()
+        by_category[category] += 1
+        if book.available_copies > 0:
+            available[category] += 1
+        copies += book.available_copies
+        decades[int(book.year) // 10 * 10] += 1
+    return dict(by_category), dict(available), copies, dict(sorted(decades.items()))
+
+def column_reports(library):
+    return (library.categoryCounts(), library.categoryCounts(available_only=True),
+            library.totalAvailableCopies(), library.yearHistogram(10))
+
+def best_of(fn, library, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(library)
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+def run_benchmark(n=100_000):
+    library = build(n)
+    scan, expected = best_of(scan_reports, library)
+    print(f"{n} books: category counts, available counts, copies and decade histogram")
+    print(f"tree scan            {scan * 1e3:8.1f} ms")
+
+    numpy = ColumnStore.numpy
+    ColumnStore.numpy = None
+    try:
+        plain, result = best_of(column_reports, library)
+    finally:
+        ColumnStore.numpy = numpy
+    assert result == expected
+    print(f"columns (array)      {plain * 1e3:8.1f} ms   {scan / plain:5.1f}x")
+
+    if numpy is not None:
+        vectorised, result = best_of(column_reports, library)
+        assert result == expected
+        print(f"columns (numpy)      {vectorised * 1e3:8.1f} ms   {scan / vectorised:5.1f}x")
+    else:
+        print("columns (numpy)      numpy not installed")
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    run_benchmark(n)
@@ -0,0 +1,54 @@
+import sys
+import os
+import random
+import threading
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Models import Book, Member
+from src.Isbn import makeISBN
+from src.System import LibrarySystem
+
+N_BOOKS = 10_000
+N_MEMBERS = 2_000
+
+def build_library(**kwargs):
+    library = LibrarySystem(**kwargs)
+    library.bulkAddBooks(Book(makeISBN(i), f"Title {i}", f"Author {i % 100}", 2000, "Bench", 3)
+                         for i in range(N_BOOKS))
+    for i in range(N_MEMBERS):
+        library.addMember(Member(f"M{i}", f"Member {i}"))
+    return library
+
+def run_checkouts(library, threads, n):
+    """
+    Splits n borrow/return transactions over `threads` threads; returns tx/s.
+    """
+    def worker(seed):
+        rng = random.Random(seed)
+        for _ in range(n // threads // 2):
+            member_id = f"M{rng.randrange(N_MEMBERS)}"
+            isbn = makeISBN(rng.randrange(N_BOOKS))
+            library.borrowBook(member_id, isbn)
+            library.returnBooks(member_id, isbn)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return n / (time.perf_counter() - start)
+
+def run_benchmark(n=40_000):
+    print(f"{n} borrow/return transactions ({os.cpu_count()} CPUs)")
+    print(f"single-threaded, no locks   {run_checkouts(build_library(), 1, n):10.0f} tx/s")
+    for stripes in (1, 64):
+        library = build_library(concurrent=True, lock_stripes=stripes)
+        for threads in (1, 2, 4, 8):
+            rate = run_checkouts(library, threads, n)
+            print(f"{stripes:>2} stripe(s), {threads} thread(s)   {rate:10.0f} tx/s")
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 40_000
+    run_benchmark(n)
@@ -0,0 +1,58 @@
+import sys
+import os
+import random
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.FuzzyIndex import TrigramIndex, trigrams
+
+FIRST = ["robert", "martin", "mary", "john", "linda", "james", "susan", "david", "karen", "peter", "anna",
+         "thomas", "laura", "michael", "emma", "daniel", "sofia", "paul", "julia", "mark", "helen", "george",
+         "clara", "henry", "alice", "victor", "irene", "oscar", "nina", "hugo"]
+SYLLABLES = ["ber", "ton", "man", "sel", "kin", "dor", "vel", "ash", "mor", "lin", "gar", "wick", "ford", "sten",
+             "ral", "bro", "cas", "den", "fel", "gor", "hal", "jen", "kor", "lam", "nor", "pet", "quin", "ros",
+             "sam", "tor", "ul", "var", "wes", "yor", "zel", "ard", "ell", "ing", "ott", "ley"]
+
+def make_names(n, rng):
+    # Surnames have 2-4 syllables, so larger catalogs also have more distinct surnames
+    names = set()
+    while len(names) < n:
+        surname = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        names.add(f"{rng.choice(FIRST)} {surname}")
+    return list(names)
+
+def typo(name, rng):
+    i = rng.randrange(name.index(" ") + 1, len(name))
+    return name[:i] + rng.choice("aeiourst") + name[i + 1:]
+
+def any_shared(index, query):
+    """Names sharing at least one trigram with the query: the candidates of a plain scan."""
+    grams = trigrams(query)
+    names = set()
+    for (gram, _), posting in index.postings.items():
+        if gram in grams:
+            names |= posting
+    return len(names)
+
+def run_benchmark(n=300_000, queries=200):
+    rng = random.Random(7)
+    print(f"{'authors':>8} {'candidates':>11} {'% of authors':>13} {'any shared':>11} {'ms/query':>9}")
+    for size in (10_000, 100_000, n):
+        index = TrigramIndex()
+        index.addAll(make_names(size, rng))
+        names = list(index.grams)
+        batch = [typo(rng.choice(names), rng) for _ in range(queries)]
+
+        before = index.candidates
+        start = time.perf_counter()
+        for query in batch:
+            index.search(query)
+        elapsed = time.perf_counter() - start
+        candidates = (index.candidates - before) / queries
+        shared = sum(any_shared(index, query) for query in batch[:10]) / 10
+        print(f"{size:>8} {candidates:>11.0f} {100 * candidates / size:>12.2f}% {shared:>11.0f} "
+              f"{elapsed / queries * 1e3:>9.2f}")
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    run_benchmark(n)
@@ -0,0 +1,64 @@
+import sys
+import os
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Models import Book, Member
+from src.Isbn import makeISBN
+from src.System import LibrarySystem
+
+ISBN = makeISBN(1)
+
+def build(n_holds):
+    """
+    One book on loan to M0 with n_holds members queued for it.
+    """
+    library = LibrarySystem()
+    library.addBook(Book(ISBN, "Popular Title", "Some Author", 2000, "Bench", 1))
+    for i in range(n_holds + 1):
+        library.addMember(Member(f"M{i}", f"Member {i}"))
+    library.borrowBook("M0", ISBN, now=0)
+    for i in range(1, n_holds + 1):
+        library.placeHold(f"M{i}", ISBN, now=i)
+    return library
+
+def hand_offs(library, holders):
+    """
+    Passes the copy down the queue: each holder collects it and returns it.
+    """
+    # Well inside the hold period, so no hold lapses while measuring
+    now = 10 ** 6
+    start = time.perf_counter()
+    previous = "M0"
+    for i, holder in enumerate(holders, 1):
+        library.returnBooks(previous, ISBN, now=now + i)
+        library.borrowBook(holder, ISBN, now=now + i)
+        previous = holder
+    return (time.perf_counter() - start) / len(holders)
+
+def list_queue_hand_offs(n_holds, rounds):
+    """
+    The same dequeue done with a plain list as the queue (pop(0) shifts every waiting entry).
+    """
+    queue = [f"M{i}" for i in range(1, n_holds + 1)]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        queue.pop(0)
+    return (time.perf_counter() - start) / rounds
+
+def run_benchmark(n=200_000, rounds=1000):
+    for n_holds in (2 * rounds, 20 * rounds, n):
+        library = build(n_holds)
+        full = hand_offs(library, [f"M{i}" for i in range(1, rounds + 1)])
+        # Cancelled holds stay in the deque until a hand-off skips them
+        library = build(n_holds)
+        for i in range(1, n_holds + 1, 2):
+            library.cancelHold(f"M{i}", ISBN, now=n_holds + 1)
+        skipping = hand_offs(library, [f"M{i}" for i in range(2, 2 * rounds + 1, 2)])
+        as_list = list_queue_hand_offs(n_holds, rounds)
+        print(f"{n_holds:7d} holds   return+borrow hand-off {full * 1e6:6.1f} us   "
+              f"half cancelled {skipping * 1e6:6.1f} us   list.pop(0) alone {as_list * 1e6:7.2f} us")
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    run_benchmark(n)
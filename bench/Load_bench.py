@@ -0,0 +1,41 @@
+import sys
+import os
+import csv
+import random
+import tempfile
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.System import LibrarySystem
+from src.Isbn import makeISBN
+
+def write_catalog(path, n, seed=1):
+    """Writes a synthetic books CSV with n rows in random ISBN order."""
+    rng = random.Random(seed)
+    with open(path, mode='w', encoding='utf-8', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(["ISBN", "Title", "Author", "Year", "Category", "TotalCopies"])
+        for i in rng.sample(range(10**9), n):
+            writer.writerow([makeISBN(i), f"Title {i}", f"Author {i % 5000}",
+                             rng.randint(1950, 2024), "Bench", rng.randint(1, 5)])
+
+def time_load(method_name, path):
+    library = LibrarySystem()
+    start = time.perf_counter()
+    success, msg = getattr(library, method_name)(path)
+    elapsed = time.perf_counter() - start
+    assert success, msg
+    return elapsed
+
+def run_benchmark(n=100_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "books.csv")
+        write_catalog(path, n)
+        print(f"Loading {n} rows...")
+        for name in ("loadBooksCSV", "bulkLoadBooksCSV"):
+            elapsed = time_load(name, path)
+            print(f"{name:18s} {elapsed:7.2f} s  {n / elapsed:10.0f} rows/s")
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    run_benchmark(n)
@@ -0,0 +1,77 @@
+import sys
+import os
+import gc
+import tracemalloc
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import src.Models as Models
+import src.Avl as Avl
+import src.HashTable as HashTable
+import src.AuthorHashTable as AuthorHashTable
+import src.TitleTrie as TitleTrie
+import src.System as System
+from src.Isbn import makeISBN
+
+# Every (module, class name) binding of the per-record classes
+RECORD_CLASSES = [
+    (Models, "Book"), (Models, "Member"), (System, "Book"), (System, "Member"),
+    (Avl, "AVLNode"), (HashTable, "HashNode"),
+    (AuthorHashTable, "ISBNNode"), (AuthorHashTable, "AuthorEntry"),
+    (TitleTrie, "TrieNode"), (TitleTrie, "ISBNNode"),
+]
+
+def dict_layout():
+    """
+    Swaps every record class for an equivalent without __slots__ (instances
+    carry a __dict__), i.e. the layout before slots. Returns an undo function.
+    """
+    originals = [(module, name, getattr(module, name)) for module, name in RECORD_CLASSES]
+    plain = {}
+    for module, name, cls in originals:
+        if cls not in plain:
+            slots = set(getattr(cls, "__slots__", ())) | {"__slots__", "__dict__", "__weakref__"}
+            plain[cls] = type(name, (), {k: v for k, v in vars(cls).items() if k not in slots})
+        setattr(module, name, plain[cls])
+
+    def undo():
+        for module, name, cls in originals:
+            setattr(module, name, cls)
+    return undo
+
+def build(n):
+    library = System.LibrarySystem()
+    library.bulkAddBooks(Models.Book(makeISBN(i), f"Title {i}", f"Author {i % (n // 20 + 1)}",
+                                     str(1950 + i % 70), f"Category {i % 40}", 1 + i % 3)
+                         for i in range(n))
+    for i in range(n // 10):
+        library.addMember(Models.Member(f"2024-EE-{i:06d}", f"Member {i}"))
+    return library
+
+def measure(n):
+    """
+    Returns the bytes allocated by a library of n books (and n/10 members).
+    """
+    gc.collect()
+    tracemalloc.start()
+    library = build(n)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del library
+    return size
+
+def run_benchmark(n=100_000):
+    undo = dict_layout()
+    try:
+        before = measure(n)
+    finally:
+        undo()
+    after = measure(n)
+    print(f"{n} books, {n // 10} members")
+    print(f"__dict__ layout   {before / 1e6:8.1f} MB   {before / n:6.0f} bytes/book")
+    print(f"slotted layout    {after / 1e6:8.1f} MB   {after / n:6.0f} bytes/book   "
+          f"({100 * (before - after) / before:.0f}% less)")
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    run_benchmark(n)
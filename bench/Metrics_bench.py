@@ -0,0 +1,48 @@
+import sys
+import os
+import random
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Models import Book, Member
+from src.Isbn import makeISBN
+from src.System import LibrarySystem
+
+def build(n):
+    library = LibrarySystem()
+    library.bulkAddBooks(Book(makeISBN(i), f"Title {i}", f"Author {i % 500}", 2000, "Bench", 2)
+                         for i in range(n))
+    for i in range(1000):
+        library.addMember(Member(f"M{i}", f"Member {i}"))
+    return library
+
+def workload(library, isbns, members):
+    start = time.perf_counter()
+    for isbn in isbns:
+        library.isbnSearch(isbn)
+    for member, isbn in zip(members, isbns):
+        if library.borrowBook(member, isbn)[0]:
+            library.returnBooks(member, isbn)
+    return time.perf_counter() - start
+
+def run_benchmark(n=100_000, calls=20_000, rounds=7):
+    rng = random.Random(1)
+    library = build(n)
+    isbns = [makeISBN(rng.randrange(n)) for _ in range(calls)]
+    members = [f"M{rng.randrange(1000)}" for _ in range(calls)]
+    # Rounds alternate, so drift in machine speed hits both settings alike
+    off, on = [], []
+    for _ in range(rounds):
+        off.append(workload(library, isbns, members))
+        library.enableMetrics()
+        on.append(workload(library, isbns, members))
+        library.disableMetrics()
+    off, on = min(off), min(on)
+    per_op = calls * 2.5  # isbnSearch plus borrow and (mostly) return
+    print(f"{calls} lookups + borrow/return pairs on {n} books, best of {rounds}")
+    print(f"metrics off   {off * 1e6 / per_op:6.2f} us/op")
+    print(f"metrics on    {on * 1e6 / per_op:6.2f} us/op   ({100 * (on / off - 1):+.0f}%)")
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    run_benchmark(n)
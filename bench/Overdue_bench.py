@@ -0,0 +1,66 @@
+import sys
+import os
+import random
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Models import Book, Member
+from src.Isbn import makeISBN
+from src.System import LibrarySystem
+
+DAY = 24 * 60 * 60
+
+def build(n_members, loans_per_member=3, seed=1):
+    """
+    A library whose loans were checked out over the last 20 days, due 14 days later.
+    """
+    rng = random.Random(seed)
+    n_books = n_members * loans_per_member
+    library = LibrarySystem()
+    library.bulkAddBooks(Book(makeISBN(i), f"Title {i}", f"Author {i % 500}", 2000, "Bench", 1)
+                         for i in range(n_books))
+    for i in range(n_members):
+        library.addMember(Member(f"M{i}", f"Member {i}"))
+    books = list(range(n_books))
+    rng.shuffle(books)
+    for i in range(n_members):
+        for j in range(loans_per_member):
+            library.borrowBook(f"M{i}", makeISBN(books[i * loans_per_member + j]), now=-rng.uniform(0, 20 * DAY))
+    return library
+
+def scan_overdue(library, now):
+    """
+    The same query answered by visiting every member's loans.
+    """
+    overdue = [loan for _, member in library.member_db.items()
+               for loan in member.borrowedBooks.values() if loan.due <= now]
+    overdue.sort(key=lambda loan: loan.due)
+    return overdue
+
+def best_of(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+def run_benchmark(n_members=20_000):
+    library = build(n_members)
+    print(f"{n_members} members, {len(library.due_queue)} loans")
+    for days in (-5, 0, 5):
+        now = days * DAY
+        scan, expected = best_of(lambda: scan_overdue(library, now))
+        heap, result = best_of(lambda: library.overdueLoans(now))
+        assert result == expected
+        print(f"overdue {days:+d} days ({len(result):6d} loans)   member scan {scan * 1e3:7.2f} ms   "
+              f"due queue {heap * 1e3:7.2f} ms   ({scan / heap:6.1f}x)")
+
+    scan, expected = best_of(lambda: scan_overdue(library, 0)[:1])
+    heap, result = best_of(lambda: library.nextOverdue(0))
+    assert [result] == expected
+    print(f"next overdue loan      member scan {scan * 1e3:7.2f} ms   due queue {heap * 1e6:7.2f} us")
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    run_benchmark(n)
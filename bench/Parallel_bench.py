@@ -0,0 +1,32 @@
+import sys
+import os
+import tempfile
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.System import LibrarySystem
+from Load_bench import write_catalog
+
+def time_load(load, path, **kwargs):
+    library = LibrarySystem()
+    start = time.perf_counter()
+    success, msg = getattr(library, load)(path, **kwargs)
+    elapsed = time.perf_counter() - start
+    assert success, msg
+    return elapsed
+
+def run_benchmark(n=200_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "books.csv")
+        write_catalog(path, n)
+        print(f"Loading {n} rows ({os.cpu_count()} CPUs)...")
+
+        elapsed = time_load("bulkLoadBooksCSV", path)
+        print(f"serial bulk load       {elapsed:7.2f} s  {n / elapsed:10.0f} rows/s")
+        for workers in (1, 2, 4, 8):
+            elapsed = time_load("parallelLoadBooksCSV", path, workers=workers)
+            print(f"parallel, {workers} worker(s) {elapsed:7.2f} s  {n / elapsed:10.0f} rows/s")
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    run_benchmark(n)
@@ -0,0 +1,105 @@
+import sys
+import os
+import asyncio
+import json
+import multiprocessing
+import random
+import time
+from collections import deque
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Models import Book, Member
+from src.Isbn import makeISBN
+from src.System import LibrarySystem
+from src.Server import LibraryServer
+
+N_BOOKS = 50_000
+N_MEMBERS = 5_000
+
+def serve(ports):
+    """
+    Server process: a synthetic library behind a LibraryServer on a free port.
+    """
+    library = LibrarySystem()
+    library.bulkAddBooks(Book(makeISBN(i), f"Title {i}", f"Author {i % 2000}", 1990 + i % 30,
+                              f"Category {i % 20}", 3) for i in range(N_BOOKS))
+    for i in range(N_MEMBERS):
+        library.addMember(Member(f"M{i}", f"Member {i}"))
+    server = LibraryServer(library, port=0)
+
+    async def run():
+        await server.start()
+        ports.put(server.port)
+        await server.serveForever()
+    asyncio.run(run())
+
+def make_request(rng, request_id):
+    """
+    Mixed workload: mostly ISBN lookups, some searches and checkouts.
+    """
+    roll = rng.random()
+    isbn = makeISBN(rng.randrange(N_BOOKS))
+    if roll < 0.7:
+        op, args = "isbn", {"isbn": isbn}
+    elif roll < 0.8:
+        # Distinctive terms; a term shared by every synthetic book would scan all postings
+        op, args = "keyword", {"query": f"{rng.randrange(N_BOOKS)} {rng.randrange(N_BOOKS)}", "limit": 5}
+    elif roll < 0.9:
+        op, args = "prefix", {"prefix": f"title {rng.randrange(1000)}", "limit": 5}
+    else:
+        op = "borrow" if rng.random() < 0.5 else "return"
+        args = {"member_id": f"M{rng.randrange(N_MEMBERS)}", "isbn": isbn}
+    return (json.dumps({"id": request_id, "op": op, "args": args}) + "\n").encode()
+
+async def client(port, n, depth, seed, latencies):
+    """
+    Closed-loop client keeping `depth` requests in flight on one connection.
+    """
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    sent_at = deque()
+    sent = 0
+    for _ in range(min(depth, n)):
+        writer.write(make_request(rng, sent))
+        sent_at.append(time.perf_counter())
+        sent += 1
+    for _ in range(n):
+        await reader.readline()
+        latencies.append(time.perf_counter() - sent_at.popleft())
+        if sent < n:
+            writer.write(make_request(rng, sent))
+            sent_at.append(time.perf_counter())
+            sent += 1
+            await writer.drain()
+    writer.close()
+    await writer.wait_closed()
+
+def percentile(values, p):
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+async def load(port, connections, depth, n):
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, n // connections, depth, i, latencies) for i in range(connections)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    print(f"{connections:>3} conn x depth {depth:<3} {len(latencies) / elapsed:9.0f} req/s   "
+          f"p50 {percentile(latencies, 0.5) * 1000:6.2f} ms  p99 {percentile(latencies, 0.99) * 1000:6.2f} ms  "
+          f"p99.9 {percentile(latencies, 0.999) * 1000:6.2f} ms")
+
+def run_benchmark(n=20_000):
+    ports = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(ports,), daemon=True)
+    server.start()
+    port = ports.get(timeout=300)
+    print(f"{n} requests per run against {N_BOOKS} books ({os.cpu_count()} CPUs)")
+    try:
+        for connections, depth in ((1, 1), (1, 16), (8, 1), (8, 16), (32, 8)):
+            asyncio.run(load(port, connections, depth, n))
+    finally:
+        server.terminate()
+        server.join()
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    run_benchmark(n)
@@ -0,0 +1,36 @@
+import sys
+import os
+import tempfile
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.System import LibrarySystem
+from Load_bench import write_catalog
+
+def timed(action):
+    start = time.perf_counter()
+    success, msg = action()
+    elapsed = time.perf_counter() - start
+    assert success, msg
+    return elapsed
+
+def run_benchmark(n=200_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "books.csv")
+        snap_path = os.path.join(tmp, "library.snap")
+        write_catalog(csv_path, n)
+
+        library = LibrarySystem()
+        csv_time = timed(lambda: library.bulkLoadBooksCSV(csv_path))
+        save_time = timed(lambda: library.save_snapshot(snap_path))
+        load_time = timed(lambda: LibrarySystem().load_snapshot(snap_path))
+
+        print(f"{n} books, CSV {os.path.getsize(csv_path) / 1e6:.1f} MB, "
+              f"snapshot {os.path.getsize(snap_path) / 1e6:.1f} MB")
+        print(f"CSV bulk reload   {csv_time:7.2f} s")
+        print(f"Snapshot save     {save_time:7.2f} s")
+        print(f"Snapshot load     {load_time:7.2f} s  ({csv_time / load_time:.2f}x faster than CSV)")
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    run_benchmark(n)
@@ -0,0 +1,301 @@
+import sys
+import os
+import argparse
+import json
+import platform
+import random
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from src.System import LibrarySystem
+from src.Isbn import isbnKey
+from Workload import Workload, CATEGORIES
+
+# Results files carry this number; comparing against a baseline with another one is refused
+FORMAT = 1
+
+def peakRSS():
+    """
+    Returns the peak resident set size of this process in bytes, or None if unknown.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports KiB
+
+def percentile(ordered, q):
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    return ordered[min(len(ordered) - 1, max(0, -(-q * len(ordered) // 100) - 1))]
+
+def summarize(samples):
+    """
+    Turns per-call durations (ns) into throughput and latency percentiles (us).
+    """
+    ordered = sorted(samples)
+    total = sum(ordered)
+    return {
+        "calls": len(ordered),
+        "seconds": total / 1e9,
+        "ops_per_sec": len(ordered) / (total / 1e9) if total else None,
+        "p50_us": percentile(ordered, 50) / 1e3,
+        "p90_us": percentile(ordered, 90) / 1e3,
+        "p99_us": percentile(ordered, 99) / 1e3,
+        "max_us": ordered[-1] / 1e3,
+    }
+
+def timeCalls(fn, inputs):
+    """
+    Calls fn once per input and times each call.
+
+    Returns:
+        tuple: (summary dict, list of results).
+    """
+    clock = time.perf_counter_ns
+    samples = []
+    results = []
+    for value in inputs:
+        start = clock()
+        result = fn(value)
+        samples.append(clock() - start)
+        results.append(result)
+    return summarize(samples), results
+
+def calibrate(rounds=7):
+    """
+    Times a fixed pure-Python loop (dict, list and string work), best of rounds, in us.
+
+    Results taken on a faster or busier machine differ from a baseline in
+    every operation alike; dividing by the change in this figure removes
+    most of that before looking for regressions.
+    """
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter_ns()
+        table = {}
+        for i in range(20_000):
+            key = f"k{i % 997}"
+            table[key] = table.get(key, 0) + i
+        sorted(table.values())
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / 1e3
+
+def runSize(n_books, n_queries, seed, cache_size):
+    """
+    Builds one synthetic library and times every operation on it.
+
+    Runs in a fresh worker process per size, so the peak RSS it reports
+    belongs to this catalog alone.
+    """
+    base_rss = peakRSS()
+    calibration = calibrate()
+    workload = Workload(n_books, seed=seed)
+    rng = random.Random(seed)
+    # Whole-catalog reports are repeated fewer times on big catalogs
+    report_calls = max(3, min(100, 2_000_000 // n_books))
+    ops = {}
+
+    library = LibrarySystem(cache_size=cache_size)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "books.csv")
+        workload.writeCatalogCSV(path)
+        start = time.perf_counter()
+        success, msg = library.bulkLoadBooksCSV(path)
+        elapsed = time.perf_counter() - start
+    assert success, msg
+    ops["load"] = {"calls": 1, "seconds": elapsed, "ops_per_sec": n_books / elapsed}
+    ops["addMember"], _ = timeCalls(library.addMember, workload.members())
+
+    isbns = workload.isbnQueries(n_queries)
+    titles = workload.titleQueries(n_queries)
+    authors = workload.authorQueries(n_queries)
+    ops["isbnSearch"], _ = timeCalls(library.isbnSearch, isbns)
+    ops["titleSearch"], _ = timeCalls(library.titleSearch, titles)
+    ops["titleSearchAll"], _ = timeCalls(library.titleSearchAll, titles)
+    ops["titlePrefixSearch"], _ = timeCalls(lambda title: library.titlePrefixSearch(title[:11]), titles)
+    ops["authorSearch"], _ = timeCalls(library.authorSearch, authors)
+    ops["fuzzyAuthorSearch"], _ = timeCalls(lambda author: library.fuzzyAuthorSearch(author[:-1] + "x"),
+                                            authors[:max(10, n_queries // 10)])
+    ops["keywordSearch"], _ = timeCalls(lambda title: library.keywordSearch(f"{title.split()[1]} {rng.choice(CATEGORIES)}"),
+                                        titles)
+    ops["findBooks"], _ = timeCalls(lambda query: library.findBooks(**query), [
+        {"category": rng.choice(CATEGORIES), "year_from": year, "year_to": year + 4, "available_only": True}
+        for year in (rng.randint(1900, 2020) for _ in range(n_queries))])
+
+    pairs = workload.transactions(n_queries)
+    ops["borrowBook"], borrowed = timeCalls(lambda pair: library.borrowBook(*pair), pairs)
+    ops["borrowBook"]["succeeded"] = sum(ok for ok, _ in borrowed)
+
+    # Reports, while members have books out
+    members = workload.memberIds(n_queries, 2)
+    ops["listByAuthor"], _ = timeCalls(library.listByAuthor, authors)
+    ops["listByMember"], _ = timeCalls(library.listByMember, members)
+    ops["listSortedPage"], _ = timeCalls(lambda offset: library.listSortedPage(offset, 50),
+                                         [rng.randrange(n_books) for _ in range(n_queries)])
+    width = 10 ** 10 * 100 // n_books  # ~100 books per range
+    ops["rangeByISBN"], _ = timeCalls(lambda lo: library.rangeByISBN(lo, f"{isbnKey(lo) + width:013d}"), isbns)
+    whole = [None] * report_calls
+    ops["listAll"], _ = timeCalls(lambda _: library.listAll(), whole)
+    ops["listAllSorted"], _ = timeCalls(lambda _: library.listAllSorted(), whole)
+    ops["overdueLoans"], _ = timeCalls(lambda _: library.overdueLoans(time.time() + 15 * 24 * 60 * 60), whole)
+    ops["categoryCounts"], _ = timeCalls(lambda _: library.categoryCounts(), whole)
+    ops["yearHistogram"], _ = timeCalls(lambda _: library.yearHistogram(10), whole)
+
+    returns = [pair for pair, (ok, _) in zip(pairs, borrowed) if ok]
+    ops["returnBooks"], _ = timeCalls(lambda pair: library.returnBooks(*pair), returns or pairs[:1])
+
+    peak = peakRSS()
+    calibration = min(calibration, calibrate())
+    return {
+        "books": n_books,
+        "members": workload.n_members,
+        "queries": n_queries,
+        "base_rss_bytes": base_rss,
+        "peak_rss_bytes": peak,
+        "calibration_us": calibration,
+        "cache": library.cacheStats(),
+        "ops": ops,
+    }
+
+def bestOf(runs):
+    """
+    Merges repeated runs of one size, keeping each operation's fastest run
+    (lowest median, or lowest total for a load) and the lowest peak RSS.
+    """
+    best = dict(runs[0], ops={})
+    for name in runs[0]["ops"]:
+        key = "p50_us" if "p50_us" in runs[0]["ops"][name] else "seconds"
+        best["ops"][name] = min((run["ops"][name] for run in runs), key=lambda op: op[key])
+    peaks = [run["peak_rss_bytes"] for run in runs if run["peak_rss_bytes"]]
+    best["peak_rss_bytes"] = min(peaks) if peaks else None
+    best["calibration_us"] = min(run["calibration_us"] for run in runs)
+    best["repeats"] = len(runs)
+    return best
+
+def runSuite(sizes, n_queries, seed=1, cache_size=1024, repeat=3, progress=print):
+    results = {
+        "format": FORMAT,
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "cache_size": cache_size,
+            "repeat": repeat,
+        },
+        "runs": {},
+    }
+    for n_books in sizes:
+        progress(f"{n_books} books...")
+        runs = []
+        for _ in range(repeat):
+            # A new process per run, so peak memory is measured for that size alone
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                runs.append(pool.submit(runSize, n_books, n_queries, seed, cache_size).result())
+        results["runs"][str(n_books)] = bestOf(runs)
+    return results
+
+def printResults(results):
+    for size, run in results["runs"].items():
+        peak = run["peak_rss_bytes"]
+        print(f"\n{size} books, {run['members']} members   peak RSS "
+              f"{peak / 2 ** 20:.0f} MiB" if peak else f"\n{size} books, {run['members']} members")
+        print(f"  {'operation':18s} {'calls':>7s} {'ops/s':>11s} {'p50 us':>9s} {'p90 us':>9s} {'p99 us':>9s}")
+        for name, op in run["ops"].items():
+            if "p50_us" in op:
+                print(f"  {name:18s} {op['calls']:7d} {op['ops_per_sec']:11.0f} "
+                      f"{op['p50_us']:9.1f} {op['p90_us']:9.1f} {op['p99_us']:9.1f}")
+            else:
+                print(f"  {name:18s} {op['calls']:7d} {op['ops_per_sec']:11.0f} {op['seconds']:8.2f}s total")
+
+def compare(results, baseline, tolerance=0.25, normalize=True):
+    """
+    Compares median latency (total time for a load) and peak RSS with a baseline run.
+
+    Only sizes and operations present in both are compared. With normalize,
+    timings are first divided by the machine speed factor, the change in
+    calibration_us between the two runs.
+
+    Returns:
+        list[tuple]: (size, metric, baseline value, current value, ratio) for
+        every metric more than `tolerance` worse than the baseline.
+    """
+    if baseline.get("format") != results.get("format"):
+        raise ValueError(f"baseline has format {baseline.get('format')}, expected {results.get('format')}")
+    regressions = []
+    print(f"\nCompared with the baseline from {baseline['meta']['timestamp']} (tolerance {tolerance:.0%})")
+    for size, run in results["runs"].items():
+        old = baseline["runs"].get(size)
+        if old is None:
+            continue
+        speed = run["calibration_us"] / old["calibration_us"] if normalize else 1.0
+        print(f"  {size} books: machine speed factor {speed:.2f}" + ("" if normalize else " (not applied)"))
+        metrics = [(name, "p50_us" if "p50_us" in op else "seconds") for name, op in run["ops"].items()
+                   if name in old["ops"]]
+        rows = [(f"{name} {key}", old["ops"][name][key], run["ops"][name][key], speed) for name, key in metrics]
+        if run["peak_rss_bytes"] and old["peak_rss_bytes"]:
+            rows.append(("peak RSS bytes", old["peak_rss_bytes"], run["peak_rss_bytes"], 1.0))
+        for metric, before, now, factor in rows:
+            ratio = now / factor / before if before else 1.0
+            if ratio > 1 + tolerance:
+                status = "REGRESSION"
+                regressions.append((size, metric, before, now, ratio))
+            elif ratio < 1 / (1 + tolerance):
+                status = "faster" if metric != "peak RSS bytes" else "smaller"
+            else:
+                status = ""
+            print(f"  {size:>9s} {metric:30s} {before:14.1f} -> {now:14.1f}  {ratio:5.2f}x  {status}")
+    return regressions
+
+def parseSizes(text):
+    """
+    Parses "1e3,1e4,100000" into [1000, 10000, 100000].
+    """
+    return [int(float(size)) for size in text.split(",") if size.strip()]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Times every LibrarySystem operation on synthetic catalogs.")
+    parser.add_argument("--sizes", type=parseSizes, default=[1000, 10_000, 100_000],
+                        help="comma-separated catalog sizes, e.g. 1e3,1e5,1e7 (default 1e3,1e4,1e5)")
+    parser.add_argument("--queries", type=int, default=2000, help="calls per point operation (default 2000)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per size; each operation keeps its fastest run (default 3)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--cache-size", type=int, default=1024, help="query cache size (0 disables it)")
+    parser.add_argument("--output", default="bench_results.json", help="results file (JSON)")
+    parser.add_argument("--baseline", help="results file to compare with; exits with 1 on regressions")
+    parser.add_argument("--save-baseline", metavar="PATH", help="also write the results to PATH as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before a regression (0.25 = 25%%)")
+    parser.add_argument("--no-normalize", action="store_true",
+                        help="compare raw timings, without correcting for machine speed")
+    args = parser.parse_args(argv)
+
+    results = runSuite(args.sizes, args.queries, args.seed, args.cache_size, args.repeat)
+    printResults(results)
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline, args.tolerance, not args.no_normalize)
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.baseline}")
+            return 1
+        print("No regressions.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
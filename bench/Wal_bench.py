@@ -0,0 +1,49 @@
+import sys
+import os
+import tempfile
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Models import Book, Member
+from src.Isbn import makeISBN
+from src.System import LibrarySystem
+
+def build_library(n_books, n_members):
+    library = LibrarySystem()
+    library.bulkAddBooks(Book(makeISBN(i), f"Title {i}", f"Author {i % 100}", 2000, "Bench", 5)
+                         for i in range(n_books))
+    for i in range(n_members):
+        library.addMember(Member(f"M{i}", f"Member {i}"))
+    return library
+
+def run_transactions(library, n):
+    """
+    Runs n borrow/return transactions and returns transactions per second.
+    """
+    n_books = library.bookCount()
+    start = time.perf_counter()
+    for i in range(n // 2):
+        member_id = f"M{i % 1000}"
+        isbn = makeISBN((i * 7919) % n_books)
+        library.borrowBook(member_id, isbn)
+        library.returnBooks(member_id, isbn)
+    return n / (time.perf_counter() - start)
+
+def run_benchmark(n=20_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        library = build_library(10_000, 1000)
+        print(f"{n} borrow/return transactions")
+        print(f"no log              {run_transactions(library, n):10.0f} tx/s")
+
+        for sync_every in (1, 8, 64, 512):
+            library = build_library(10_000, 1000)
+            path = os.path.join(tmp, f"library-{sync_every}.wal")
+            library.openLog(path, sync_every=sync_every)
+            rate = run_transactions(library, n)
+            syncs = library.wal.syncs
+            library.closeLog()
+            print(f"sync_every={sync_every:<4}     {rate:10.0f} tx/s  ({syncs} fsyncs)")
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    run_benchmark(n)
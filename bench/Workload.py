@@ -0,0 +1,107 @@
+import sys
+import os
+import csv
+import random
+from array import array
+from itertools import accumulate
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Models import Member
+from src.Isbn import makeISBN
+
+CATEGORIES = ["Fiction", "Science", "History", "Programming", "Mathematics", "Poetry", "Biography",
+              "Philosophy", "Art", "Travel", "Children", "Reference", "Engineering", "Economics"]
+
+class Zipf:
+    """
+    Draws ranks 0..k-1 with probability proportional to 1 / (rank + 1) ** skew.
+
+    Real catalogs and query logs are skewed like this: a few authors, titles
+    and books account for a large share of the entries or requests. The cumulative
+    weights are kept in an array of doubles so even k = 10^7 stays small.
+    """
+    def __init__(self, k, skew=1.0, seed=1):
+        self.k = k
+        self.cumulative = array("d", accumulate(1 / (rank + 1) ** skew for rank in range(k)))
+        self.rng = random.Random(seed)
+
+    def sample(self, n):
+        return self.rng.choices(range(self.k), cum_weights=self.cumulative, k=n)
+
+
+class Workload:
+    """
+    Synthetic catalog, members and query/transaction streams for one catalog size.
+
+    Authors and titles are drawn from a mild Zipf distribution (catalog_skew),
+    so a few authors have hundreds of books and some titles many editions,
+    while most have one or two. Queries follow a steeper one (query_skew):
+    the popular authors, titles and books are looked up most. Everything is
+    derived from `seed`, so runs are repeatable.
+    """
+    def __init__(self, n_books, n_members=None, seed=1, catalog_skew=0.5, query_skew=1.0):
+        self.n_books = n_books
+        self.n_members = n_members or max(100, n_books // 10)
+        self.n_authors = max(10, n_books // 20)
+        self.n_titles = max(10, n_books // 2)
+        self.seed = seed
+        self.catalog_skew = catalog_skew
+        self.query_skew = query_skew
+
+    def isbn(self, i):
+        """
+        ISBN of the i-th book. i -> i * 3^18 mod 10^9 is a permutation (3 is
+        coprime to 10), so serials are distinct and scattered, not in ISBN order.
+        """
+        return makeISBN((i * 387_420_489 + self.seed) % 10 ** 9)
+
+    def author(self, rank):
+        return f"Author {rank:07d}"
+
+    def title(self, rank):
+        return f"Title {rank:07d} of the Collection"
+
+    def bookRows(self):
+        """
+        Yields (ISBN, Title, Author, Year, Category, TotalCopies) rows in a random ISBN order.
+        """
+        rng = random.Random(self.seed + 1)
+        chunk = 100_000
+        authors = Zipf(self.n_authors, self.catalog_skew, self.seed + 2)
+        titles = Zipf(self.n_titles, self.catalog_skew, self.seed + 3)
+        for start in range(0, self.n_books, chunk):
+            count = min(chunk, self.n_books - start)
+            for i, a, t in zip(range(start, start + count), authors.sample(count), titles.sample(count)):
+                yield (self.isbn(i), self.title(t), self.author(a), rng.randint(1900, 2024),
+                       CATEGORIES[i % len(CATEGORIES)], rng.randint(1, 4))
+
+    def writeCatalogCSV(self, path):
+        with open(path, mode='w', encoding='utf-8', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(["ISBN", "Title", "Author", "Year", "Category", "TotalCopies"])
+            writer.writerows(self.bookRows())
+
+    def members(self):
+        return [Member(f"2024-BM-{i:07d}", f"Member {i}") for i in range(self.n_members)]
+
+    def memberIds(self, n, seed_offset=0):
+        rng = random.Random(self.seed + 10 + seed_offset)
+        return [f"2024-BM-{rng.randrange(self.n_members):07d}" for _ in range(n)]
+
+    def authorQueries(self, n):
+        return [self.author(rank) for rank in Zipf(self.n_authors, self.query_skew, self.seed + 4).sample(n)]
+
+    def titleQueries(self, n):
+        return [self.title(rank) for rank in Zipf(self.n_titles, self.query_skew, self.seed + 5).sample(n)]
+
+    def isbnQueries(self, n):
+        """
+        Popular books first: book i is the i-th most requested.
+        """
+        return [self.isbn(i) for i in Zipf(self.n_books, self.query_skew, self.seed + 6).sample(n)]
+
+    def transactions(self, n):
+        """
+        Returns n (member_id, isbn) borrow requests with skewed book popularity.
+        """
+        return list(zip(self.memberIds(n, 1), self.isbnQueries(n)))
@@ -1,13 +1,20 @@
 import sys
 import os
+import time
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 from src.System import LibrarySystem
 from src.Models import Book, Member
+from src.Isbn import formatISBN
+from src.Metrics import toJSON, toPrometheus
 
 console = Console()
+SNAPSHOT_PATH = 'data/library.snap'
+LOG_PATH = 'data/library.wal'
+METRICS_JSON_PATH = 'data/metrics.json'
+METRICS_PROM_PATH = 'data/metrics.prom'
 
 def display_menu():
     """
@@ -20,15 +27,47 @@ def display_menu():
     menu_content = (
         "[bold green]1.[/bold green] Add New Book\n"
         "[bold green]2.[/bold green] Register Member\n"
-        "[bold green]3.[/bold green] Search Book (ISBN/Title/Author)\n"
+        "[bold green]3.[/bold green] Search Book (ISBN/Title/Author/Keyword)\n"
         "[bold green]4.[/bold green] Borrow Book\n"
         "[bold green]5.[/bold green] Return Book\n"
         "[bold green]6.[/bold green] List All Books (Sorted by ISBN)\n"
+        "[bold green]H.[/bold green] Place / Cancel Hold\n"
+        "[bold green]M.[/bold green] Metrics & Health\n"
         "[bold green]L.[/bold green] Load Bulk Data (CSV)\n"
+        "[bold green]S.[/bold green] Save Snapshot\n"
         "[bold red]0.[/bold red] Exit"
     )
     console.print(Panel(menu_content, title="[bold cyan]UET Library Management System[/bold cyan]", subtitle="EE234L Project"))
 
+def print_books(title_text, books, page_size=50):
+    """
+    Streams books into Rich tables of at most page_size rows.
+
+    Rows are pulled from the iterable lazily, so the first page appears
+    without waiting for the whole report, and the user can stop after any page.
+
+    Returns:
+        int: Number of books printed.
+    """
+    printed = 0
+    books = iter(books)
+    while True:
+        table = Table(title=title_text)
+        table.add_column("ISBN", style="cyan")
+        table.add_column("Title")
+        table.add_column("Author")
+        table.add_column("Available", justify="right")
+        for b in books:
+            table.add_row(formatISBN(b.isbn), b.title.title(), b.author.title(), str(b.available_copies))
+            if table.row_count >= page_size:
+                break
+        if table.row_count == 0:
+            return printed
+        console.print(table)
+        printed += table.row_count
+        if table.row_count < page_size or not Confirm.ask("Show more?", default=True):
+            return printed
+
 def main():
     """
     The main execution loop of the library management system.
@@ -37,34 +76,56 @@ def main():
     an infinite loop to process user commands via the CLI menu.
     """
     library = LibrarySystem()
-    if os.path.exists('data/books.csv'):
-        library.loadBooksCSV('data/books.csv')
+    loaded = False
+    if os.path.exists(SNAPSHOT_PATH):
+        loaded, msg = library.load_snapshot(SNAPSHOT_PATH)
+        if not loaded:
+            console.print(f"[bold red]{msg}[/bold red]")
+    if not loaded and os.path.exists('data/books.csv'):
+        library.bulkLoadBooksCSV('data/books.csv')
+    # Replays the changes made since the snapshot, then logs every new one
+    success, msg = library.openLog(LOG_PATH)
+    if not success:
+        console.print(f"[bold red]{msg}[/bold red]")
 
     while True:
         display_menu()
         choice = Prompt.ask("Select an option", default="0").upper()
         
         if choice == "1":
-            isbn = Prompt.ask("Enter 13-digit ISBN")
+            isbn = Prompt.ask("Enter ISBN (10 or 13 digits)")
             title = Prompt.ask("Enter Title")
             author = Prompt.ask("Enter Author")
             year = Prompt.ask("Enter Year")
             category = Prompt.ask("Enter Category")
             copies = Prompt.ask("Enter Copies", default="1")
             
-            new_book = Book(isbn, title, author, year, category, copies)
-            library.addBook(new_book)
+            try:
+                new_book = Book(isbn, title, author, year, category, copies)
+            except ValueError as e:
+                console.print(f"[bold red]Error:[/bold red] {e}")
+                continue
+            if library.isbnSearch(new_book.isbn):
+                console.print(f"[bold red]Error:[/bold red] ISBN {formatISBN(new_book.isbn)} is already in the catalog.")
+                continue
+            success, msg = library.addBook(new_book)
+            if not success:
+                console.print(f"[bold red]Error:[/bold red] {msg}")
+                continue
             console.print(f"[bold green]Success:[/bold green] '{title}' added to system.")
 
         elif choice == "2":
             m_id = Prompt.ask("Enter Member ID (e.g., 2024-EE-001)")
             name = Prompt.ask("Enter Member Name")
             newMember = Member(m_id, name)
-            library.addMember(newMember)
+            success, msg = library.addMember(newMember)
+            if not success:
+                console.print(f"[bold red]Error:[/bold red] {msg}")
+                continue
             console.print(f"[bold green]Success:[/bold green] Member '{name}' registered.")
 
         elif choice == "3":
-            search_type = Prompt.ask("Search by", choices=["ISBN", "Title", "Author"])
+            search_type = Prompt.ask("Search by", choices=["ISBN", "Title", "Author", "Keyword"])
             query = Prompt.ask(f"Enter {search_type}")
             
             results = []
@@ -72,10 +133,19 @@ def main():
                 res = library.isbnSearch(query)
                 if res: results.append(res)
             elif search_type == "Title":
-                res = library.titleSearch(query)
-                if res: results.append(res)
+                results = library.titleSearchAll(query)
+                if not results:
+                    results = library.titlePrefixSearch(query, limit=10)
+            elif search_type == "Keyword":
+                results = library.keywordSearch(query, limit=20)
             else:
                 results = library.authorSearch(query)
+                if not results:
+                    suggestions = library.fuzzyAuthorSearch(query)
+                    if suggestions:
+                        console.print(f"[yellow]No exact match. Did you mean: {', '.join(n.title() for n in suggestions)}?[/yellow]")
+                        results = library.authorSearch(suggestions[0])
+                        query = suggestions[0].title()
 
             if results:
                 table = Table(title=f"Search Results for '{query}'")
@@ -84,7 +154,7 @@ def main():
                 table.add_column("Author")
                 table.add_column("Available", justify="right")
                 for b in results:
-                    table.add_row(b.isbn, b.title.title(), b.author.title(), str(b.available_copies))
+                    table.add_row(formatISBN(b.isbn), b.title.title(), b.author.title(), str(b.available_copies))
                 console.print(table)
             else:
                 console.print("[bold red]No books found.[/bold red]")
@@ -93,6 +163,8 @@ def main():
             m_id = Prompt.ask("Enter Member ID")
             isbn = Prompt.ask("Enter Book ISBN")
             success, msg = library.borrowBook(m_id, isbn)
+            if not success and msg == "No copies available." and Confirm.ask("No copies available. Place a hold?", default=True):
+                success, msg = library.placeHold(m_id, isbn)
             color = "green" if success else "red"
             console.print(f"[bold {color}]{msg}[/bold {color}]")
 
@@ -109,44 +181,155 @@ def main():
             console.print("M. List by Member")
             console.print("V. List All Available")
             console.print("S. List All (Sorted by ISBN)")
+            console.print("P. Browse Catalog Page")
+            console.print("R. List ISBN Range")
+            console.print("Q. Query by Category / Year / Availability")
+            console.print("C. Catalog Statistics")
+            console.print("O. Overdue Loans")
             
-            sub_choice = Prompt.ask("Select Report", choices=["A", "M", "V", "S"]).upper()
+            sub_choice = Prompt.ask("Select Report", choices=["A", "M", "V", "S", "P", "R", "Q", "C", "O"]).upper()
             
             report_books = []
             title_text = ""
 
             if sub_choice == "A":
                 author = Prompt.ask("Enter Author Name")
-                report_books = library.listByAuthor(author)
+                report_books = library.iterByAuthor(author)
                 title_text = f"Books by {author.title()}"
             elif sub_choice == "M":
                 m_id = Prompt.ask("Enter Member ID")
-                report_books = library.listByMember(m_id)
+                report_books = library.iterByMember(m_id)
                 title_text = f"Books borrowed by {m_id}"
             elif sub_choice == "V":
-                report_books = library.listAll()
+                report_books = library.iterAll()
                 title_text = "Currently Available Books"
             elif sub_choice == "S":
-                report_books = library.listAllSorted()
+                report_books = library.iterAllSorted()
                 title_text = "Complete Catalog (Sorted by ISBN)"
-
-            if report_books:
-                table = Table(title=title_text)
-                table.add_column("ISBN", style="cyan")
+            elif sub_choice == "P":
+                total = library.bookCount()
+                try:
+                    size = int(Prompt.ask("Books per page", default="20"))
+                    if size < 1:
+                        raise ValueError
+                    page = int(Prompt.ask(f"Page number (1-{max(1, -(-total // size))})", default="1"))
+                    if page < 1:
+                        raise ValueError
+                except ValueError:
+                    console.print("[bold red]Error:[/bold red] Page size and number must be whole numbers of at least 1.")
+                    continue
+                report_books = library.listSortedPage((page - 1) * size, size)
+                title_text = f"Catalog Page {page} ({total} books)"
+            elif sub_choice == "R":
+                lo = Prompt.ask("From ISBN")
+                hi = Prompt.ask("To ISBN")
+                report_books = library.rangeByISBN(lo, hi)
+                title_text = f"Books with ISBN {lo} to {hi}"
+            elif sub_choice == "Q":
+                category = Prompt.ask("Category (blank for any)", default="")
+                year_from = Prompt.ask("From year (blank for any)", default="")
+                year_to = Prompt.ask("To year (blank for any)", default="")
+                try:
+                    year_from = int(year_from) if year_from.strip() else None
+                    year_to = int(year_to) if year_to.strip() else None
+                except ValueError:
+                    console.print("[bold red]Error:[/bold red] Years must be whole numbers, e.g. 2015.")
+                    continue
+                available_only = Confirm.ask("Only available books?", default=False)
+                report_books = library.findBooks(
+                    category=category or None,
+                    year_from=year_from,
+                    year_to=year_to,
+                    available_only=available_only
+                )
+                title_text = "Query Results"
+            elif sub_choice == "C":
+                available = library.categoryCounts(available_only=True)
+                console.print(f"\n[bold cyan]Catalog Statistics[/bold cyan] "
+                              f"({library.bookCount()} titles, {library.totalAvailableCopies()} copies on the shelves)")
+                for category, count in sorted(library.categoryCounts().items()):
+                    console.print(f"  {category}: {count} titles, {available.get(category, 0)} available")
+                for decade, count in library.yearHistogram(10).items():
+                    console.print(f"  {decade}s: {count}")
+                continue
+            elif sub_choice == "O":
+                overdue = library.overdueLoans()
+                if not overdue:
+                    console.print("[green]No overdue loans.[/green]")
+                    continue
+                table = Table(title=f"Overdue Loans ({len(overdue)})")
+                table.add_column("Member", style="cyan")
+                table.add_column("ISBN")
                 table.add_column("Title")
-                table.add_column("Author")
-                table.add_column("Available", justify="right")
-                for b in report_books:
-                    table.add_row(b.isbn, b.title.title(), b.author.title(), str(b.available_copies))
+                table.add_column("Due", justify="right")
+                for loan in overdue:
+                    book = library.isbnSearch(loan.isbn)
+                    table.add_row(loan.member_id, formatISBN(loan.isbn), book.title.title() if book else "?",
+                                  time.strftime("%Y-%m-%d", time.localtime(loan.due)))
                 console.print(table)
-            else:
+                continue
+
+            if not print_books(title_text, report_books):
                 console.print("[yellow]No records found for this report.[/yellow]")
 
+        elif choice == "H":
+            m_id = Prompt.ask("Enter Member ID")
+            isbn = Prompt.ask("Enter Book ISBN")
+            action = Prompt.ask("Place or cancel", choices=["Place", "Cancel"], default="Place")
+            if action == "Place":
+                success, msg = library.placeHold(m_id, isbn)
+            else:
+                success, msg = library.cancelHold(m_id, isbn)
+            color = "green" if success else "red"
+            console.print(f"[bold {color}]{msg}[/bold {color}]")
+            console.print(f"{library.holdQueueLength(isbn)} member(s) waiting; {m_id} has {library.holdCount(m_id)} hold(s).")
+
+        elif choice == "M":
+            if library.metrics is None and Confirm.ask("Operation timing is off. Turn it on?", default=True):
+                library.enableMetrics()
+            stats = library.stats()
+            if stats["operations"]:
+                table = Table(title="Operations")
+                table.add_column("Method", style="cyan")
+                for heading in ("Calls", "Failed", "Mean us", "p50 us", "p99 us"):
+                    table.add_column(heading, justify="right")
+                for name, op in stats["operations"].items():
+                    table.add_row(name, str(op["calls"]), str(op["failures"]), f"{op['mean_us']:.1f}",
+                                  f"{op['p50_us']:.1f}", f"{op['p99_us']:.1f}")
+                console.print(table)
+            table = Table(title="Hash Tables")
+            table.add_column("Table", style="cyan")
+            for heading in ("Keys", "Buckets", "Load", "Longest chain", "Chains (length: buckets)"):
+                table.add_column(heading, justify="right")
+            for name, t in stats["hash_tables"].items():
+                chains = ", ".join(f"{length}: {n}" for length, n in t["chains"].items())
+                table.add_row(name, str(t["count"]), str(t["size"]), f"{t['load_factor']:.2f}",
+                              str(t["max_chain"]), chains)
+            console.print(table)
+            for name, t in stats["avl_trees"].items():
+                console.print(f"AVL {name}: {t['nodes']} nodes, height {t['height']} (min {t['min_height']}), "
+                              f"{t['rotations_left']} left / {t['rotations_right']} right rotations")
+            cache = stats["cache"]
+            console.print(f"Query cache: {cache['size']}/{cache['capacity']} entries, {cache['hit_rate']:.0%} hits, "
+                          f"{cache['evictions']} evictions, {cache['invalidations']} invalidations")
+            export = Prompt.ask("Export", choices=["None", "JSON", "Prometheus"], default="None")
+            if export != "None":
+                path = METRICS_JSON_PATH if export == "JSON" else METRICS_PROM_PATH
+                with open(path, "w", encoding="utf-8") as file:
+                    file.write(toJSON(stats) if export == "JSON" else toPrometheus(stats))
+                console.print(f"[bold green]Metrics written to {path}[/bold green]")
+
         elif choice == "L":
             success, msg = library.loadBooksCSV('data/books.csv')
             console.print(f"[bold blue]{msg}[/bold blue]")
 
+        elif choice == "S":
+            success, msg = library.compactLog(SNAPSHOT_PATH)
+            color = "green" if success else "red"
+            console.print(f"[bold {color}]{msg}[/bold {color}]")
+
         elif choice == "0":
+            library.closeLog()
             console.print("[bold yellow]Exiting Library System. Goodbye![/bold yellow]")
             sys.exit()
 
@@ -2,6 +2,8 @@ class ISBNNode:
     """
     Linked list node to store an ISBN.
     """
+    __slots__ = ("isbn", "next")
+
     def __init__(self, isbn):
         self.isbn = isbn
         self.next = None
@@ -11,70 +13,254 @@ class AuthorEntry:
     Represents an author entry in the hash table.
     Contains a pointer to a linked list of ISBNs associated with this author.
     """
+    __slots__ = ("authorName", "isbn_list_head", "count", "next")
+
     def __init__(self, authorName, isbn):
         self.authorName = authorName
         self.isbn_list_head = ISBNNode(isbn)
+        self.count = 1  # length of the ISBN list
         self.next = None
 
 class AuthorHT:
     """
     Specialized Hash Table to map Authors to multiple ISBNs.
-    
+
     This helps in retrieving all books written by a specific author efficiently.
     It uses chaining for collisions and a secondary linked list for ISBNs under the same author.
+
+    Like HashTable, it counts its author entries and resizes incrementally once
+    the load factor leaves the [min_load, max_load] band.
     """
-    def __init__(self, size=50):
+    def __init__(self, size=50, max_load=0.75, min_load=0.1, rehash_step=4):
         self.size = size
         self.table = [None] * self.size
+        self.count = 0
+        self.initial_size = size
+        self.max_load = max_load
+        self.min_load = min_load
+        self.rehash_step = rehash_step
+
+        self.old_table = None
+        self.old_size = 0
+        self.rehash_index = 0
+
+    def __len__(self):
+        return self.count
 
     def _hash(self, name):
         return hash(name.strip().lower()) % self.size
 
+    def _startResize(self, new_size):
+        self.old_table = self.table
+        self.old_size = self.size
+        self.rehash_index = 0
+        self.size = new_size
+        self.table = [None] * self.size
+
+    def _rehashStep(self, buckets=None):
+        """
+        Moves up to `buckets` author chains from the old array into the new one.
+        """
+        if self.old_table is None:
+            return
+        steps = buckets if buckets is not None else self.rehash_step
+        while steps > 0 and self.rehash_index < self.old_size:
+            current = self.old_table[self.rehash_index]
+            self.old_table[self.rehash_index] = None
+            while current:
+                nxt = current.next
+                index = hash(current.authorName) % self.size
+                current.next = self.table[index]
+                self.table[index] = current
+                current = nxt
+            self.rehash_index += 1
+            steps -= 1
+        if self.rehash_index >= self.old_size:
+            self.old_table = None
+            self.old_size = 0
+            self.rehash_index = 0
+
+    def _checkLoad(self):
+        if self.old_table is not None:
+            return
+        load = self.count / self.size
+        if load > self.max_load:
+            self._startResize(self.size * 2)
+        elif load < self.min_load and self.size > self.initial_size:
+            self._startResize(max(self.initial_size, self.size // 2))
+
+    def resize(self, new_size):
+        """
+        Rehashes every author entry into new_size buckets immediately.
+        """
+        self._rehashStep(self.old_size)
+        self._startResize(max(1, new_size))
+        self._rehashStep(self.old_size)
+
+    def reserve(self, n):
+        """
+        Grows the table up-front so that n authors fit under max_load.
+        """
+        needed = int(n / self.max_load) + 1
+        if needed > self.size:
+            self.resize(needed)
+
+    def _findEntry(self, author_norm):
+        """
+        Returns the AuthorEntry for a normalised name, looking in both arrays while rehashing.
+        """
+        current = self.table[hash(author_norm) % self.size]
+        while current:
+            if current.authorName == author_norm:
+                return current
+            current = current.next
+        if self.old_table is not None:
+            current = self.old_table[hash(author_norm) % self.old_size]
+            while current:
+                if current.authorName == author_norm:
+                    return current
+                current = current.next
+        return None
+
     def insert(self, author, isbn):
         """
         Inserts an Author-ISBN mapping.
-        
+
         If the author exists, appends the ISBN to their list.
         If not, creates a new AuthorEntry.
         """
-        index = self._hash(author)
+        self._rehashStep()
         author_norm = author.strip().lower()
-        
-        if not self.table[index]:
-            self.table[index] = AuthorEntry(author_norm, isbn)
-        else:
-            current = self.table[index]
-            while current:
-                if current.authorName == author_norm:
-                    new_node = ISBNNode(isbn)
-                    new_node.next = current.isbn_list_head
-                    current.isbn_list_head = new_node
-                    return
-                if not current.next: break
-                current = current.next
-            current.next = AuthorEntry(author_norm, isbn)
+
+        entry = self._findEntry(author_norm)
+        if entry:
+            new_node = ISBNNode(isbn)
+            new_node.next = entry.isbn_list_head
+            entry.isbn_list_head = new_node
+            entry.count += 1
+            return
+
+        index = self._hash(author)
+        new_entry = AuthorEntry(author_norm, isbn)
+        new_entry.next = self.table[index]
+        self.table[index] = new_entry
+        self.count += 1
+        self._checkLoad()
 
     def search(self, author):
         """
         Retrieves all ISBNs associated with an author.
-        
+
         Args:
             author (str): Name of the author.
-            
+
         Returns:
             list[str]: A list of ISBNs.
         """
-        index = self._hash(author)
-        current = self.table[index]
+        entry = self._findEntry(author.strip().lower())
+        isbns = []
+        if entry:
+            temp = entry.isbn_list_head
+            while temp:
+                isbns.append(temp.isbn)
+                temp = temp.next
+        return isbns
+
+    def countFor(self, author):
+        """
+        Returns how many ISBNs are stored for an author, in O(1) average.
+        """
+        entry = self._findEntry(author.strip().lower())
+        return entry.count if entry else 0
+
+    def delete(self, author):
+        """
+        Removes an author and all of their ISBNs.
+
+        Returns:
+            bool: True if the author was removed, False if not found.
+        """
+        self._rehashStep()
         author_norm = author.strip().lower()
-        
-        while current:
-            if current.authorName == author_norm:
-                isbns = []
-                temp = current.isbn_list_head
-                while temp:
-                    isbns.append(temp.isbn)
-                    temp = temp.next
-                return isbns
-            current = current.next
-        return []
\ No newline at end of file
+
+        tables = [(self.table, hash(author_norm) % self.size)]
+        if self.old_table is not None:
+            tables.append((self.old_table, hash(author_norm) % self.old_size))
+
+        for table, index in tables:
+            current = table[index]
+            prev = None
+            while current:
+                if current.authorName == author_norm:
+                    if prev:
+                        prev.next = current.next
+                    else:
+                        table[index] = current.next
+                    self.count -= 1
+                    self._checkLoad()
+                    return True
+                prev = current
+                current = current.next
+        return False
+
+    def authors(self):
+        """
+        Yields every AuthorEntry stored in the table.
+        """
+        for table in (self.old_table, self.table):
+            if table is None:
+                continue
+            for bucket in table:
+                current = bucket
+                while current:
+                    yield current
+                    current = current.next
+
+    def chainLengths(self):
+        """
+        Returns the length of every non-empty author chain.
+        """
+        lengths = []
+        for table in (self.old_table, self.table):
+            if table is None:
+                continue
+            for bucket in table:
+                length = 0
+                current = bucket
+                while current:
+                    length += 1
+                    current = current.next
+                if length:
+                    lengths.append(length)
+        return lengths
+
+    def stats(self):
+        """
+        Reports the current shape of the table.
+
+        Returns:
+            dict: size, count, load_factor, max_chain, whether a rehash is in
+            progress, and chains: the number of buckets holding each chain
+            length (0 = empty), e.g. {0: 20, 1: 25, 2: 5}.
+        """
+        lengths = self.chainLengths()
+        chains = {0: self.size + self.old_size - len(lengths)}
+        for length in sorted(lengths):
+            chains[length] = chains.get(length, 0) + 1
+        return {
+            "size": self.size,
+            "count": self.count,
+            "load_factor": self.count / self.size,
+            "max_chain": max(lengths) if lengths else 0,
+            "rehashing": self.old_table is not None,
+            "chains": chains,
+        }
+
+class CategoryHT(AuthorHT):
+    """
+    Hash Table mapping Categories to multiple ISBNs.
+
+    Categories need exactly the author table's behaviour (case-insensitive
+    keys, ISBN lists with O(1) counts, incremental resizing); an entry's
+    `authorName` holds the normalised category.
+    """
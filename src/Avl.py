@@ -2,12 +2,15 @@ class AVLNode:
     """
     Node class for the AVL Tree.
     """
+    __slots__ = ("isbn", "book", "left", "right", "height", "size")
+
     def __init__(self, isbn, book):
-        self.isbn = str(isbn)
+        self.isbn = isbn
         self.book = book
         self.left = None
         self.right = None
         self.height = 1
+        self.size = 1  # number of nodes in this subtree, for rank/select
 
 class AVLTree:
     """
@@ -17,10 +20,19 @@ class AVLTree:
     and right subtrees is at most 1. It provides O(log n) time complexity for
     search, insertion, and deletion operations.
     """
+    def __init__(self):
+        # Rebalancing work done so far; a double rotation counts as one of each
+        self.rotations_left = 0
+        self.rotations_right = 0
+
     def height(self, node):
         """Returns the height of a node (0 if None)."""
         return node.height if node else 0
 
+    def size(self, node):
+        """Returns the number of nodes in the subtree (0 if None)."""
+        return node.size if node else 0
+
     def balance(self, node):
         """Calculates the balance factor of a node (left height - right height)."""
         return self.height(node.left) - self.height(node.right) if node else 0
@@ -35,12 +47,15 @@ class AVLTree:
         Returns:
             AVLNode: The new root of the subtree.
         """
+        self.rotations_right += 1
         x = y.left
         T2 = x.right
         x.right = y
         y.left = T2
         y.height = 1 + max(self.height(y.left), self.height(y.right))
         x.height = 1 + max(self.height(x.left), self.height(x.right))
+        y.size = 1 + self.size(y.left) + self.size(y.right)
+        x.size = 1 + self.size(x.left) + self.size(x.right)
         return x
 
     def rotateLeft(self, x):
@@ -53,12 +68,15 @@ class AVLTree:
         Returns:
             AVLNode: The new root of the subtree.
         """
+        self.rotations_left += 1
         y = x.right
         T2 = y.left
         y.left = x
         x.right = T2
         x.height = 1 + max(self.height(x.left), self.height(x.right))
         y.height = 1 + max(self.height(y.left), self.height(y.right))
+        x.size = 1 + self.size(x.left) + self.size(x.right)
+        y.size = 1 + self.size(y.left) + self.size(y.right)
         return y
 
     def minValue(self, node):
@@ -73,7 +91,7 @@ class AVLTree:
         
         Args:
             root (AVLNode): The current root of the subtree.
-            isbn (str): ISBN of the book used as key.
+            isbn (int): ISBN key of the book.
             book (Book): The book object.
             
         Returns:
@@ -90,6 +108,7 @@ class AVLTree:
             return root
 
         root.height = 1 + max(self.height(root.left), self.height(root.right))
+        root.size = 1 + self.size(root.left) + self.size(root.right)
         return self.rebalance(root, isbn)
 
     def delete(self, root, isbn):
@@ -118,6 +137,7 @@ class AVLTree:
 
             # Update height and check balance (similar logic to insert)
             root.height = 1 + max(self.height(root.left), self.height(root.right))
+            root.size = 1 + self.size(root.left) + self.size(root.right)
             balance = self.balance(root)
 
             # Balancing logic after deletion (checking if child is left or right heavy)
@@ -161,7 +181,7 @@ class AVLTree:
         
         Args:
             root (AVLNode): The current root to search from.
-            isbn (str): The ISBN to find.
+            isbn (int): The ISBN key to find.
             
         Returns:
             AVLNode: The node containing the book, or None if not found.
@@ -185,52 +205,443 @@ class AVLTree:
             result_list.append(root.book)
             self.inorder(root.right, result_list)
 
+    def buildSorted(self, items):
+        """
+        Builds a perfectly balanced tree from items already sorted by ISBN.
+
+        Each item becomes exactly one node and no rotations are needed, so the
+        build is O(n) instead of the O(n log n) of repeated insert() calls.
+
+        Args:
+            items (list[tuple]): (isbn, book) pairs in strictly increasing ISBN order.
+
+        Returns:
+            AVLNode: The root of the new tree (None for an empty list).
+        """
+        def build(lo, hi):
+            if lo > hi:
+                return None
+            mid = (lo + hi) // 2
+            node = AVLNode(items[mid][0], items[mid][1])
+            node.left = build(lo, mid - 1)
+            node.right = build(mid + 1, hi)
+            node.height = 1 + max(self.height(node.left), self.height(node.right))
+            node.size = hi - lo + 1
+            return node
+
+        return build(0, len(items) - 1)
+
+    # ------------------------------------------------------------------
+    # Iterative engine
+    #
+    # Same semantics as insert/delete/search/inorder above, but driven by
+    # loops and an explicit path stack instead of one Python frame per level.
+    # ------------------------------------------------------------------
+
+    def fix(self, node):
+        """
+        Updates the height of node and rotates it back into balance if needed.
+
+        Unlike rebalance(), this decides the rotation from the children's
+        balance factors, so it works after both insertion and deletion.
+
+        Returns:
+            AVLNode: The new root of the subtree.
+        """
+        node.height = 1 + max(self.height(node.left), self.height(node.right))
+        node.size = 1 + self.size(node.left) + self.size(node.right)
+        balance = self.balance(node)
+        if balance > 1:
+            if self.balance(node.left) < 0:
+                node.left = self.rotateLeft(node.left)
+            return self.rotateRight(node)
+        if balance < -1:
+            if self.balance(node.right) > 0:
+                node.right = self.rotateRight(node.right)
+            return self.rotateLeft(node)
+        return node
+
+    def rebalancePath(self, path):
+        """
+        Walks a root-to-leaf path bottom-up, fixing heights and rotating.
+
+        Once a subtree keeps its height without rotating, no ancestor needs
+        rebalancing, so only the subtree sizes of the remaining nodes are updated.
+
+        Args:
+            path (list[AVLNode]): Nodes from the root down to the modified point.
+
+        Returns:
+            AVLNode: The (possibly new) root of the whole tree.
+        """
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+            subtree = self.fix(node)
+            if i == 0:
+                return subtree
+            parent = path[i - 1]
+            if subtree is not node:
+                if parent.left is node:
+                    parent.left = subtree
+                else:
+                    parent.right = subtree
+            elif node.height == old_height:
+                for ancestor in reversed(path[:i]):
+                    ancestor.size = 1 + self.size(ancestor.left) + self.size(ancestor.right)
+                return path[0]
+        return None
+
+    def insertIter(self, root, isbn, book):
+        """
+        Iterative version of insert().
+
+        Args:
+            root (AVLNode): The root of the tree.
+            isbn (int): ISBN key of the book.
+            book (Book): The book object.
+
+        Returns:
+            AVLNode: The new root of the tree.
+        """
+        if not root:
+            return AVLNode(isbn, book)
+
+        path = []
+        node = root
+        while node:
+            path.append(node)
+            if isbn < node.isbn:
+                node = node.left
+            elif isbn > node.isbn:
+                node = node.right
+            else:
+                return root
+
+        parent = path[-1]
+        if isbn < parent.isbn:
+            parent.left = AVLNode(isbn, book)
+        else:
+            parent.right = AVLNode(isbn, book)
+        return self.rebalancePath(path)
+
+    def deleteIter(self, root, isbn):
+        """
+        Iterative version of delete().
+
+        Args:
+            root (AVLNode): The root of the tree.
+            isbn (int): ISBN key of the book to remove.
+
+        Returns:
+            AVLNode: The new root of the tree.
+        """
+        path = []
+        node = root
+        while node and node.isbn != isbn:
+            path.append(node)
+            node = node.left if isbn < node.isbn else node.right
+        if not node:
+            return root
+
+        if node.left and node.right:
+            # Two children: pull the in-order successor up into this node
+            path.append(node)
+            successor = node.right
+            while successor.left:
+                path.append(successor)
+                successor = successor.left
+            node.isbn = successor.isbn
+            node.book = successor.book
+            target = successor
+            replacement = successor.right
+        else:
+            target = node
+            replacement = node.left if node.left else node.right
+
+        if not path:
+            return replacement
+        parent = path[-1]
+        if parent.left is target:
+            parent.left = replacement
+        else:
+            parent.right = replacement
+        return self.rebalancePath(path)
+
+    def searchIter(self, root, isbn):
+        """
+        Iterative version of search(). Returns the node if found, else None.
+        """
+        node = root
+        while node:
+            key = node.isbn
+            if isbn == key:
+                return node
+            node = node.left if isbn < key else node.right
+        return None
+
+    def searchMany(self, root, keys):
+        """
+        Looks up a sorted list of ISBNs in one ordered walk (finger search).
+
+        Instead of starting every lookup at the root, the walk keeps the nodes
+        where it last turned left. A larger key only climbs back past those
+        it has overtaken: if the highest one overtaken is X, the key lies in
+        X's right subtree (or is X), otherwise it lies below where the previous
+        lookup stopped. Nearby keys therefore share most of their path.
+
+        Args:
+            root (AVLNode): Root of the tree.
+            keys (list[int]): ISBN keys in ascending order (repeats allowed).
+
+        Returns:
+            list[AVLNode]: The node for each key, or None where it is missing.
+        """
+        results = []
+        lefts = []  # nodes where the walk went left, deepest last
+        resume = root
+        for key in keys:
+            node = resume
+            while lefts and key >= lefts[-1].isbn:
+                node = lefts.pop()
+            while node is not None:
+                current = node.isbn
+                if key == current:
+                    break
+                if key < current:
+                    lefts.append(node)
+                    node = node.left
+                else:
+                    node = node.right
+            results.append(node)
+            resume = node
+        return results
+
+    def inorderIter(self, root, result_list):
+        """
+        Iterative in-order traversal that appends books to result_list.
+        """
+        stack = []
+        node = root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            result_list.append(node.book)
+            node = node.right
+
+    # ------------------------------------------------------------------
+    # Order statistics (every node knows the size of its subtree)
+    # ------------------------------------------------------------------
+
+    def rank(self, root, isbn):
+        """
+        Counts the keys strictly smaller than isbn in O(log n).
+        """
+        count = 0
+        node = root
+        while node:
+            if isbn <= node.isbn:
+                node = node.left
+            else:
+                count += self.size(node.left) + 1
+                node = node.right
+        return count
+
+    def select(self, root, k):
+        """
+        Returns the node holding the k-th smallest key (0-based), or None.
+        """
+        node = root
+        while node:
+            left_size = self.size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node
+            else:
+                k -= left_size + 1
+                node = node.right
+        return None
+
+    def stackAtRank(self, root, k):
+        """
+        Builds the traversal stack whose next in-order node has rank k.
+
+        Feeding the stack to walk() yields nodes from rank k onwards.
+        """
+        stack = []
+        node = root
+        while node:
+            left_size = self.size(node.left)
+            if k < left_size:
+                stack.append(node)
+                node = node.left
+            elif k == left_size:
+                stack.append(node)
+                break
+            else:
+                k -= left_size + 1
+                node = node.right
+        return stack
+
+    def stackAtKey(self, root, isbn):
+        """
+        Builds the traversal stack whose next in-order node is the first key >= isbn.
+        """
+        stack = []
+        node = root
+        while node:
+            if isbn <= node.isbn:
+                stack.append(node)
+                node = node.left
+            else:
+                node = node.right
+        return stack
+
+    def walk(self, stack):
+        """
+        Yields nodes in key order, continuing from a stack built by stackAtRank/stackAtKey.
+        """
+        while stack:
+            node = stack.pop()
+            yield node
+            child = node.right
+            while child:
+                stack.append(child)
+                child = child.left
+
+    def iterate(self, root, start=None):
+        """
+        Lazily yields books in ISBN order without recursion.
+
+        Only the current root-to-node path is held in memory. The tree must
+        not be modified while the generator is in use.
+
+        Args:
+            root (AVLNode): Root of the tree.
+            start (int): Optional ISBN key to resume from (first key >= start).
+
+        Yields:
+            Book: The next book in ISBN order.
+        """
+        stack = self.stackAtRank(root, 0) if start is None else self.stackAtKey(root, start)
+        for node in self.walk(stack):
+            yield node.book
+
+    def page(self, root, offset, limit):
+        """
+        Returns up to `limit` books starting at sorted position `offset`, in O(log n + limit).
+        """
+        books = []
+        if limit <= 0:
+            return books
+        for node in self.walk(self.stackAtRank(root, offset)):
+            books.append(node.book)
+            if len(books) >= limit:
+                break
+        return books
+
+    def rangeSearch(self, root, lo, hi):
+        """
+        Returns the books with lo <= ISBN <= hi in key order, in O(log n + k).
+        """
+        books = []
+        for node in self.walk(self.stackAtKey(root, lo)):
+            if node.isbn > hi:
+                break
+            books.append(node.book)
+        return books
+
+    def stats(self, root):
+        """
+        Reports the shape of the tree rooted at root and the rotations done so far.
+
+        Returns:
+            dict: nodes, height, min_height (of a perfectly balanced tree with
+            as many nodes), rotations_left and rotations_right.
+        """
+        nodes = self.size(root)
+        return {
+            "nodes": nodes,
+            "height": self.height(root),
+            "min_height": nodes.bit_length(),
+            "rotations_left": self.rotations_left,
+            "rotations_right": self.rotations_right,
+        }
+
+
+def _layout(node, left, right):
+    """
+    Combines the already laid-out children of node into node's own block.
+
+    Args:
+        node (AVLNode): The node being drawn.
+        left, right (tuple | None): display_aux() results for the children.
+
+    Returns:
+        tuple: list of strings, width, height, and horizontal coordinate of the root.
+    """
+    s = f'< {node.isbn} , {node.book.title} >'
+    u = len(s)
 
-def display_aux(node):
-    """Returns list of strings, width, height, and horizontal coordinate of the root."""
     # No child.
-    if node.right is None and node.left is None:
-        line = f'< {node.isbn} , {node.book.title} >'
-        width = len(line)
-        height = 1
-        middle = width // 2
-        return [line], width, height, middle
+    if left is None and right is None:
+        return [s], u, 1, u // 2
 
     # Only left child.
-    if node.right is None:
-        lines, n, p, x = display_aux(node.left)
-        s = f'< {node.isbn} , {node.book.title} >'
-        u = len(s)
+    if right is None:
+        lines, n, p, x = left
         first_line = (x + 1) * ' ' + (n - x - 1) * '_' + s
         second_line = x * ' ' + '/' + (n - x - 1 + u) * ' '
         shifted_lines = [line + u * ' ' for line in lines]
         return [first_line, second_line] + shifted_lines, n + u, p + 2, n + u // 2
 
     # Only right child.
-    if node.left is None:
-        lines, n, p, x = display_aux(node.right)
-        s = f'< {node.isbn} , {node.book.title} >'
-        u = len(s)
+    if left is None:
+        lines, n, p, x = right
         first_line = s + x * '_' + (n - x) * ' '
         second_line = (u + x) * ' ' + '\\' + (n - x - 1) * ' '
         shifted_lines = [u * ' ' + line for line in lines]
         return [first_line, second_line] + shifted_lines, n + u, p + 2, u // 2
 
     # Two children.
-    left, n, p, x = display_aux(node.left)
-    right, m, q, y = display_aux(node.right)
-    s = f'< {node.isbn} , {node.book.title} >'
-    u = len(s)
+    left_lines, n, p, x = left
+    right_lines, m, q, y = right
     first_line = (x + 1) * ' ' + (n - x - 1) * '_' + s + y * '_' + (m - y) * ' '
     second_line = x * ' ' + '/' + (n - x - 1 + u + y) * ' ' + '\\' + (m - y - 1) * ' '
     if p < q:
-        left += [n * ' '] * (q - p)
+        left_lines = left_lines + [n * ' '] * (q - p)
     elif q < p:
-        right += [m * ' '] * (p - q)
-    zipped_lines = zip(left, right)
+        right_lines = right_lines + [m * ' '] * (p - q)
+    zipped_lines = zip(left_lines, right_lines)
     lines = [first_line, second_line] + [a + u * ' ' + b for a, b in zipped_lines]
     return lines, n + m + u, max(p, q) + 2, n + u // 2
 
+def display_aux(node):
+    """
+    Returns list of strings, width, height, and horizontal coordinate of the root.
+
+    Works bottom-up with an explicit post-order stack, so deep trees do not
+    hit the interpreter recursion limit.
+    """
+    done = {}
+    stack = [(node, False)]
+    while stack:
+        current, expanded = stack.pop()
+        if expanded:
+            left = done.pop(id(current.left)) if current.left else None
+            right = done.pop(id(current.right)) if current.right else None
+            done[id(current)] = _layout(current, left, right)
+            continue
+        stack.append((current, True))
+        if current.right:
+            stack.append((current.right, False))
+        if current.left:
+            stack.append((current.left, False))
+    return done[id(node)]
+
 def display(node):
     if node is None:
         print("Tree is empty.")
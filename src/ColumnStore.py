@@ -0,0 +1,169 @@
+from array import array
+from collections import Counter
+
+try:
+    import numpy
+except ImportError:  # numpy is optional; the pure-Python paths give the same answers
+    numpy = None
+
+from src.YearIndex import yearOf
+
+UNKNOWN_YEAR = -1
+
+
+class Dictionary:
+    """
+    Dictionary encoding of a string column: each distinct value gets a small int id.
+    """
+    def __init__(self):
+        self.ids = {}  # normalised value -> id
+        self.values = []  # id -> value as first seen
+
+    def __len__(self):
+        return len(self.values)
+
+    def encode(self, value):
+        value = str(value or "").strip()
+        key = value.lower()
+        code = self.ids.get(key)
+        if code is None:
+            code = self.ids[key] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class ColumnStore:
+    """
+    Struct-of-arrays view of the catalog for whole-catalog aggregates.
+
+    Each book is one row across parallel typed arrays (array module):
+    year, available copies and dictionary-encoded category and author ids.
+    An aggregate reads a couple of contiguous columns instead of visiting
+    every tree node and its Book object. With numpy installed the columns
+    are wrapped zero-copy (numpy.frombuffer) and aggregated with vectorised
+    calls such as bincount; without it, C-level builtins (sum, Counter)
+    scan the arrays.
+
+    Rows are only ever appended; `rows` maps an ISBN to its row so copy
+    changes are O(1).
+    """
+    def __init__(self):
+        self.isbns = []
+        self.rows = {}  # isbn -> row
+        self.year = array("i")
+        self.copies = array("i")
+        self.category = array("i")
+        self.author = array("i")
+        self.categories = Dictionary()
+        self.authors = Dictionary()
+
+    def __len__(self):
+        return len(self.isbns)
+
+    def _yearOf(self, book):
+        year = yearOf(book)
+        return UNKNOWN_YEAR if year is None else year
+
+    def add(self, book):
+        """
+        Appends a book's row. An ISBN that is already stored keeps its row,
+        as the catalog keeps the book it already has.
+        """
+        if book.isbn in self.rows:
+            return
+        self.rows[book.isbn] = len(self.isbns)
+        self.isbns.append(book.isbn)
+        self.year.append(self._yearOf(book))
+        self.copies.append(book.available_copies)
+        self.category.append(self.categories.encode(book.category))
+        self.author.append(self.authors.encode(book.author))
+
+    def addMany(self, books):
+        """
+        Appends rows for books that are not in the store yet (bulk loads).
+        """
+        books = [book for book in books if book.isbn not in self.rows]
+        start = len(self.isbns)
+        self.isbns.extend(book.isbn for book in books)
+        self.rows.update(zip((book.isbn for book in books), range(start, start + len(books))))
+        self.year.extend(self._yearOf(book) for book in books)
+        self.copies.extend(book.available_copies for book in books)
+        self.category.extend(self.categories.encode(book.category) for book in books)
+        self.author.extend(self.authors.encode(book.author) for book in books)
+
+    def setCopies(self, isbn, copies):
+        row = self.rows.get(isbn)
+        if row is not None:
+            self.copies[row] = copies
+
+    def _view(self, column):
+        return numpy.frombuffer(column, dtype=numpy.int32) if len(column) else numpy.zeros(0, numpy.int32)
+
+    def totalCopies(self):
+        """
+        Returns the number of copies currently on the shelves.
+        """
+        if numpy is not None:
+            return int(self._view(self.copies).sum(dtype=numpy.int64))
+        return sum(self.copies)
+
+    def _countBy(self, codes, dictionary, available_only):
+        if numpy is not None:
+            ids = self._view(codes)
+            if available_only:
+                ids = ids[self._view(self.copies) > 0]
+            counts = numpy.bincount(ids, minlength=len(dictionary))
+            return {dictionary.values[i]: int(counts[i]) for i in numpy.flatnonzero(counts)}
+        if available_only:
+            counts = Counter(code for code, copies in zip(codes, self.copies) if copies > 0)
+        else:
+            counts = Counter(codes)
+        return {dictionary.values[code]: n for code, n in counts.items()}
+
+    def countByCategory(self, available_only=False):
+        """
+        Returns {category: number of books}, optionally only books with copies available.
+        """
+        return self._countBy(self.category, self.categories, available_only)
+
+    def countByAuthor(self, available_only=False):
+        """
+        Returns {author: number of books}, optionally only books with copies available.
+        """
+        return self._countBy(self.author, self.authors, available_only)
+
+    def copiesByCategory(self):
+        """
+        Returns {category: copies currently available}.
+        """
+        if numpy is not None:
+            sums = numpy.bincount(self._view(self.category), weights=self._view(self.copies),
+                                  minlength=len(self.categories))
+            return {self.categories.values[i]: int(sums[i]) for i in numpy.flatnonzero(sums)}
+        sums = Counter()
+        for code, copies in zip(self.category, self.copies):
+            sums[code] += copies
+        return {self.categories.values[code]: n for code, n in sums.items() if n}
+
+    def yearHistogram(self, width=1):
+        """
+        Counts books per publication-year bucket.
+
+        Args:
+            width (int): Bucket width in years (e.g. 10 for decades). Buckets
+                are labelled by their first year.
+
+        Returns:
+            dict: {first year of bucket: number of books}, in year order.
+                Books without a numeric year are left out.
+        """
+        if numpy is not None:
+            years = self._view(self.year)
+            years = years[years != UNKNOWN_YEAR]
+            if not len(years):
+                return {}
+            low = int(years.min()) // width
+            counts = numpy.bincount(years // width - low)
+            return {(low + int(i)) * width: int(counts[i]) for i in numpy.flatnonzero(counts)}
+        counts = Counter(year // width for year in self.year if year != UNKNOWN_YEAR)
+        return {bucket * width: counts[bucket] for bucket in sorted(counts)}
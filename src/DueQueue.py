@@ -0,0 +1,81 @@
+import heapq
+import itertools
+
+class DueQueue:
+    """
+    Priority queue of active loans ordered by due time (a binary min-heap).
+
+    Heap entries are (due, sequence number, loan); the sequence number breaks
+    ties between loans due at the same moment, so Loan objects are never
+    compared. Returning a book does not search the heap: the loan is flagged
+    as returned and its entry is dropped once it reaches the top (lazy
+    deletion). When flagged entries outnumber the live ones the heap is
+    rebuilt without them, so it stays within twice the number of active
+    loans and push/discard/peek cost O(log n) amortised.
+    """
+    def __init__(self):
+        self.heap = []
+        self.active = 0
+        self.sequence = itertools.count()
+
+    def __len__(self):
+        return self.active
+
+    def push(self, loan):
+        """
+        Schedules an active loan.
+        """
+        heapq.heappush(self.heap, (loan.due, next(self.sequence), loan))
+        self.active += 1
+
+    def build(self, loans):
+        """
+        Replaces the contents with the given active loans in O(n) (heapify).
+        """
+        self.heap = [(loan.due, next(self.sequence), loan) for loan in loans]
+        heapq.heapify(self.heap)
+        self.active = len(self.heap)
+
+    def discard(self, loan):
+        """
+        Removes a loan that has been returned. Its heap entry is dropped lazily.
+        """
+        loan.returned = True
+        self.active -= 1
+        if len(self.heap) > 2 * self.active + 32:
+            self.heap = [entry for entry in self.heap if not entry[2].returned]
+            heapq.heapify(self.heap)
+
+    def peek(self):
+        """
+        Returns the active loan due soonest, or None if there are no loans.
+        """
+        heap = self.heap
+        while heap and heap[0][2].returned:
+            heapq.heappop(heap)
+        return heap[0][2] if heap else None
+
+    def dueBy(self, deadline):
+        """
+        Lists the active loans due at or before deadline, earliest first.
+
+        Walks the heap level by level, descending only below entries due by
+        the deadline (a child is never due before its parent), then sorts the
+        matches: O(k log k) for k matches, however many loans there are. Once
+        the matches exceed an eighth of the heap, a single linear pass over the
+        heap array is cheaper than continuing the walk, so it switches to that.
+        """
+        heap = self.heap
+        size = len(heap)
+        found = []
+        level = [0] if heap else []
+        while level:
+            if len(found) > size // 8:
+                found = [entry for entry in heap if entry[0] <= deadline and not entry[2].returned]
+                break
+            level = [i for i in level if heap[i][0] <= deadline]
+            found += [heap[i] for i in level if not heap[i][2].returned]
+            level = [child for i in level for child in (2 * i + 1, 2 * i + 2) if child < size]
+        # (due, sequence) pairs are unique, so the Loan objects are never compared
+        found.sort()
+        return [loan for _, _, loan in found]
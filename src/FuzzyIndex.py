@@ -0,0 +1,143 @@
+import heapq
+import math
+
+EPSILON = 1e-9  # keeps float rounding from raising a bound by one
+THRESHOLDS = (0.9, 0.8, 0.7, 0.6)  # similarity thresholds tried before min_similarity
+
+def trigrams(text):
+    """
+    Returns the set of 3-character grams of a normalised, space-padded string.
+
+    Padding makes the start and end of the name count as grams too, so
+    "robert" yields "  r", " ro", "rob", ..., "rt ".
+    """
+    padded = f"  {text.strip().lower()} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def editDistance(a, b):
+    """
+    Levenshtein distance between two strings, using two rolling rows.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        current = [i]
+        for j, cb in enumerate(b, start=1):
+            current.append(min(previous[j] + 1,
+                               current[j - 1] + 1,
+                               previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+class TrigramIndex:
+    """
+    Typo-tolerant name lookup backed by a trigram inverted index.
+
+    Each name is split into trigrams, and the postings map (trigram, number of
+    trigrams of the name) to the names containing it, so names of each size
+    can be searched separately. A Dice similarity of at least s between a
+    query with q trigrams and a name with n trigrams needs n within
+    [s*q/(2-s), (2-s)*q/s] and at least t = ceil(s*(q+n)/2) shared trigrams
+    (count filter). A name sharing t of the q query trigrams must contain one
+    of any q-t+1 of them, so only the postings of the q-t+1 rarest trigrams
+    are walked to find candidates (prefix filter); the other postings are only
+    probed for those candidates. The threshold starts strict and is only
+    lowered until enough names pass it, so a large index, with more close
+    matches, is searched with a stricter threshold. The best few names by Dice
+    similarity are re-ranked by edit distance. Inserting a name costs
+    O(len(name)).
+    """
+    def __init__(self):
+        self.postings = {}  # (trigram, trigrams in name) -> set of names
+        self.grams = {}  # name -> number of distinct trigrams
+        self.sizes = {}  # number of trigrams -> names with that many
+        self.candidates = 0  # names whose shared trigrams were counted, over all searches
+
+    def __len__(self):
+        return len(self.grams)
+
+    def add(self, name):
+        """
+        Indexes a name (normalised with strip().lower()). Repeats are ignored.
+        """
+        name = name.strip().lower()
+        if not name or name in self.grams:
+            return
+        grams = trigrams(name)
+        size = len(grams)
+        for gram in grams:
+            names = self.postings.get((gram, size))
+            if names is None:
+                names = self.postings[(gram, size)] = set()
+            names.add(name)
+        self.grams[name] = size
+        self.sizes[size] = self.sizes.get(size, 0) + 1
+
+    def addAll(self, names):
+        """
+        Indexes every name in an iterable, e.g. the entries of an AuthorHT.
+        """
+        for name in names:
+            self.add(name)
+
+    def search(self, query, limit=5, min_similarity=0.3):
+        """
+        Finds the indexed names closest to query.
+
+        Args:
+            query (str): Possibly misspelled name.
+            limit (int): Maximum number of names to return.
+            min_similarity (float): Minimum Dice trigram similarity (0..1] to
+                consider. Higher values prune more candidates.
+
+        Returns:
+            list[tuple]: (name, edit distance) pairs, closest first.
+        """
+        query = query.strip().lower()
+        if not query:
+            return []
+        query_grams = trigrams(query)
+        q = len(query_grams)
+        keep = limit * 3  # a few more candidates than needed are re-ranked by edit distance
+
+        # Per name size: the query's postings rarest first, how many have been
+        # walked, and how many walked postings each name met there is in
+        sizes = {size: [sorted((self.postings.get((gram, size), ()) for gram in query_grams), key=len), 0, {}]
+                 for size in self.sizes if 2 * min(q, size) / (q + size) >= min_similarity - EPSILON}
+        found = {}  # name -> similarity, for the names that passed a threshold
+
+        # Strict thresholds walk few postings. Thresholds are lowered step by
+        # step, walking further postings, until `keep` names are at least as
+        # similar as the current one: no name left unseen can beat them.
+        for threshold in [t for t in THRESHOLDS if t > min_similarity] + [max(min_similarity, EPSILON)]:
+            for size, state in sizes.items():
+                lists, walked, shared = state
+                if 2 * min(q, size) / (q + size) < threshold - EPSILON:
+                    continue
+                needed = max(1, math.ceil(threshold * (q + size) / 2 - EPSILON))
+                if q - needed + 1 > walked:
+                    seen = len(shared)
+                    for names in lists[walked:q - needed + 1]:
+                        for name in names:
+                            shared[name] = shared.get(name, 0) + 1
+                    walked = state[1] = q - needed + 1
+                    self.candidates += len(shared) - seen
+                probed = lists[walked:]
+                for name, common in shared.items():
+                    if name in found:
+                        continue
+                    remaining = len(probed)
+                    for names in probed:
+                        if common + remaining < needed:
+                            break
+                        common += name in names
+                        remaining -= 1
+                    if common >= needed:
+                        found[name] = 2 * common / (q + size)
+            if len(found) >= keep:
+                break
+
+        candidates = heapq.nlargest(keep, ((similarity, name) for name, similarity in found.items()))
+        ranked = sorted((editDistance(query, name), -similarity, name) for similarity, name in candidates)
+        return [(name, distance) for distance, _, name in ranked[:limit]]
@@ -2,18 +2,38 @@ class HashNode:
     """
     Node class for the Hash Table chaining.
     """
+    __slots__ = ("key", "value", "next")
+
     def __init__(self, key, value):
-        self.key = key       
-        self.value = value  
+        self.key = key
+        self.value = value
         self.next = None
- 
+
 class HashTable:
     """
     Generic Hash Table implementation using chaining for collision resolution.
+
+    The table tracks how many keys it holds and resizes itself when the load
+    factor (count / size) leaves the [min_load, max_load] band. Resizing is
+    incremental: a second bucket array is allocated and a few buckets are moved
+    across on every insert/delete, so no single operation pays for a full rehash.
     """
-    def __init__(self, size=50):
+    def __init__(self, size=50, max_load=0.75, min_load=0.1, rehash_step=4):
         self.size = size
         self.table = [None] * self.size
+        self.count = 0
+        self.initial_size = size
+        self.max_load = max_load
+        self.min_load = min_load
+        self.rehash_step = rehash_step
+
+        # State of an in-progress incremental rehash (old table is drained into self.table)
+        self.old_table = None
+        self.old_size = 0
+        self.rehash_index = 0
+
+    def __len__(self):
+        return self.count
 
     def _hash(self, key):
         """
@@ -21,60 +41,206 @@ class HashTable:
         """
         return hash(key) % self.size
 
+    def _oldHash(self, key):
+        return hash(key) % self.old_size
+
+    def _startResize(self, new_size):
+        """
+        Begins moving every bucket into a new array of new_size buckets.
+        """
+        self.old_table = self.table
+        self.old_size = self.size
+        self.rehash_index = 0
+        self.size = new_size
+        self.table = [None] * self.size
+
+    def _rehashStep(self, buckets=None):
+        """
+        Moves up to `buckets` buckets from the old array into the new one.
+        """
+        if self.old_table is None:
+            return
+        steps = buckets if buckets is not None else self.rehash_step
+        while steps > 0 and self.rehash_index < self.old_size:
+            current = self.old_table[self.rehash_index]
+            self.old_table[self.rehash_index] = None
+            while current:
+                nxt = current.next
+                index = self._hash(current.key)
+                current.next = self.table[index]
+                self.table[index] = current
+                current = nxt
+            self.rehash_index += 1
+            steps -= 1
+        if self.rehash_index >= self.old_size:
+            self.old_table = None
+            self.old_size = 0
+            self.rehash_index = 0
+
+    def _checkLoad(self):
+        """
+        Starts a grow or shrink when the load factor is out of bounds.
+        """
+        if self.old_table is not None:
+            return
+        load = self.count / self.size
+        if load > self.max_load:
+            self._startResize(self.size * 2)
+        elif load < self.min_load and self.size > self.initial_size:
+            self._startResize(max(self.initial_size, self.size // 2))
+
+    def resize(self, new_size):
+        """
+        Rehashes the whole table into new_size buckets immediately.
+        """
+        self._rehashStep(self.old_size)
+        self._startResize(max(1, new_size))
+        self._rehashStep(self.old_size)
+
+    def reserve(self, n):
+        """
+        Grows the table up-front so that n keys fit under max_load.
+
+        Useful before a bulk load, to avoid a chain of incremental resizes.
+        """
+        needed = int(n / self.max_load) + 1
+        if needed > self.size:
+            self.resize(needed)
+
     def insert(self, key, value):
         """
         Inserts a key-value pair into the hash table.
         If the key already exists, updates the value.
         """
+        self._rehashStep()
+
+        if self.old_table is not None:
+            current = self.old_table[self._oldHash(key)]
+            while current:
+                if current.key == key:
+                    current.value = value
+                    return
+                current = current.next
+
         index = self._hash(key)
-        
+
         if self.table[index] is None:
             self.table[index] = HashNode(key, value)
         else:
             current = self.table[index]
             while current:
                 if current.key == key:
-                    current.value = value 
+                    current.value = value
                     return
                 if current.next is None:
                     break
                 current = current.next
             current.next = HashNode(key, value)
+        self.count += 1
+        self._checkLoad()
 
     def search(self, key):
         """
         Searches for a value by key.
-        
+
         Returns:
             The value associated with the key, or None if not found.
         """
         index = self._hash(key)
         current = self.table[index]
-        
+
         while current:
             if current.key == key:
                 return current.value
             current = current.next
-        return None 
+
+        if self.old_table is not None:
+            current = self.old_table[self._oldHash(key)]
+            while current:
+                if current.key == key:
+                    return current.value
+                current = current.next
+        return None
 
     def delete(self, key):
         """
         Deletes a key-value pair from the hash table.
-        
+
         Returns:
             bool: True if deletion was successful, False if key not found.
         """
-        index = self._hash(key)
-        current = self.table[index]
-        prev = None
-        
-        while current:
-            if current.key == key:
-                if prev:
-                    prev.next = current.next
-                else:
-                    self.table[index] = current.next
-                return True
-            prev = current
-            current = current.next
-        return False
\ No newline at end of file
+        self._rehashStep()
+
+        tables = [(self.table, self._hash(key))]
+        if self.old_table is not None:
+            tables.append((self.old_table, self._oldHash(key)))
+
+        for table, index in tables:
+            current = table[index]
+            prev = None
+
+            while current:
+                if current.key == key:
+                    if prev:
+                        prev.next = current.next
+                    else:
+                        table[index] = current.next
+                    self.count -= 1
+                    self._checkLoad()
+                    return True
+                prev = current
+                current = current.next
+        return False
+
+    def items(self):
+        """
+        Yields every (key, value) pair stored in the table, in bucket order.
+        """
+        for table in (self.old_table, self.table):
+            if table is None:
+                continue
+            for bucket in table:
+                current = bucket
+                while current:
+                    yield current.key, current.value
+                    current = current.next
+
+    def chainLengths(self):
+        """
+        Returns the length of every non-empty chain (both arrays while rehashing).
+        """
+        lengths = []
+        for table in (self.old_table, self.table):
+            if table is None:
+                continue
+            for bucket in table:
+                length = 0
+                current = bucket
+                while current:
+                    length += 1
+                    current = current.next
+                if length:
+                    lengths.append(length)
+        return lengths
+
+    def stats(self):
+        """
+        Reports the current shape of the table.
+
+        Returns:
+            dict: size, count, load_factor, max_chain, whether a rehash is in
+            progress, and chains: the number of buckets holding each chain
+            length (0 = empty), e.g. {0: 20, 1: 25, 2: 5}.
+        """
+        lengths = self.chainLengths()
+        chains = {0: self.size + self.old_size - len(lengths)}
+        for length in sorted(lengths):
+            chains[length] = chains.get(length, 0) + 1
+        return {
+            "size": self.size,
+            "count": self.count,
+            "load_factor": self.count / self.size,
+            "max_chain": max(lengths) if lengths else 0,
+            "rehashing": self.old_table is not None,
+            "chains": chains,
+        }
@@ -0,0 +1,101 @@
+import heapq
+import itertools
+from collections import deque
+
+class HoldQueue:
+    """
+    FIFO queue of the holds on one book.
+
+    Waiting holds sit in a deque in the order they were placed. A cancelled
+    or expired hold is only flagged inactive and dropped when it reaches the
+    front, so cancelling is O(1) and handing a copy to the next holder is
+    O(1) amortised, however many holds the book has.
+    """
+    __slots__ = ("waiting", "live", "ready")
+
+    def __init__(self):
+        self.waiting = deque()
+        self.live = 0  # active holds in `waiting`
+        self.ready = 0  # copies set aside for holders, not on the shelf
+
+    def push(self, hold):
+        """
+        Appends a hold and returns its position in the queue (1-based).
+        """
+        self.waiting.append(hold)
+        self.live += 1
+        return self.live
+
+    def popNext(self):
+        """
+        Removes and returns the oldest active waiting hold, or None.
+        """
+        waiting = self.waiting
+        while waiting:
+            hold = waiting.popleft()
+            if hold.active:
+                self.live -= 1
+                return hold
+        return None
+
+    def remove(self, hold):
+        """
+        Withdraws an active waiting hold; its entry is dropped lazily.
+        """
+        hold.active = False
+        self.live -= 1
+
+
+class HoldRegistry:
+    """
+    The hold queues of every book plus an expiry schedule.
+
+    Expiry is a heapq min-heap of (expires, sequence number, hold). A hold
+    whose deadline moves (its copy was set aside) is pushed again, so an
+    entry is stale when the hold is no longer active or has another
+    deadline; stale entries are skipped as they surface.
+    """
+    def __init__(self):
+        self.queues = {}  # isbn -> HoldQueue
+        self.expiry = []
+        self.sequence = itertools.count()
+
+    def queue(self, isbn, create=False):
+        queue = self.queues.get(isbn)
+        if queue is None and create:
+            queue = self.queues[isbn] = HoldQueue()
+        return queue
+
+    def schedule(self, hold):
+        heapq.heappush(self.expiry, (hold.expires, next(self.sequence), hold))
+
+    def nextExpiry(self):
+        """
+        Returns the earliest scheduled deadline (possibly of a stale entry), or None.
+        """
+        return self.expiry[0][0] if self.expiry else None
+
+    def popExpired(self, now):
+        """
+        Removes and returns the active holds whose deadline is at or before now, earliest first.
+        """
+        expiry = self.expiry
+        expired = {}
+        while expiry and expiry[0][0] <= now:
+            deadline, _, hold = heapq.heappop(expiry)
+            if hold.active and hold.expires == deadline:
+                expired[id(hold)] = hold
+        return list(expired.values())
+
+    def holds(self):
+        """
+        Yields every active hold: the ones with a copy set aside (by deadline),
+        then each book's waiting holds in queue order.
+        """
+        ready = {id(hold): hold for deadline, _, hold in self.expiry
+                 if hold.active and hold.ready and hold.expires == deadline}
+        yield from sorted(ready.values(), key=lambda hold: hold.expires)
+        for queue in self.queues.values():
+            for hold in queue.waiting:
+                if hold.active:
+                    yield hold
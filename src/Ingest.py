@@ -0,0 +1,244 @@
+import csv
+import io
+
+from src.Models import Book, Member
+
+BOOK_FIELDS = ['ISBN', 'Title', 'Author', 'Year', 'Category', 'TotalCopies']
+MEMBER_FIELDS = ['MemberID', 'Name']
+
+
+class IngestReport:
+    """
+    Summary of one ingestion run.
+    """
+    def __init__(self):
+        self.rows = 0
+        self.loaded = 0
+        self.rejected = 0
+
+
+def parseBook(row):
+    """
+    Validates one books.csv row and turns it into a Book.
+
+    Args:
+        row (dict): A row from csv.DictReader.
+
+    Returns:
+        Book: The parsed book.
+
+    Raises:
+        ValueError: If a field is missing or malformed.
+    """
+    for field in ('ISBN', 'Title', 'Author'):
+        if not (row.get(field) or '').strip():
+            raise ValueError(f"missing {field}")
+    year = (row.get('Year') or '').strip()
+    if not year.isdigit():
+        raise ValueError(f"invalid Year {year!r}")
+    copies = (row.get('TotalCopies') or '').strip()
+    if not copies.isdigit():
+        raise ValueError(f"invalid TotalCopies {copies!r}")
+    return Book(
+        isbn=row['ISBN'].strip(),
+        title=row['Title'],
+        author=row['Author'],
+        year=year,
+        category=(row.get('Category') or '').strip(),
+        copies=copies
+    )
+
+
+def parseMember(row):
+    """
+    Validates one members.csv row and turns it into a Member.
+
+    Raises:
+        ValueError: If a field is missing.
+    """
+    for field in MEMBER_FIELDS:
+        if not (row.get(field) or '').strip():
+            raise ValueError(f"missing {field}")
+    return Member(member_id=row['MemberID'].strip(), name=row['Name'].strip())
+
+
+def readChunks(file, required_fields, chunk_size):
+    """
+    Streams a CSV file as lists of at most chunk_size rows.
+
+    Only one chunk is held in memory at a time, so arbitrarily large files
+    can be processed.
+
+    Args:
+        file: An open text file positioned at the header line.
+        required_fields (list[str]): Columns that must appear in the header.
+        chunk_size (int): Maximum rows per chunk.
+
+    Yields:
+        list[tuple]: (line_number, row) pairs.
+
+    Raises:
+        ValueError: If the header is missing a required column.
+    """
+    reader = csv.DictReader(file)
+    missing = [f for f in required_fields if f not in (reader.fieldnames or [])]
+    if missing:
+        raise ValueError(f"missing column(s): {', '.join(missing)}")
+
+    chunk = []
+    for row in reader:
+        chunk.append((reader.line_num, row))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def parseChunks(chunks, parse):
+    """
+    Runs the row parser over each chunk.
+
+    Yields:
+        tuple: (parsed, rejects) where parsed holds (line, row, obj) and
+        rejects holds (line, row, reason).
+    """
+    for chunk in chunks:
+        parsed = []
+        rejects = []
+        for line, row in chunk:
+            try:
+                parsed.append((line, row, parse(row)))
+            except (ValueError, TypeError) as e:
+                rejects.append((line, row, str(e)))
+        yield parsed, rejects
+
+
+class RejectWriter:
+    """
+    Appends rejected rows to a CSV report (Line, Error, then the original columns).
+
+    Does nothing when no path is given.
+    """
+    def __init__(self, path, fields):
+        self.file = open(path, mode='w', encoding='utf-8', newline='') if path else None
+        self.fields = fields
+        if self.file:
+            self.writer = csv.writer(self.file)
+            self.writer.writerow(['Line', 'Error'] + fields)
+
+    def write(self, rejects):
+        if not self.file:
+            return
+        for line, row, reason in rejects:
+            self.writer.writerow([line, reason] + [row.get(f, '') for f in self.fields])
+
+    def close(self):
+        if self.file:
+            self.file.close()
+
+
+def ingest(file_path, fields, parse, commit, batch_size=1000, reject_path=None, progress=None):
+    """
+    Streams a CSV file through parse -> validate -> commit in batches.
+
+    Bad rows never abort the load; they are counted and, if reject_path is
+    given, written to a report file along with the reason.
+
+    Args:
+        file_path (str): CSV file to read.
+        fields (list[str]): Required header columns (also the report layout).
+        parse (callable): row dict -> model object, raising ValueError on bad input.
+        commit (callable): Takes a list of (line, row, obj) and stores them.
+            Returns a list of (line, row, reason) for items it refused.
+        batch_size (int): Rows per batch.
+        reject_path (str): Optional path of the reject report.
+        progress (callable): Optional callback(rows, loaded, rejected) after each batch.
+
+    Returns:
+        IngestReport: Counts of rows seen, loaded and rejected.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If the header lacks a required column.
+    """
+    report = IngestReport()
+    with open(file_path, mode='r', encoding='utf-8', newline='') as file:
+        rejects_out = RejectWriter(reject_path, fields)
+        try:
+            for parsed, rejects in parseChunks(readChunks(file, fields, batch_size), parse):
+                rows = len(parsed) + len(rejects)
+                refused = commit(parsed) or []
+                rejects.extend(refused)
+                rejects_out.write(rejects)
+
+                report.rows += rows
+                report.rejected += len(rejects)
+                report.loaded += len(parsed) - len(refused)
+                if progress:
+                    progress(report.rows, report.loaded, report.rejected)
+        finally:
+            rejects_out.close()
+    return report
+
+
+# ----------------------------------------------------------------------
+# Parallel parsing
+#
+# The file is cut into byte ranges that start and end on line boundaries.
+# Worker processes parse their range independently; the caller merges the
+# results. Quoted fields containing newlines are not supported in this mode.
+# ----------------------------------------------------------------------
+
+def splitFile(file_path, parts):
+    """
+    Cuts a CSV file into at most `parts` byte ranges aligned to line starts.
+
+    Returns:
+        tuple: (header fields, list of (start, end) byte offsets after the header).
+    """
+    with open(file_path, mode='rb') as file:
+        header = file.readline()
+        data_start = file.tell()
+        file.seek(0, 2)
+        size = file.tell()
+
+        step = max(1, (size - data_start) // max(1, parts))
+        ranges = []
+        start = data_start
+        while start < size:
+            file.seek(min(size, start + step))
+            file.readline()
+            end = min(size, file.tell())
+            ranges.append((start, end))
+            start = end
+
+    fields = next(csv.reader([header.decode('utf-8-sig')]))
+    return [f.strip() for f in fields], ranges
+
+
+def parseRange(file_path, start, end, fields):
+    """
+    Worker entry point: parses the books in one byte range of a CSV file.
+
+    Returns:
+        tuple: (books, rejects, lines) where rejects holds
+        (line offset within the range, row, reason) and lines is the number
+        of lines in the range.
+    """
+    with open(file_path, mode='rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode('utf-8')
+
+    books = []
+    rejects = []
+    reader = csv.reader(io.StringIO(text, newline=''))
+    for values in reader:
+        if not values:
+            continue
+        row = dict(zip(fields, values))
+        try:
+            books.append(parseBook(row))
+        except (ValueError, TypeError) as e:
+            rejects.append((reader.line_num, row, str(e)))
+    return books, rejects, text.count('\n')
@@ -0,0 +1,107 @@
+# ISBN parsing and normalisation.
+#
+# Every ISBN entering the system (Book construction, CSV rows, the CLI, the
+# server) is parsed once into its key: the ISBN-13 read as an integer. ISBN-10s
+# are converted to their 978-prefixed ISBN-13, hyphens and spaces are dropped
+# and the check digit is verified, so "0-13-235088-2", "0132350882" and
+# "9780132350884" all become 9780132350884. Keys fit in 64 bits and compare and
+# hash as machine integers; since every ISBN-13 starts with 978 or 979 the key
+# prints as the 13-digit ISBN itself.
+
+PREFIXES = ("978", "979")
+
+
+def checkDigit13(digits):
+    """
+    Returns the ISBN-13 check digit (0-9) for the first 12 digits.
+    """
+    total = sum(map(int, digits[0:12:2])) + 3 * sum(map(int, digits[1:12:2]))
+    return -total % 10
+
+
+def _isDigits(text):
+    return text.isascii() and text.isdigit()
+
+
+def parseISBN(value):
+    """
+    Parses an ISBN-10 or ISBN-13 into its integer key.
+
+    Args:
+        value (str | int): The ISBN, with or without hyphens and spaces.
+
+    Returns:
+        int: The ISBN-13 as an integer.
+
+    Raises:
+        ValueError: If the value is not a well-formed ISBN or its check digit is wrong.
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        text = str(value)
+    else:
+        text = str(value).strip().replace("-", "").replace(" ", "")
+
+    if len(text) == 13 and _isDigits(text):
+        if text[:3] not in PREFIXES:
+            raise ValueError(f"invalid ISBN {value!r}: ISBN-13 must start with 978 or 979")
+        if checkDigit13(text) != int(text[12]):
+            raise ValueError(f"invalid ISBN {value!r}: wrong check digit")
+        return int(text)
+
+    if len(text) == 10 and _isDigits(text[:9]) and (_isDigits(text[9]) or text[9] in "xX"):
+        last = 10 if text[9] in "xX" else int(text[9])
+        if (sum((10 - i) * int(d) for i, d in enumerate(text[:9])) + last) % 11:
+            raise ValueError(f"invalid ISBN {value!r}: wrong check digit")
+        digits = "978" + text[:9]
+        return int(digits) * 10 + checkDigit13(digits)
+
+    raise ValueError(f"invalid ISBN {value!r}: expected 10 or 13 digits")
+
+
+def isbnKey(value):
+    """
+    Lookup variant of parseISBN: returns None instead of raising.
+
+    Integers are taken to be keys already (they come from the catalog itself)
+    and are returned unchanged.
+    """
+    if type(value) is int:
+        return value
+    try:
+        return parseISBN(value)
+    except ValueError:
+        return None
+
+
+def boundKey(value):
+    """
+    Turns a range bound into a key. A bound need not be a valid ISBN (e.g.
+    "9780200000000"), so an invalid one is read as a plain 13-digit number.
+
+    Raises:
+        ValueError: If the bound is not a number.
+    """
+    key = isbnKey(value)
+    if key is not None:
+        return key
+    text = str(value).strip().replace("-", "").replace(" ", "")
+    if not _isDigits(text):
+        raise ValueError(f"invalid ISBN bound {value!r}")
+    return int(text)
+
+
+def formatISBN(key):
+    """
+    Returns the 13-digit string form of a key.
+    """
+    return f"{key:013d}"
+
+
+def makeISBN(serial, prefix="978"):
+    """
+    Builds a valid ISBN-13 string from a serial number below 10**9, with the
+    check digit filled in. Keys of increasing serials are increasing.
+    Used for generated catalogs (tests, benchmarks).
+    """
+    digits = f"{prefix}{serial:09d}"
+    return digits + str(checkDigit13(digits))
@@ -0,0 +1,149 @@
+import threading
+from contextlib import nullcontext
+
+# Shared no-op context used when the library runs single-threaded
+NO_LOCK = nullcontext()
+
+
+class _Side:
+    """
+    Context manager for one side (read or write) of a ReadWriteLock.
+    """
+    def __init__(self, acquire, release):
+        self.acquire = acquire
+        self.release = release
+
+    def __enter__(self):
+        self.acquire()
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class ReadWriteLock:
+    """
+    Lock that many readers can hold at once but a writer holds alone.
+
+    Writers are preferred: once a writer is waiting, new readers wait too,
+    so a steady stream of checkouts cannot starve a catalog update.
+
+    The read side is reentrant: a thread that already reads, or holds the
+    write side, enters again without waiting. Otherwise a query calling
+    another query would deadlock behind a waiting writer.
+    """
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writer_thread = None
+        self._waiting_writers = 0
+        self._local = threading.local()  # per thread: read depth, and whether it counts in _readers
+        self._reading = _Side(self.acquireRead, self.releaseRead)
+        self._writing = _Side(self.acquireWrite, self.releaseWrite)
+
+    def acquireRead(self):
+        local = self._local
+        depth = getattr(local, "depth", 0)
+        if depth:
+            local.depth = depth + 1
+            return
+        if self._writer_thread == threading.get_ident():
+            local.depth, local.shared = 1, False
+            return
+        with self._cond:
+            while self._writer or self._waiting_writers:
+                self._cond.wait()
+            self._readers += 1
+        local.depth, local.shared = 1, True
+
+    def releaseRead(self):
+        local = self._local
+        local.depth -= 1
+        if local.depth or not local.shared:
+            return
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+    def acquireWrite(self):
+        with self._cond:
+            self._waiting_writers += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._waiting_writers -= 1
+            self._writer = True
+            self._writer_thread = threading.get_ident()
+
+    def releaseWrite(self):
+        with self._cond:
+            self._writer = False
+            self._writer_thread = None
+            self._cond.notify_all()
+
+    def reading(self):
+        """
+        Returns a context manager holding the lock shared.
+        """
+        return self._reading
+
+    def writing(self):
+        """
+        Returns a context manager holding the lock exclusively.
+        """
+        return self._writing
+
+
+class _Held:
+    """
+    Context manager over a sorted list of stripe locks.
+    """
+    def __init__(self, locks):
+        self.locks = locks
+
+    def __enter__(self):
+        for lock in self.locks:
+            lock.acquire()
+
+    def __exit__(self, *exc):
+        for lock in reversed(self.locks):
+            lock.release()
+
+
+class StripedLock:
+    """
+    Fixed pool of locks shared by any number of keys.
+
+    A key (e.g. ("book", isbn)) always maps to the same stripe, so two
+    operations on the same book or member serialise while unrelated ones
+    usually take different stripes. Several keys are locked in stripe order,
+    which rules out deadlocks between operations that lock more than one.
+    """
+    def __init__(self, stripes=64):
+        self.stripes = [threading.Lock() for _ in range(max(1, stripes))]
+
+    def holding(self, *keys):
+        """
+        Returns a context manager holding the stripes of every key.
+        """
+        n = len(self.stripes)
+        return _Held([self.stripes[i] for i in sorted({hash(key) % n for key in keys})])
+
+
+class NullReadWriteLock:
+    """
+    ReadWriteLock stand-in for single-threaded use; every method is free.
+    """
+    def reading(self):
+        return NO_LOCK
+
+    def writing(self):
+        return NO_LOCK
+
+
+class NullStripedLock:
+    """
+    StripedLock stand-in for single-threaded use.
+    """
+    def holding(self, *keys):
+        return NO_LOCK
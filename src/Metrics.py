@@ -0,0 +1,186 @@
+import json
+import time
+from bisect import bisect_left
+from functools import wraps
+
+from src.Locks import NO_LOCK
+
+# Histogram bucket upper bounds in seconds: 1-2.5-5 steps from 1 us to 10 s
+BOUNDS = tuple(m * 10.0 ** e for e in range(-6, 1) for m in (1, 2.5, 5)) + (10.0,)
+
+class Histogram:
+    """
+    Latency histogram with fixed, Prometheus-style buckets.
+
+    Recording is a binary search over 22 bounds plus two additions, so the
+    cost does not grow with the number of samples and nothing is stored per
+    call. Percentiles are estimated by interpolating within a bucket, as
+    Prometheus' histogram_quantile() does.
+    """
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self):
+        self.counts = [0] * (len(BOUNDS) + 1)  # the last bucket holds values above BOUNDS[-1]
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(BOUNDS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def quantile(self, q):
+        """
+        Estimates the q-quantile (0 < q <= 1) in seconds, or None if nothing was recorded.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                if i == len(BOUNDS):
+                    return BOUNDS[-1]
+                lower = BOUNDS[i - 1] if i else 0.0
+                return lower + (BOUNDS[i] - lower) * (rank - seen) / n
+            seen += n
+        return BOUNDS[-1]
+
+    def buckets(self):
+        """
+        Returns cumulative (le, count) pairs, ending with ("+Inf", total).
+        """
+        pairs = []
+        seen = 0
+        for bound, n in zip(BOUNDS, self.counts):
+            seen += n
+            pairs.append((f"{bound:g}", seen))
+        pairs.append(("+Inf", self.count))
+        return pairs
+
+
+class Metrics:
+    """
+    Call counts, failure counts and latency histograms per LibrarySystem method.
+
+    timed() wraps a bound method; LibrarySystem.enableMetrics() installs the
+    wrappers as instance attributes, which shadow the class methods, and
+    disableMetrics() deletes them again. While metrics are off, calls go
+    straight to the class methods and cost nothing extra.
+    """
+    def __init__(self, lock=NO_LOCK):
+        self.lock = lock
+        self.histograms = {}  # method name -> Histogram
+        self.failures = {}  # method name -> calls that returned (False, message)
+        self.started = time.time()
+
+    def timed(self, name, fn):
+        histogram = self.histograms.setdefault(name, Histogram())
+        self.failures.setdefault(name, 0)
+        failures = self.failures
+        lock = self.lock
+        clock = time.perf_counter
+
+        @wraps(fn)
+        def call(*args, **kwargs):
+            start = clock()
+            try:
+                result = fn(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                with lock:
+                    histogram.observe(elapsed)
+            if type(result) is tuple and result and result[0] is False:
+                with lock:
+                    failures[name] += 1
+            return result
+        return call
+
+    def operations(self):
+        """
+        Summarises every method that has been called at least once.
+
+        Returns:
+            dict: name -> calls, failures, total_seconds, mean_us, p50_us,
+            p90_us, p99_us and the cumulative histogram buckets.
+        """
+        report = {}
+        with self.lock:
+            for name, histogram in sorted(self.histograms.items()):
+                if not histogram.count:
+                    continue
+                report[name] = {
+                    "calls": histogram.count,
+                    "failures": self.failures[name],
+                    "total_seconds": histogram.sum,
+                    "mean_us": histogram.sum / histogram.count * 1e6,
+                    "p50_us": histogram.quantile(0.5) * 1e6,
+                    "p90_us": histogram.quantile(0.9) * 1e6,
+                    "p99_us": histogram.quantile(0.99) * 1e6,
+                    "buckets": histogram.buckets(),
+                }
+        return report
+
+
+def toJSON(stats):
+    """
+    Serialises a LibrarySystem.stats() dict as JSON text.
+    """
+    return json.dumps(stats, indent=2, sort_keys=True)
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def toPrometheus(stats, prefix="library"):
+    """
+    Renders a LibrarySystem.stats() dict in the Prometheus text exposition format.
+    """
+    lines = []
+
+    def family(name, kind, help_text, samples):
+        lines.append(f"# HELP {prefix}_{name} {help_text}")
+        lines.append(f"# TYPE {prefix}_{name} {kind}")
+        for suffix, labels, value in samples:
+            text = ",".join(f'{key}="{_label(val)}"' for key, val in labels.items())
+            lines.append(f"{prefix}_{name}{suffix}{{{text}}} {value}" if text else f"{prefix}_{name}{suffix} {value}")
+
+    operations = stats.get("operations", {})
+    if operations:
+        samples = []
+        for op, entry in operations.items():
+            for le, count in entry["buckets"]:
+                samples.append(("_bucket", {"operation": op, "le": le}, count))
+            samples.append(("_sum", {"operation": op}, repr(entry["total_seconds"])))
+            samples.append(("_count", {"operation": op}, entry["calls"]))
+        family("operation_duration_seconds", "histogram", "Time spent in LibrarySystem methods.", samples)
+        family("operation_failures_total", "counter", "Calls that returned (False, message).",
+               [("", {"operation": op}, entry["failures"]) for op, entry in operations.items()])
+
+    tables = stats.get("hash_tables", {})
+    for key, kind, help_text in (("size", "gauge", "Buckets in the hash table."),
+                                 ("count", "gauge", "Keys stored in the hash table."),
+                                 ("load_factor", "gauge", "Keys per bucket."),
+                                 ("max_chain", "gauge", "Longest bucket chain.")):
+        name = {"size": "hash_table_buckets", "count": "hash_table_keys"}.get(key, f"hash_table_{key}")
+        family(name, kind, help_text, [("", {"table": table}, entry[key]) for table, entry in tables.items()])
+    family("hash_table_chains", "gauge", "Buckets holding a chain of each length.",
+           [("", {"table": table, "length": length}, n)
+            for table, entry in tables.items() for length, n in entry["chains"].items()])
+
+    trees = stats.get("avl_trees", {})
+    family("avl_nodes", "gauge", "Nodes in the AVL tree.", [("", {"tree": t}, e["nodes"]) for t, e in trees.items()])
+    family("avl_height", "gauge", "Height of the AVL tree.", [("", {"tree": t}, e["height"]) for t, e in trees.items()])
+    family("avl_min_height", "gauge", "Height of a perfectly balanced tree with as many nodes.",
+           [("", {"tree": t}, e["min_height"]) for t, e in trees.items()])
+    family("avl_rotations_total", "counter", "Rotations done while rebalancing.",
+           [("", {"tree": t, "direction": d}, e[f"rotations_{d}"]) for t, e in trees.items() for d in ("left", "right")])
+
+    cache = stats.get("cache")
+    if cache:
+        for key in ("hits", "misses", "evictions", "invalidations"):
+            family(f"cache_{key}_total", "counter", f"Query cache {key}.", [("", {}, cache[key])])
+        family("cache_entries", "gauge", "Cached query results.", [("", {}, cache["size"])])
+
+    for key, value in stats.get("counts", {}).items():
+        family(key, "gauge", f"Number of {key.replace('_', ' ')}.", [("", {}, value)])
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,120 @@
+from collections import OrderedDict
+
+from src.Locks import NO_LOCK
+
+class QueryCache:
+    """
+    Bounded LRU cache of query results with tag-based invalidation.
+
+    Entries live in an OrderedDict kept in recency order: a hit moves the
+    entry to the end, and once `capacity` is exceeded the entry at the front
+    (least recently used) is evicted, so get/put are O(1). Each entry is
+    stored with the tags it depends on, e.g. ("author", "jane austen"), and
+    `tags` maps every tag to the keys that carry it. A write invalidates
+    exactly the entries tagged with what it changed.
+
+    `version` counts invalidations. A caller that computes a result outside
+    any lock reads it first and passes it to put(); if an invalidation ran
+    in between, the result may already be stale and is not stored.
+    """
+    def __init__(self, capacity=1024, lock=NO_LOCK):
+        self.capacity = capacity
+        self.entries = OrderedDict()  # key -> (value, tags)
+        self.tags = {}  # tag -> set of keys
+        self.lock = lock
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, default=None):
+        """
+        Returns the cached value for key (marking it most recently used), or default.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, tags, version=None):
+        """
+        Stores value under key, evicting the least recently used entry if the cache is full.
+
+        Args:
+            key (hashable): The query, e.g. ("author", "jane austen").
+            value: The result.
+            tags (tuple): Tags whose invalidation drops this entry.
+            version (int): The cache version read before computing value; the
+                value is discarded if an invalidation has happened since.
+        """
+        if self.capacity <= 0:
+            return
+        with self.lock:
+            if version is not None and version != self.version:
+                return
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (value, tags)
+            for tag in tags:
+                self.tags.setdefault(tag, set()).add(key)
+            if len(self.entries) > self.capacity:
+                self._remove(next(iter(self.entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        _, tags = self.entries.pop(key)
+        for tag in tags:
+            keys = self.tags[tag]
+            keys.discard(key)
+            if not keys:
+                del self.tags[tag]
+
+    def invalidate(self, *tags):
+        """
+        Drops every entry carrying any of the given tags.
+
+        Returns:
+            int: Number of entries dropped.
+        """
+        with self.lock:
+            self.version += 1
+            dropped = 0
+            for tag in tags:
+                for key in list(self.tags.get(tag, ())):
+                    self._remove(key)
+                    dropped += 1
+            self.invalidations += dropped
+            return dropped
+
+    def clear(self):
+        """
+        Drops every entry, e.g. after a bulk load.
+        """
+        with self.lock:
+            self.version += 1
+            self.invalidations += len(self.entries)
+            self.entries.clear()
+            self.tags.clear()
+
+    def stats(self):
+        """
+        Returns the cache counters as a dict.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.entries),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
@@ -0,0 +1,219 @@
+import sys
+import os
+import asyncio
+import itertools
+import json
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.System import LibrarySystem
+from src.Isbn import formatISBN
+from src.Metrics import toPrometheus
+
+# Protocol: newline-delimited JSON over TCP.
+#
+#   request   {"id": 7, "op": "borrow", "args": {"member_id": "...", "isbn": "..."}}
+#   response  {"id": 7, "ok": true, "result": ...}
+#             {"id": 7, "ok": false, "error": "..."}
+#
+# A client may pipeline any number of requests without waiting; responses
+# come back on the same connection in request order.
+
+def bookToDict(book):
+    return {
+        "isbn": formatISBN(book.isbn),
+        "title": book.title,
+        "author": book.author,
+        "year": book.year,
+        "category": book.category,
+        "available_copies": book.available_copies,
+    }
+
+def loanToDict(loan):
+    return {
+        "member_id": loan.member_id,
+        "isbn": formatISBN(loan.isbn),
+        "checkout": loan.checkout,
+        "due": loan.due,
+    }
+
+class LibraryServer:
+    """
+    asyncio TCP front-end serving one shared LibrarySystem.
+
+    Library calls are short and run directly on the event loop, so requests
+    from all connections are applied one at a time and need no locking.
+    Each connection is handled by its own coroutine:
+
+    - Pipelining: every complete request line already received is answered
+      before the coroutine waits for the socket again, and the responses of
+      such a burst go out in a single write. Lines longer than max_line bytes
+      are refused and the connection is closed.
+    - Backpressure: once more than `high_water` bytes of responses are queued
+      for a client that is not reading them, the coroutine stops reading
+      requests until the buffer drains, so a slow client cannot make the
+      server buffer without bound; TCP then pushes back on the client.
+    """
+    def __init__(self, library, host="127.0.0.1", port=8765, high_water=64 * 1024, max_line=64 * 1024):
+        self.library = library
+        self.host = host
+        self.port = port
+        self.high_water = high_water
+        self.max_line = max_line
+        self.server = None
+        self.requests = 0
+        self.connections = 0
+
+        self.handlers = {
+            "ping": lambda: "pong",
+            "isbn": self._isbn,
+            "title": lambda title: [bookToDict(b) for b in self.library.titleSearchAll(title)],
+            "prefix": lambda prefix, limit=10: [bookToDict(b) for b in self.library.titlePrefixSearch(prefix, limit)],
+            "author": lambda author: [bookToDict(b) for b in self.library.authorSearch(author)],
+            "fuzzy_author": lambda author, limit=5: self.library.fuzzyAuthorSearch(author, limit),
+            "keyword": lambda query, limit=10: [bookToDict(b) for b in self.library.keywordSearch(query, limit)],
+            "find": lambda **filters: [bookToDict(b) for b in self.library.findBooks(**filters)],
+            "borrow": lambda member_id, isbn: self.library.borrowBook(member_id, isbn),
+            "return": lambda member_id, isbn: self.library.returnBooks(member_id, isbn),
+            "hold": lambda member_id, isbn: self.library.placeHold(member_id, isbn),
+            "cancel_hold": lambda member_id, isbn: self.library.cancelHold(member_id, isbn),
+            "report": self._report,
+            "overdue": lambda now=None, limit=50: [loanToDict(l) for l in self.library.overdueLoans(now)[:limit]],
+            "cache_stats": lambda: self.library.cacheStats(),
+            "stats": lambda: self.library.stats(),
+            "metrics": lambda: toPrometheus(self.library.stats()),
+        }
+
+    def _isbn(self, isbn):
+        book = self.library.isbnSearch(isbn)
+        return bookToDict(book) if book else None
+
+    def _report(self, kind, key=None, offset=0, limit=50):
+        """
+        One page of a report: "sorted", "available", "author" (key=name) or "member" (key=ID).
+        """
+        if kind == "sorted":
+            books = self.library.listSortedPage(offset, limit)
+        else:
+            if kind == "available":
+                source = self.library.iterAll()
+            elif kind == "author":
+                source = self.library.iterByAuthor(key)
+            elif kind == "member":
+                source = self.library.iterByMember(key)
+            else:
+                raise ValueError(f"unknown report {kind!r}")
+            books = itertools.islice(source, offset, offset + limit)
+        return [bookToDict(b) for b in books]
+
+    def handle(self, line):
+        """
+        Answers one request line.
+
+        Returns:
+            dict: The response object.
+        """
+        self.requests += 1
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            return {"id": None, "ok": False, "error": f"invalid JSON: {str(e)}"}
+        if not isinstance(request, dict):
+            return {"id": None, "ok": False, "error": "request must be a JSON object"}
+
+        request_id = request.get("id")
+        handler = self.handlers.get(request.get("op"))
+        if handler is None:
+            return {"id": request_id, "ok": False, "error": f"unknown op {request.get('op')!r}"}
+        args = request.get("args") or {}
+        try:
+            result = handler(**args)
+        except (TypeError, ValueError) as e:
+            return {"id": request_id, "ok": False, "error": str(e)}
+        except Exception as e:
+            # Anything else (e.g. an argument of the wrong type) fails this request
+            # only; the other requests of the burst still get their answers
+            return {"id": request_id, "ok": False, "error": f"{type(e).__name__}: {str(e)}"}
+
+        if isinstance(result, tuple):
+            # Library mutations report (success, message)
+            success, msg = result
+            return {"id": request_id, "ok": success, "result": msg} if success else \
+                   {"id": request_id, "ok": False, "error": msg}
+        return {"id": request_id, "ok": True, "result": result}
+
+    async def _serve(self, reader, writer):
+        self.connections += 1
+        writer.transport.set_write_buffer_limits(high=self.high_water)
+        pending = b""
+        try:
+            while True:
+                chunk = await reader.read(self.max_line)
+                if not chunk:
+                    break
+                # Every complete line of a pipelined burst is answered in one write
+                *lines, pending = (pending + chunk).split(b"\n")
+                if len(pending) > self.max_line:
+                    writer.write(b'{"id":null,"ok":false,"error":"request too long"}\n')
+                    break
+                responses = [self.handle(line) for line in lines if line.strip()]
+                if responses:
+                    writer.write("".join(json.dumps(r, separators=(",", ":")) + "\n"
+                                         for r in responses).encode("utf-8"))
+                    # Blocks while the client leaves more than high_water bytes unread
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def start(self):
+        """
+        Starts listening. With port=0 the OS picks a free port, stored in self.port.
+        """
+        self.server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serveForever(self):
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+def loadLibrary(snapshot_path='data/library.snap', log_path='data/library.wal'):
+    """
+    Builds the shared library the same way main.py does: snapshot (or CSV), then the log.
+    """
+    library = LibrarySystem()
+    loaded = os.path.exists(snapshot_path) and library.load_snapshot(snapshot_path)[0]
+    if not loaded:
+        if os.path.exists('data/books.csv'):
+            library.bulkLoadBooksCSV('data/books.csv')
+        if os.path.exists('data/members.csv'):
+            library.loadMembersCSV('data/members.csv')
+    if log_path:
+        library.openLog(log_path)
+    return library
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--metrics"]
+    port = int(args[0]) if args else 8765
+    library = loadLibrary()
+    if "--metrics" in sys.argv:
+        library.enableMetrics()
+    server = LibraryServer(library, port=port)
+
+    async def run():
+        await server.start()
+        print(f"Listening on {server.host}:{server.port}", flush=True)
+        await server.serveForever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        server.library.closeLog()
@@ -0,0 +1,197 @@
+import mmap
+from array import array
+import os
+import struct
+import zlib
+
+from src.Models import Book, Member
+from src.TextIndex import InvertedIndex
+
+# File layout (all integers little-endian):
+#
+#   header   MAGIC, version, reserved, book/member/loan/hold/term counts, the last
+#            write-ahead log sequence number it contains, CRC32 of the body
+#   books    one record per book in ISBN order
+#   members  one record per member
+#   loans    one record per loan (member, ISBN, checkout and due time), in each
+#            member's borrowing order
+#   holds    one record per active hold: copies set aside first, then each
+#            book's waiting holds in queue order
+#   text     the full-text index: token count of every book (in book order),
+#            then per term its postings as arrays of book ordinals and term counts
+#
+# Every record is a fixed-size struct followed by a single UTF-8 blob holding
+# all of its strings back to back. ISBNs are stored as their 64-bit integer
+# keys. The struct stores the blob's byte length and the character length of
+# each string, so a record is decoded with one unpack_from() and one decode()
+# straight from the memory-mapped file.
+
+MAGIC = b"UETSNAP\0"
+VERSION = 6
+
+HEADER = struct.Struct("<8sHHQQQQQQI")  # magic, version, reserved, books, members, loans, holds, terms, lsn, crc
+BOOK_RECORD = struct.Struct("<QiIIIII")  # isbn, copies, blob bytes, title/author/category/year lengths
+MEMBER_RECORD = struct.Struct("<III")  # blob bytes, member_id/name lengths
+LOAN_RECORD = struct.Struct("<QddII")  # isbn, checkout and due times, blob bytes, member_id length
+HOLD_RECORD = struct.Struct("<Qdd?II")  # isbn, placed and expiry times, ready flag, blob bytes, member_id length
+TERM_RECORD = struct.Struct("<II")  # term bytes, number of postings
+
+
+class SnapshotError(Exception):
+    """
+    Raised when a snapshot file is not valid or cannot be read.
+    """
+
+
+def _packStrings(record, numbers, strings):
+    blob = "".join(strings).encode("utf-8")
+    return record.pack(*numbers, len(blob), *(len(s) for s in strings)) + blob
+
+
+def _unpackStrings(buffer, offset, record, count_numbers):
+    """
+    Reads one record at offset.
+
+    Returns:
+        tuple: (numbers, strings, next offset)
+    """
+    fields = record.unpack_from(buffer, offset)
+    numbers = fields[:count_numbers]
+    blob_size = fields[count_numbers]
+    start = offset + record.size
+    text = buffer[start:start + blob_size].decode("utf-8")
+
+    strings = []
+    position = 0
+    for length in fields[count_numbers + 1:]:
+        strings.append(text[position:position + length])
+        position += length
+    return numbers, strings, start + blob_size
+
+
+def _readArray(buffer, offset, count):
+    values = array("I")
+    values.frombytes(buffer[offset:offset + 4 * count])
+    return values
+
+
+def writeSnapshot(path, books, members, loans, text_index, lsn=0, holds=()):
+    """
+    Writes a snapshot file atomically (temporary file, then rename).
+
+    Args:
+        path (str): Destination file.
+        books (list[Book]): Books in ISBN order.
+        members (list[Member]): Registered members.
+        loans (list[tuple]): (member_id, isbn, checkout, due) tuples.
+        text_index (InvertedIndex): Full-text index over exactly these books.
+        lsn (int): Sequence number of the last log record reflected in the snapshot.
+        holds (list[tuple]): (member_id, isbn, placed, expires, ready) tuples.
+
+    Raises:
+        SnapshotError: If a value does not fit its field, e.g. a copy count
+            beyond 32 bits. Nothing is written then.
+    """
+    holds = list(holds)
+    try:
+        body = _packBody(books, members, loans, text_index, holds)
+    except struct.error as e:
+        raise SnapshotError(f"value too large for the snapshot format: {str(e)}")
+    header = HEADER.pack(MAGIC, VERSION, 0, len(books), len(members), len(loans), len(holds),
+                         len(text_index.postings), lsn, zlib.crc32(body))
+    tmp_path = path + ".tmp"
+    with open(tmp_path, mode="wb") as file:
+        file.write(header)
+        file.write(body)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+
+def _packBody(books, members, loans, text_index, holds):
+    body = bytearray()
+    for book in books:
+        body += _packStrings(BOOK_RECORD, (book.isbn, book.available_copies),
+                             (book.title, book.author, str(book.category), str(book.year)))
+    for member in members:
+        body += _packStrings(MEMBER_RECORD, (), (str(member.member_id), member.name))
+    for member_id, isbn, checkout, due in loans:
+        body += _packStrings(LOAN_RECORD, (isbn, checkout, due), (str(member_id),))
+    for member_id, isbn, placed, expires, ready in holds:
+        body += _packStrings(HOLD_RECORD, (isbn, placed, expires, ready), (str(member_id),))
+
+    ordinal = {book.isbn: i for i, book in enumerate(books)}
+    body += array("I", (text_index.doc_lengths.get(book.isbn, 0) for book in books)).tobytes()
+    for term, plist in text_index.postings.items():
+        encoded = term.encode("utf-8")
+        body += TERM_RECORD.pack(len(encoded), len(plist)) + encoded
+        body += array("I", (ordinal[isbn] for isbn in plist)).tobytes()
+        body += array("I", plist.values()).tobytes()
+    return body
+
+
+def readSnapshot(path):
+    """
+    Reads a snapshot file through a read-only memory map.
+
+    Returns:
+        tuple: (books in ISBN order, members, loans as (member_id, isbn, checkout, due) tuples,
+        holds as (member_id, isbn, placed, expires, ready) tuples, InvertedIndex over the
+        books, log sequence number)
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        SnapshotError: If the file is truncated, corrupt or of another version.
+    """
+    with open(path, mode="rb") as file:
+        if os.fstat(file.fileno()).st_size < HEADER.size:
+            raise SnapshotError("file too small to be a snapshot")
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            magic, version, _, n_books, n_members, n_loans, n_holds, n_terms, lsn, crc = HEADER.unpack_from(buffer, 0)
+            if magic != MAGIC:
+                raise SnapshotError("not a library snapshot")
+            if version != VERSION:
+                raise SnapshotError(f"unsupported snapshot version {version}")
+            if zlib.crc32(memoryview(buffer)[HEADER.size:]) != crc:
+                raise SnapshotError("checksum mismatch (file is corrupt or truncated)")
+
+            offset = HEADER.size
+            books = []
+            for _ in range(n_books):
+                (isbn, copies), (title, author, category, year), offset = \
+                    _unpackStrings(buffer, offset, BOOK_RECORD, 2)
+                books.append(Book(isbn, title, author, year, category, copies))
+
+            members = []
+            for _ in range(n_members):
+                _, (member_id, name), offset = _unpackStrings(buffer, offset, MEMBER_RECORD, 0)
+                members.append(Member(member_id, name))
+
+            loans = []
+            for _ in range(n_loans):
+                (isbn, checkout, due), (member_id,), offset = _unpackStrings(buffer, offset, LOAN_RECORD, 3)
+                loans.append((member_id, isbn, checkout, due))
+
+            holds = []
+            for _ in range(n_holds):
+                (isbn, placed, expires, ready), (member_id,), offset = _unpackStrings(buffer, offset, HOLD_RECORD, 4)
+                holds.append((member_id, isbn, placed, expires, ready))
+
+            # Postings are rebuilt with C-level dict(zip(...)) calls over the raw arrays
+            isbns = [book.isbn for book in books]
+            text_index = InvertedIndex()
+            lengths = _readArray(buffer, offset, n_books)
+            offset += 4 * n_books
+            text_index.doc_lengths = dict(zip(isbns, lengths))
+            text_index.total_length = sum(lengths)
+            for _ in range(n_terms):
+                term_size, count = TERM_RECORD.unpack_from(buffer, offset)
+                offset += TERM_RECORD.size
+                term = buffer[offset:offset + term_size].decode("utf-8")
+                offset += term_size
+                ordinals = _readArray(buffer, offset, count)
+                offset += 4 * count
+                counts = _readArray(buffer, offset, count)
+                offset += 4 * count
+                text_index.postings[term] = dict(zip(map(isbns.__getitem__, ordinals), counts))
+    return books, members, loans, holds, text_index, lsn
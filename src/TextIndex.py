@@ -0,0 +1,121 @@
+import math
+import re
+import heapq
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+def tokenize(text):
+    """
+    Splits text into lowercase alphanumeric tokens.
+    """
+    return TOKEN_PATTERN.findall(str(text).lower())
+
+class InvertedIndex:
+    """
+    Full-text inverted index with BM25 ranking.
+
+    Every term maps to a postings dictionary {isbn: term frequency}, so a
+    query only touches the postings of its own terms, never the catalog.
+
+    Multi-term queries use MaxScore pruning: terms are processed from rarest
+    to most common, and once the best possible contribution of the remaining
+    (common) terms cannot lift a new document into the top `limit`, those
+    terms only re-score the documents already found instead of scanning their
+    long postings lists.
+    """
+    def __init__(self, k1=1.2, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings = {}  # term -> {isbn: tf}
+        self.doc_lengths = {}  # isbn -> number of tokens
+        self.total_length = 0
+
+    def __len__(self):
+        return len(self.doc_lengths)
+
+    def add(self, isbn, *fields):
+        """
+        Indexes a document made of the given text fields.
+
+        Returns:
+            bool: False if the ISBN was already indexed (the call is ignored).
+        """
+        if isbn in self.doc_lengths:
+            return False
+        tokens = []
+        for field in fields:
+            tokens.extend(tokenize(field))
+
+        counts = {}
+        for token in tokens:
+            counts[token] = counts.get(token, 0) + 1
+        for term, tf in counts.items():
+            plist = self.postings.get(term)
+            if plist is None:
+                plist = self.postings[term] = {}
+            plist[isbn] = tf
+
+        self.doc_lengths[isbn] = len(tokens)
+        self.total_length += len(tokens)
+        return True
+
+    def idf(self, term):
+        """
+        BM25 inverse document frequency of a term (0 for unknown terms).
+        """
+        df = len(self.postings.get(term, ()))
+        if not df:
+            return 0.0
+        n = len(self.doc_lengths)
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def search(self, query, limit=10):
+        """
+        Ranks documents against a free-text query.
+
+        Args:
+            query (str): One or more terms.
+            limit (int): Number of results to return.
+
+        Returns:
+            list[tuple]: (isbn, score) pairs, best first.
+        """
+        if not self.doc_lengths or limit <= 0:
+            return []
+        terms = [t for t in set(tokenize(query)) if t in self.postings]
+        if not terms:
+            return []
+
+        # Rarest terms first; upper_bounds[i] is the most terms[i:] can add to a score
+        terms.sort(key=lambda t: len(self.postings[t]))
+        idfs = [self.idf(t) for t in terms]
+        upper_bounds = [0.0] * (len(terms) + 1)
+        for i in range(len(terms) - 1, -1, -1):
+            upper_bounds[i] = upper_bounds[i + 1] + idfs[i] * (self.k1 + 1)
+
+        k1 = self.k1
+        b = self.b
+        avg_length = self.total_length / len(self.doc_lengths)
+        lengths = self.doc_lengths
+        scores = {}
+
+        for i, term in enumerate(terms):
+            plist = self.postings[term]
+            idf = idfs[i]
+
+            if len(scores) >= limit:
+                threshold = heapq.nlargest(limit, scores.values())[-1]
+                if upper_bounds[i] <= threshold:
+                    # No unseen document can reach the top any more
+                    for isbn in scores:
+                        tf = plist.get(isbn)
+                        if tf:
+                            norm = k1 * (1 - b + b * lengths[isbn] / avg_length)
+                            scores[isbn] += idf * tf * (k1 + 1) / (tf + norm)
+                    continue
+
+            for isbn, tf in plist.items():
+                norm = k1 * (1 - b + b * lengths[isbn] / avg_length)
+                scores[isbn] = scores.get(isbn, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
@@ -0,0 +1,200 @@
+import os
+
+from src.AuthorHashTable import ISBNNode
+
+class TrieNode:
+    """
+    Node of the compressed title trie.
+
+    Each edge into a node carries a whole substring (label) rather than a
+    single character, so long titles do not turn into long chains of nodes.
+    """
+    __slots__ = ("label", "children", "isbn_list_head")
+
+    def __init__(self, label):
+        self.label = label
+        self.children = None  # first character of the child's label -> TrieNode; None for leaves
+        self.isbn_list_head = None  # ISBNs of every book whose title ends here
+
+    def addChild(self, child):
+        """
+        Links child under the first character of its label.
+
+        Most nodes are leaves (the end of one title), so the dictionary is
+        only created for nodes that actually get children.
+        """
+        if self.children is None:
+            self.children = {}
+        self.children[child.label[0]] = child
+
+class TitleTrie:
+    """
+    Title index that keeps every ISBN for a title and answers prefix queries.
+
+    Titles are normalised with strip().lower(), like the other indexes. An
+    exact lookup costs O(len(title)); a prefix query costs O(len(prefix))
+    plus the part of the trie it has to visit to collect `limit` titles.
+    """
+    def __init__(self):
+        self.root = TrieNode("")
+        self.count = 0  # distinct titles
+
+    def __len__(self):
+        return self.count
+
+    def _find(self, key):
+        """
+        Returns the node whose path spells exactly key, or None.
+        """
+        node = self.root
+        i = 0
+        while i < len(key):
+            child = node.children.get(key[i]) if node.children else None
+            if child is None or not key.startswith(child.label, i):
+                return None
+            i += len(child.label)
+            node = child
+        return node
+
+    def insert(self, title, isbn):
+        """
+        Adds an ISBN under a title. Existing ISBNs for the same title are kept.
+        """
+        key = title.strip().lower()
+        node = self.root
+        i = 0
+        while i < len(key):
+            child = node.children.get(key[i]) if node.children else None
+            if child is None:
+                child = TrieNode(key[i:])
+                node.addChild(child)
+                node = child
+                break
+
+            # Length of the part of the edge label that matches the key
+            label = child.label
+            j = len(os.path.commonprefix((label, key[i:i + len(label)])))
+
+            if j < len(label):
+                # Split the edge: node -> middle -> child
+                middle = TrieNode(label[:j])
+                child.label = label[j:]
+                middle.addChild(child)
+                node.addChild(middle)
+                child = middle
+            node = child
+            i += j
+
+        if node.isbn_list_head is None:
+            self.count += 1
+        new_node = ISBNNode(isbn)
+        new_node.next = node.isbn_list_head
+        node.isbn_list_head = new_node
+
+    def buildSorted(self, pairs):
+        """
+        Fills an empty trie from (title, isbn) pairs sorted by normalised title.
+
+        Consecutive titles only differ below their longest common prefix, so
+        each title is attached to the rightmost path of the trie (kept on a
+        stack) with a single split at most. This avoids re-walking from the
+        root for every title during bulk loads.
+
+        Args:
+            pairs (list[tuple]): (normalised title, isbn) pairs in title order.
+        """
+        # stack holds (node, depth at the end of its label) along the rightmost path
+        stack = [(self.root, 0)]
+        previous = None
+        for key, isbn in pairs:
+            if key == previous:
+                terminal = stack[-1][0]
+            else:
+                common = len(os.path.commonprefix((previous, key))) if previous is not None else 0
+                last = None
+                while stack[-1][1] > common:
+                    last = stack.pop()
+                parent = stack[-1][0]
+
+                if last is not None and last[1] - len(last[0].label) < common:
+                    # The previous title's edge runs past the common prefix: split it
+                    child = last[0]
+                    cut = common - (last[1] - len(child.label))
+                    middle = TrieNode(child.label[:cut])
+                    child.label = child.label[cut:]
+                    middle.addChild(child)
+                    parent.addChild(middle)
+                    stack.append((middle, common))
+                    parent = middle
+
+                if common == len(key):
+                    terminal = parent
+                else:
+                    terminal = TrieNode(key[common:])
+                    parent.addChild(terminal)
+                    stack.append((terminal, len(key)))
+                previous = key
+
+            if terminal.isbn_list_head is None:
+                self.count += 1
+            new_node = ISBNNode(isbn)
+            new_node.next = terminal.isbn_list_head
+            terminal.isbn_list_head = new_node
+
+    def search(self, title):
+        """
+        Returns every ISBN stored under an exact (normalised) title, newest first.
+        """
+        node = self._find(title.strip().lower())
+        isbns = []
+        temp = node.isbn_list_head if node else None
+        while temp:
+            isbns.append(temp.isbn)
+            temp = temp.next
+        return isbns
+
+    def prefix(self, prefix, limit=10):
+        """
+        Returns up to `limit` titles starting with prefix, in alphabetical order.
+
+        Args:
+            prefix (str): Beginning of the title (normalised like titles).
+            limit (int): Maximum number of titles to return.
+
+        Returns:
+            list[tuple]: (title, [ISBNs]) pairs.
+        """
+        key = prefix.strip().lower()
+        node = self.root
+        text = ""
+        i = 0
+        while i < len(key):
+            child = node.children.get(key[i]) if node.children else None
+            if child is None:
+                return []
+            rest = key[i:]
+            if child.label.startswith(rest):
+                text += child.label
+                node = child
+                break
+            if not rest.startswith(child.label):
+                return []
+            text += child.label
+            i += len(child.label)
+            node = child
+
+        results = []
+        stack = [(node, text)]
+        while stack and len(results) < limit:
+            current, path = stack.pop()
+            if current.isbn_list_head:
+                isbns = []
+                temp = current.isbn_list_head
+                while temp:
+                    isbns.append(temp.isbn)
+                    temp = temp.next
+                results.append((path, isbns))
+            for ch in sorted(current.children or (), reverse=True):
+                child = current.children[ch]
+                stack.append((child, path + child.label))
+        return results
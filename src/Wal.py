@@ -0,0 +1,177 @@
+import json
+import os
+import struct
+import time
+import zlib
+
+# Every record is framed as
+#
+#   length (u32)  CRC32 of the payload (u32)  payload (UTF-8 JSON array)
+#
+# and the payload is [lsn, operation, *arguments]. A crash can only leave a
+# torn record at the very end of the file; reading stops at the first frame
+# that is short or fails its checksum, and opening the log for writing cuts
+# that tail off so new records follow the last good one.
+
+FRAME = struct.Struct("<II")
+
+
+def readLog(path):
+    """
+    Reads the intact records of a log file.
+
+    Args:
+        path (str): Log file. A missing file reads as an empty log.
+
+    Returns:
+        tuple: (records as [lsn, operation, *arguments] lists, byte length of
+        the intact part of the file)
+    """
+    records = []
+    if not os.path.exists(path):
+        return records, 0
+    with open(path, mode="rb") as file:
+        data = file.read()
+
+    offset = 0
+    while offset + FRAME.size <= len(data):
+        length, crc = FRAME.unpack_from(data, offset)
+        start = offset + FRAME.size
+        payload = data[start:start + length]
+        if len(payload) < length or zlib.crc32(payload) != crc:
+            break
+        try:
+            records.append(json.loads(payload.decode("utf-8")))
+        except ValueError:
+            break
+        offset = start + length
+    return records, offset
+
+
+class WriteAheadLog:
+    """
+    Append-only transaction log with group commit.
+
+    The file is unbuffered: append() hands each record to the OS page cache
+    before it returns, so a crash of the process loses nothing it acknowledged. fsync() (the expensive
+    part) only runs once `sync_every` records are pending or `sync_interval`
+    seconds have passed since the last sync, so one disk flush covers a whole
+    group of transactions. sync_every=1 makes every record durable before
+    append() returns; larger values trade the last few acknowledged records on
+    power loss (not on a process crash) for throughput.
+
+    There is no background timer: `sync_interval` is checked when the next
+    record is appended, so records written just before the log goes idle stay
+    unsynced until the next append, sync() or close().
+
+    A record whose write or sync fails is cut off the file again, so a
+    transaction reported as failed is never replayed. If even that fails,
+    the log refuses every later append (`failed` holds the error).
+    """
+    def __init__(self, path, sync_every=1, sync_interval=None):
+        self.path = path
+        self.sync_every = max(1, sync_every)
+        self.sync_interval = sync_interval
+        self.pending = 0
+        self.syncs = 0
+        self.failed = None
+
+        records, good_length = readLog(path)
+        self.last_lsn = records[-1][0] if records else 0
+        self.file = open(path, mode="ab", buffering=0)
+        if self.file.tell() > good_length:
+            self.file.truncate(good_length)
+            self.file.seek(0, os.SEEK_END)
+        self.last_sync = time.monotonic()
+
+    def __len__(self):
+        return self.file.tell()
+
+    def append(self, lsn, operation, *args, sync=True):
+        """
+        Appends one record, syncing if the current group is full or the sync
+        interval has passed.
+
+        Args:
+            lsn (int): Log sequence number of the record (increasing).
+            operation (str): Name of the mutation.
+            *args: JSON-serialisable arguments of the mutation.
+            sync (bool): False skips the group check; the caller will call
+                sync() itself once a whole batch has been appended and only
+                acknowledges the batch after that.
+
+        Raises:
+            OSError: If the record could not be written or synced. It is then
+                not in the log.
+        """
+        payload = json.dumps([lsn, operation, *args], separators=(",", ":")).encode("utf-8")
+        self._write([FRAME.pack(len(payload), zlib.crc32(payload)) + payload], lsn,
+                    sync and (self.pending + 1 >= self.sync_every or (
+                        self.sync_interval is not None and time.monotonic() - self.last_sync >= self.sync_interval)))
+
+    def appendMany(self, records):
+        """
+        Appends a batch of [lsn, operation, *arguments] records with a single sync.
+        """
+        frames = []
+        for record in records:
+            payload = json.dumps(record, separators=(",", ":")).encode("utf-8")
+            frames.append(FRAME.pack(len(payload), zlib.crc32(payload)) + payload)
+            last_lsn = record[0]
+        if frames:
+            self._write(frames, last_lsn, True)
+
+    def _write(self, frames, last_lsn, sync):
+        """
+        Writes whole frames at the end of the file, then syncs if asked. On
+        failure the file is truncated back to where it was before the write.
+        """
+        if self.failed is not None:
+            raise OSError(f"log unusable after an earlier write error: {self.failed}")
+        data = memoryview(b"".join(frames))
+        offset = self.file.tell()
+        pending = self.pending
+        try:
+            written = 0
+            while written < len(data):
+                written += self.file.write(data[written:])
+            self.pending += len(frames)
+            if sync:
+                self.sync()
+        except OSError:
+            self.pending = pending
+            try:
+                self.file.truncate(offset)
+                self.file.seek(offset)
+            except OSError as e:
+                self.failed = e
+            raise
+        self.last_lsn = last_lsn
+
+    def sync(self):
+        """
+        Forces every pending record to disk.
+        """
+        self.file.flush()
+        if self.pending:
+            os.fsync(self.file.fileno())
+            self.syncs += 1
+        self.pending = 0
+        self.last_sync = time.monotonic()
+
+    def reset(self):
+        """
+        Empties the log, e.g. once a snapshot holds everything it recorded.
+        """
+        self.sync()
+        self.file.truncate(0)
+        self.file.seek(0)
+        os.fsync(self.file.fileno())
+
+    def close(self):
+        """
+        Syncs pending records and closes the file.
+        """
+        if not self.file.closed:
+            self.sync()
+            self.file.close()
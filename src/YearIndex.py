@@ -0,0 +1,62 @@
+import bisect
+
+from src.HashTable import HashTable
+
+def yearOf(book):
+    """
+    Returns a book's publication year as an int, or None if it is not a number.
+
+    Every year-keyed structure (YearIndex, the column store, the query cache's
+    year tags) reads the year through here, so they agree on which books have one.
+    """
+    try:
+        return int(book.year)
+    except (TypeError, ValueError):
+        return None
+
+class YearIndex:
+    """
+    Sorted index of publication years to ISBNs.
+
+    The distinct years are kept in a sorted array (there are only a few
+    hundred of them), and each year maps to its list of ISBNs through a
+    HashTable. A range query binary-searches the year array and then reads
+    only the buckets inside the range.
+    """
+    def __init__(self):
+        self.years = []  # sorted distinct years
+        self.buckets = HashTable(size=50)  # year -> list of ISBNs
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def add(self, year, isbn):
+        """
+        Indexes an ISBN under an integer year.
+        """
+        bucket = self.buckets.search(year)
+        if bucket is None:
+            bucket = []
+            self.buckets.insert(year, bucket)
+            bisect.insort(self.years, year)
+        bucket.append(isbn)
+        self.count += 1
+
+    def _yearsIn(self, lo, hi):
+        start = 0 if lo is None else bisect.bisect_left(self.years, lo)
+        end = len(self.years) if hi is None else bisect.bisect_right(self.years, hi)
+        return self.years[start:end]
+
+    def countRange(self, lo=None, hi=None):
+        """
+        Returns how many ISBNs were published between lo and hi (inclusive, None = open).
+        """
+        return sum(len(self.buckets.search(year)) for year in self._yearsIn(lo, hi))
+
+    def range(self, lo=None, hi=None):
+        """
+        Yields the ISBNs published between lo and hi (inclusive, None = open), oldest first.
+        """
+        for year in self._yearsIn(lo, hi):
+            yield from self.buckets.search(year)
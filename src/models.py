@@ -1,20 +1,27 @@
+from src.Isbn import parseISBN
+
 class Book:
     """
     Represents a book in the library system.
     """
+    __slots__ = ("isbn", "title", "author", "year", "category", "available_copies")
+
     def __init__(self, isbn, title, author, year, category, copies):
         """
         Initializes a Book instance.
         
         Args:
-            isbn (str): Unique International Standard Book Number.
+            isbn (str | int): ISBN-10 or ISBN-13, stored as its integer ISBN-13 key.
             title (str): Title of the book.
             author (str): Author of the book.
             year (str): Publication year.
             category (str): Genre/Category.
             copies (int): Total number of copies available.
+
+        Raises:
+            ValueError: If the ISBN is malformed or fails its checksum.
         """
-        self.isbn = str(isbn)  
+        self.isbn = parseISBN(isbn)
         self.title = title.strip().lower()  
         self.author = author.strip().lower()  
         self.year = year
@@ -25,6 +32,8 @@ class Member:
     """
     Represents a library member.
     """
+    __slots__ = ("member_id", "name", "borrowedBooks", "holds")
+
     def __init__(self, member_id, name):
         """
         Initializes a Member instance.
@@ -35,4 +44,52 @@ class Member:
         """
         self.member_id = member_id  
         self.name = name
-        self.borrowedBooks = []  
\ No newline at end of file
+        self.borrowedBooks = {}  # isbn -> Loan, in borrowing order
+        self.holds = {}  # isbn -> Hold
+
+class Loan:
+    """
+    Represents one borrowed book: who has it and when it is due back.
+    """
+    __slots__ = ("member_id", "isbn", "checkout", "due", "returned")
+
+    def __init__(self, member_id, isbn, checkout, due):
+        """
+        Initializes a Loan instance.
+
+        Args:
+            member_id (str): ID of the borrowing member.
+            isbn (int): ISBN key of the borrowed book.
+            checkout (float): Checkout time, in seconds since the epoch.
+            due (float): Time the book is due back, in seconds since the epoch.
+        """
+        self.member_id = member_id
+        self.isbn = isbn
+        self.checkout = checkout
+        self.due = due
+        self.returned = False
+
+class Hold:
+    """
+    Represents a member's place in the queue for a book.
+    """
+    __slots__ = ("member_id", "isbn", "placed", "expires", "ready", "active")
+
+    def __init__(self, member_id, isbn, placed, expires, ready=False):
+        """
+        Initializes a Hold instance.
+
+        Args:
+            member_id (str): ID of the waiting member.
+            isbn (int): ISBN key of the book.
+            placed (float): Time the hold was placed, in seconds since the epoch.
+            expires (float): Time the hold lapses: while waiting, the end of the
+                hold period; once a copy is set aside, the end of the pickup window.
+            ready (bool): True once a returned copy has been set aside for the member.
+        """
+        self.member_id = member_id
+        self.isbn = isbn
+        self.placed = placed
+        self.expires = expires
+        self.ready = ready
+        self.active = True
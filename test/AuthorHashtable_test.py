@@ -18,6 +18,8 @@ def test_author_hash_table():
     print(f"ISBNs for Robert Martin: {isbns}")
     assert len(isbns) == 3, "Should have 3 ISBNs stored"
     assert "9780132350884" in isbns
+    assert at.countFor("  robert MARTIN") == 3
+    assert at.countFor("Nobody") == 0
 
     print("\n2. Testing normalization (case and spaces)...")
     at.insert("  BRETT SLATKIN  ", "9781491912058")
@@ -44,5 +46,23 @@ def test_author_hash_table():
 
     print("\n[SUCCESS] All AuthorHashTable tests passed.")
 
+def test_author_resizing():
+    at = AuthorHT(size=4)
+    for i in range(500):
+        at.insert(f"Author {i}", str(i))
+        at.insert(f"Author {i}", str(i + 1000))
+    print(f"After 500 authors: {at.stats()}")
+    assert len(at) == 500, "Each author should be counted once"
+    assert at.size > 4
+    assert sorted(at.search("author 42")) == ["1042", "42"]
+    assert at.stats()["load_factor"] <= at.max_load * 2
+
+    for i in range(490):
+        assert at.delete(f"Author {i}")
+    assert len(at) == 10
+    assert at.search("Author 1") == []
+    assert at.search("Author 499") == ["1499", "499"]
+
 if __name__ == "__main__":
-    test_author_hash_table()
\ No newline at end of file
+    test_author_hash_table()
+    test_author_resizing()
\ No newline at end of file
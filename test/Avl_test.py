@@ -1,9 +1,15 @@
 import sys
 import os
+import random
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.Avl import AVLTree, display
 from src.Models import Book
+from src.Isbn import makeISBN
+
+def key(serial):
+    """Integer key of a generated valid ISBN; keys grow with serial."""
+    return int(makeISBN(serial))
 
 def test_avl():
     tree = AVLTree()
@@ -23,7 +29,7 @@ def test_avl():
     display(root)
 
     print("\n--- Testing Search ---")
-    search_isbn = "9780132350884"
+    search_isbn = 9780132350884
     result = tree.search(root, search_isbn)
     if result:
         print(f"Found: {result.book.title} by {result.book.author}")
@@ -37,9 +43,122 @@ def test_avl():
         print(f"{b.isbn}: {b.title}")
 
     print("\n--- Testing Deletion ---")
-    root = tree.delete(root, "9780134685991")
+    root = tree.delete(root, 9780134685991)
     print("Tree after deleting 9780134685991:")
     display(root)
 
+def check_balanced(node):
+    """Returns the height of node after asserting AVL and BST invariants."""
+    if node is None:
+        return 0
+    hl = check_balanced(node.left)
+    hr = check_balanced(node.right)
+    assert abs(hl - hr) <= 1, f"Unbalanced at {node.isbn}"
+    assert node.height == 1 + max(hl, hr)
+    if node.left:
+        assert node.left.isbn < node.isbn
+    if node.right:
+        assert node.right.isbn > node.isbn
+    expected_size = 1 + (node.left.size if node.left else 0) + (node.right.size if node.right else 0)
+    assert node.size == expected_size, f"Wrong subtree size at {node.isbn}"
+    return node.height
+
+def test_iterative_matches_recursive():
+    tree = AVLTree()
+    rec_root = None
+    iter_root = None
+    rng = random.Random(7)
+    keys = set()
+
+    print("\n--- Testing Iterative Engine Against Recursive ---")
+    for _ in range(3000):
+        isbn = key(rng.randrange(800))
+        if rng.random() < 0.6:
+            book = Book(isbn, f"Title {isbn}", "Author", 2000, "Test", 1)
+            rec_root = tree.insert(rec_root, isbn, book)
+            iter_root = tree.insertIter(iter_root, isbn, book)
+            keys.add(isbn)
+        else:
+            rec_root = tree.delete(rec_root, isbn)
+            iter_root = tree.deleteIter(iter_root, isbn)
+            keys.discard(isbn)
+
+    check_balanced(iter_root)
+    rec_books, iter_books = [], []
+    tree.inorder(rec_root, rec_books)
+    tree.inorderIter(iter_root, iter_books)
+    assert [b.isbn for b in iter_books] == [b.isbn for b in rec_books] == sorted(keys)
+    for isbn in keys:
+        assert tree.searchIter(iter_root, isbn).isbn == isbn
+    assert tree.searchIter(iter_root, key(900)) is None
+    print(f"✓ {len(keys)} keys agree after random inserts/deletes.")
+
+def test_build_sorted():
+    tree = AVLTree()
+    print("\n--- Testing Bulk Build From Sorted Input ---")
+    for n in (0, 1, 2, 7, 100, 1023, 1024):
+        items = [(key(i), Book(key(i), "T", "A", 2000, "C", 1)) for i in range(n)]
+        root = tree.buildSorted(items)
+        check_balanced(root)
+        books = []
+        tree.inorderIter(root, books)
+        assert [b.isbn for b in books] == [isbn for isbn, _ in items]
+        # The result must behave like any other AVL tree afterwards
+        root = tree.insertIter(root, key(999999), Book(key(999999), "T", "A", 2000, "C", 1))
+        check_balanced(root)
+    print("✓ Bulk-built trees are balanced and ordered.")
+
+def test_order_statistics():
+    tree = AVLTree()
+    root = None
+    rng = random.Random(11)
+    keys = set()
+
+    print("\n--- Testing Rank / Select / Range ---")
+    for _ in range(2000):
+        isbn = key(rng.randrange(600))
+        if rng.random() < 0.7:
+            root = tree.insertIter(root, isbn, Book(isbn, "T", "A", 2000, "C", 1))
+            keys.add(isbn)
+        else:
+            root = tree.deleteIter(root, isbn)
+            keys.discard(isbn)
+    check_balanced(root)
+
+    ordered = sorted(keys)
+    assert tree.size(root) == len(ordered)
+    for k, isbn in enumerate(ordered):
+        assert tree.select(root, k).isbn == isbn
+        assert tree.rank(root, isbn) == k
+    assert tree.select(root, len(ordered)) is None
+
+    assert [b.isbn for b in tree.page(root, 10, 25)] == ordered[10:35]
+    assert [b.isbn for b in tree.page(root, len(ordered) - 3, 10)] == ordered[-3:]
+    assert tree.page(root, len(ordered), 10) == []
+
+    lo, hi = key(100), key(250)
+    expected = [isbn for isbn in ordered if lo <= isbn <= hi]
+    assert [b.isbn for b in tree.rangeSearch(root, lo, hi)] == expected
+    print(f"✓ Order statistics agree with a sorted list of {len(ordered)} keys.")
+
+def test_search_many():
+    tree = AVLTree()
+    rng = random.Random(5)
+    isbns = sorted({key(rng.randrange(1, 10000)) for _ in range(3000)})
+    root = tree.buildSorted([(isbn, Book(isbn, "T", "A", 2000, "C", 1)) for isbn in isbns])
+
+    print("\n--- Testing Batched Search ---")
+    for batch_size in (0, 1, 10, 500, 5000):
+        # Present and missing keys, with repeats, below and above every key
+        keys = sorted(key(rng.randrange(10005)) for _ in range(batch_size))
+        nodes = tree.searchMany(root, keys)
+        assert nodes == [tree.searchIter(root, key) for key in keys]
+    assert tree.searchMany(None, [key(1), key(2)]) == [None, None]
+    print("✓ searchMany matches one search per key.")
+
 if __name__ == "__main__":
-    test_avl()
\ No newline at end of file
+    test_avl()
+    test_iterative_matches_recursive()
+    test_build_sorted()
+    test_order_statistics()
+    test_search_many()
\ No newline at end of file
@@ -0,0 +1,74 @@
+import sys
+import os
+from collections import Counter
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import src.ColumnStore as ColumnStore
+from src.Models import Book
+from src.System import LibrarySystem
+
+def scan_aggregates(lib):
+    """
+    The same aggregates computed by walking every book.
+    """
+    books = lib.listAllSorted()
+    by_category = Counter(b.category.strip() for b in books)
+    available = Counter(b.category.strip() for b in books if b.available_copies > 0)
+    copies = sum(b.available_copies for b in books)
+    decades = Counter(int(b.year) // 10 * 10 for b in books if str(b.year).isdigit())
+    return dict(by_category), dict(available), copies, dict(sorted(decades.items()))
+
+def column_aggregates(lib):
+    return (lib.categoryCounts(), lib.categoryCounts(available_only=True),
+            lib.totalAvailableCopies(), lib.yearHistogram(10))
+
+def check_library():
+    lib = LibrarySystem()
+    lib.loadBooksCSV('data/books.csv')
+    lib.loadMembersCSV('data/members.csv')
+    lib.bulkAddBooks([Book("9780306406157", "Bulk Title", "Bulk Author", "1875", "History", 1),
+                      Book("9780000000002", "No Year", "Bulk Author", "", "History", 2)])
+    assert column_aggregates(lib) == scan_aggregates(lib)
+
+    # Borrowing the only copy moves the book out of the available counts
+    assert lib.borrowBook("2024-EE-001", "9780306406157")[0]
+    assert lib.borrowBook("2024-EE-002", "9780132350884")[0]
+    assert column_aggregates(lib) == scan_aggregates(lib)
+    assert lib.returnBooks("2024-EE-001", "9780306406157")[0]
+    assert column_aggregates(lib) == scan_aggregates(lib)
+
+    # A second book with a catalogued ISBN is refused and leaves every index alone
+    before = column_aggregates(lib)
+    success, msg = lib.addBook(Book("9780132350884", "Other", "Someone Else", "1990", "Poetry", 9))
+    assert not success and "already in the catalog" in msg
+    assert lib.isbnSearch("9780132350884").title == "clean code"
+    assert column_aggregates(lib) == before == scan_aggregates(lib)
+    assert lib.titleSearch("other") is None and lib.authorSearch("someone else") == []
+    assert lib.keywordSearch("poetry") == []
+    lib.columns.add(Book("9780132350884", "Other", "Someone Else", "1990", "Poetry", 9))
+    assert column_aggregates(lib) == before
+
+    assert lib.yearHistogram(10)[1870] == 1
+    assert lib.columns.countByAuthor()["bulk author"] == 2
+    copies = Counter()
+    for book in lib.listAllSorted():
+        copies[book.category.strip()] += book.available_copies
+    assert lib.columns.copiesByCategory() == {c: n for c, n in copies.items() if n}
+
+def test_column_aggregates():
+    print("--- Testing Column Store Aggregates ---")
+    check_library()
+    print("✓ Aggregates match a full catalog scan.")
+
+def test_column_aggregates_without_numpy():
+    numpy = ColumnStore.numpy
+    ColumnStore.numpy = None
+    try:
+        check_library()
+    finally:
+        ColumnStore.numpy = numpy
+    print("✓ Pure-Python fallback gives the same answers.")
+
+if __name__ == "__main__":
+    test_column_aggregates()
+    test_column_aggregates_without_numpy()
@@ -0,0 +1,120 @@
+import sys
+import os
+import random
+import threading
+import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Models import Book, Member
+from src.Isbn import makeISBN
+from src.System import LibrarySystem
+
+def slow_log(*args, **kwargs):
+    # Stands in for a log write (fsync) between the availability check and the update
+    time.sleep(0.0002)
+
+def run_threads(count, target):
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+def test_last_copy_goes_to_one_thread():
+    print("--- Testing Concurrent Checkouts ---")
+    switch = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads as often as possible
+    try:
+        for _ in range(20):
+            lib = LibrarySystem(concurrent=True)
+            lib.addBook(Book("9780306406157", "Last Copy", "Someone", 2020, "Test", 3))
+            for i in range(16):
+                lib.addMember(Member(f"M{i}", f"Member {i}"))
+            lib._log = slow_log
+
+            results = []
+            run_threads(16, lambda i: results.append(lib.borrowBook(f"M{i}", "9780306406157")[0]))
+            assert results.count(True) == 3
+            assert lib.isbnSearch("9780306406157").available_copies == 0
+            assert lib.listAll() == []
+    finally:
+        sys.setswitchinterval(switch)
+    print("✓ Exactly as many borrows succeed as there are copies.")
+
+def test_stress_invariants():
+    switch = sys.getswitchinterval()
+    sys.setswitchinterval(1e-5)
+    try:
+        lib = LibrarySystem(concurrent=True, lock_stripes=8)
+        copies = {}
+        for i in range(40):
+            book = Book(makeISBN(i), f"Title {i}", f"Author {i % 5}", 2000 + i, "Stress", 1 + i % 3)
+            copies[book.isbn] = book.available_copies
+            lib.addBook(book)
+        for i in range(30):
+            lib.addMember(Member(f"M{i}", f"Member {i}"))
+        lib._log = slow_log
+
+        def worker(seed):
+            rng = random.Random(seed)
+            for step in range(400):
+                member_id = f"M{rng.randrange(30)}"
+                isbn = makeISBN(rng.randrange(40))
+                if rng.random() < 0.6:
+                    lib.borrowBook(member_id, isbn)
+                else:
+                    lib.returnBooks(member_id, isbn)
+                if seed == 0 and step % 100 == 0:
+                    # Catalog changes run exclusively alongside the checkouts
+                    lib.addMember(Member(f"X{step}", "Late Joiner"))
+
+        run_threads(8, worker)
+
+        on_loan = {}
+        for _, member in lib.member_db.items():
+            assert len(member.borrowedBooks) <= 5
+            for isbn in member.borrowedBooks:
+                on_loan[isbn] = on_loan.get(isbn, 0) + 1
+        for isbn, total in copies.items():
+            book = lib.isbnSearch(isbn)
+            assert book.available_copies >= 0
+            assert book.available_copies + on_loan.get(isbn, 0) == total
+        assert lib.listAll() == [b for b in lib.listAllSorted() if b.available_copies > 0]
+    finally:
+        sys.setswitchinterval(switch)
+    print("✓ Copies, loans and the availability index stay consistent under contention.")
+
+def test_reads_during_catalog_growth():
+    switch = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        lib = LibrarySystem(concurrent=True, cache_size=0)
+        added = [0]  # books 0..added[0]-1 are fully added
+        misses = []
+
+        def writer():
+            for i in range(6000):
+                lib.addBook(Book(makeISBN(i), f"Title {i}", f"Author {i}", 2000, "Growth", 1))
+                added[0] = i + 1
+
+        def reader(seed):
+            rng = random.Random(seed)
+            while added[0] < 6000:
+                if not added[0]:
+                    continue
+                i = rng.randrange(added[0])
+                # Lookups of books already added race the rotations and rehashes of later adds
+                if lib.isbnSearch(makeISBN(i)) is None or not lib.authorSearch(f"Author {i}"):
+                    misses.append(i)
+
+        run_threads(3, lambda i: writer() if i == 0 else reader(i))
+        assert misses == []
+        assert lib.bookCount() == 6000
+    finally:
+        sys.setswitchinterval(switch)
+    print("✓ Lookups never miss a book that is already in the catalog.")
+
+if __name__ == "__main__":
+    test_last_copy_goes_to_one_thread()
+    test_stress_invariants()
+    test_reads_during_catalog_growth()
@@ -0,0 +1,47 @@
+import sys
+import os
+import random
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.DueQueue import DueQueue
+from src.Models import Loan
+
+def test_matches_brute_force():
+    print("--- Testing Due Queue ---")
+    rng = random.Random(3)
+    queue = DueQueue()
+    active = []
+    for step in range(5000):
+        if active and rng.random() < 0.45:
+            loan = active.pop(rng.randrange(len(active)))
+            queue.discard(loan)
+        else:
+            # Coarse due times, so many loans share one
+            loan = Loan(f"M{step % 50}", step, step, rng.randrange(200))
+            queue.push(loan)
+            active.append(loan)
+
+        if step % 50 == 0:
+            # Ties are broken by scheduling order, which is the order of `active` by step
+            ordered = sorted(active, key=lambda l: (l.due, l.checkout))
+            assert len(queue) == len(active)
+            assert queue.peek() is (ordered[0] if ordered else None)
+            deadline = rng.randrange(-10, 210)
+            assert queue.dueBy(deadline) == [l for l in ordered if l.due <= deadline]
+        # Returned entries are compacted away, so the heap stays proportional to the loans
+        assert len(queue.heap) <= 2 * len(active) + 32
+    print(f"✓ peek/dueBy agree with a sorted list of {len(active)} loans.")
+
+def test_build():
+    loans = [Loan("M", i, 0, due) for i, due in enumerate([5, 3, 9, 1, 3])]
+    queue = DueQueue()
+    queue.build(loans)
+    assert len(queue) == 5 and queue.peek() is loans[3]
+    queue.discard(loans[3])
+    assert [l.isbn for l in queue.dueBy(3)] == [1, 4]
+    assert queue.dueBy(0) == [] and DueQueue().peek() is None
+    print("✓ A heapified queue behaves like one built by pushes.")
+
+if __name__ == "__main__":
+    test_matches_brute_force()
+    test_build()
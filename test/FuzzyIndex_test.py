@@ -0,0 +1,77 @@
+import sys
+import os
+import heapq
+import random
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.FuzzyIndex import TrigramIndex, editDistance, trigrams
+from src.AuthorHashTable import AuthorHT
+
+def test_edit_distance():
+    assert editDistance("robert martin", "robert martn") == 1
+    assert editDistance("kitten", "sitting") == 3
+    assert editDistance("", "abc") == 3
+    assert editDistance("same", "same") == 0
+
+def test_fuzzy_author_lookup():
+    print("--- Testing Trigram Author Index ---")
+    authors = AuthorHT(size=10)
+    for name, isbn in [("Robert Martin", "1"), ("Martin Fowler", "2"), ("Robert Sedgewick", "3"),
+                       ("Brett Slatkin", "4"), ("Mark Lutz", "5")]:
+        authors.insert(name, isbn)
+
+    index = TrigramIndex()
+    index.addAll(entry.authorName for entry in authors.authors())
+    index.add("  ROBERT MARTIN ")  # duplicate after normalisation
+    assert len(index) == 5
+
+    for typo, expected in [("Robert Martn", "robert martin"), ("brett slatkn", "brett slatkin"),
+                           ("Martin Fowlr", "martin fowler"), ("mark lutx", "mark lutz")]:
+        results = index.search(typo)
+        print(f"'{typo}' -> {results[:2]}")
+        assert results[0][0] == expected
+
+    assert index.search("zzzzzz") == []
+    assert index.search("") == []
+
+def scan(names, query, limit, min_similarity):
+    """
+    Reference search: scores every name (names maps each name to its trigrams).
+    """
+    query = query.strip()
+    grams = trigrams(query)
+    scored = []
+    for name, name_grams in names.items():
+        similarity = 2 * len(grams & name_grams) / (len(grams) + len(name_grams))
+        if similarity >= min_similarity and similarity > 0:
+            scored.append((similarity, name))
+    ranked = sorted((editDistance(query, name), -similarity, name)
+                    for similarity, name in heapq.nlargest(limit * 3, scored))
+    return [(name, distance) for distance, _, name in ranked[:limit]]
+
+def test_filters_match_full_scan():
+    rng = random.Random(3)
+    syllables = ["ber", "ton", "man", "sel", "kin", "ash", "mor", "lin", "ro", "a"]
+    names = {" ".join("".join(rng.choice(syllables) for _ in range(rng.randint(1, 3))) for _ in range(2))
+             for _ in range(3000)}
+    names = {name: trigrams(name) for name in sorted(names)}
+    index = TrigramIndex()
+    index.addAll(names)
+    candidates = sharing = 0
+    for _ in range(100):
+        query = rng.choice(list(names))
+        i = rng.randrange(len(query))
+        query = query[:i] + rng.choice("aeiklmnorst ") + query[i + 1:]
+        for limit, min_similarity in ((5, 0.3), (10, 0.0), (2, 0.5)):
+            before = index.candidates
+            assert index.search(query, limit, min_similarity) == scan(names, query, limit, min_similarity)
+        candidates += index.candidates - before
+        sharing += sum(1 for grams in names.values() if trigrams(query) & grams)
+    # A plain scan of the postings would count every name sharing a trigram
+    assert candidates < sharing / 2
+    print("✓ Count and prefix filtering return the same names as a full scan.")
+
+if __name__ == "__main__":
+    test_edit_distance()
+    test_fuzzy_author_lookup()
+    test_filters_match_full_scan()
@@ -30,5 +30,35 @@ def test_title_index():
     collision_test.delete("title a")
     print("Search 'title a' after delete:", collision_test.search("title a"))
 
+def test_resizing():
+    # Start tiny so the table has to grow several times
+    table = HashTable(size=4)
+    for i in range(1000):
+        table.insert(f"title {i}", str(i))
+    print(f"After 1000 inserts: {table.stats()}")
+    assert len(table) == 1000
+    assert table.size > 4, "Table should have grown"
+    assert table.search("title 0") == "0"
+    assert table.search("title 999") == "999"
+
+    # Updating an existing key must not change the count
+    table.insert("title 10", "ten")
+    assert len(table) == 1000
+    assert table.search("title 10") == "ten"
+
+    # Deleting most keys should shrink the table back down
+    grown = table.size
+    for i in range(990):
+        assert table.delete(f"title {i}")
+    for _ in range(50):
+        table.insert("title 995", "995")
+    print(f"After 990 deletes: {table.stats()}")
+    assert len(table) == 10
+    assert table.size < grown, "Table should have shrunk"
+    assert table.search("title 995") == "995"
+    assert table.search("title 5") is None
+    assert sorted(k for k, _ in table.items()) == sorted(f"title {i}" for i in range(990, 1000))
+
 if __name__ == "__main__":
-    test_title_index()
\ No newline at end of file
+    test_title_index()
+    test_resizing()
\ No newline at end of file
@@ -0,0 +1,134 @@
+import sys
+import os
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Models import Book, Member
+from src.Isbn import makeISBN
+from src.System import LibrarySystem
+
+DAY = 24 * 60 * 60
+ISBN = makeISBN(1)
+
+def make_library(n_members=6, copies=1):
+    lib = LibrarySystem(hold_period=30 * DAY, pickup_period=2 * DAY)
+    lib.addBook(Book(ISBN, "Dune", "Frank Herbert", 1965, "Fiction", copies))
+    lib.addBook(Book(makeISBN(2), "Emma", "Jane Austen", 1815, "Fiction", 1))
+    for i in range(n_members):
+        lib.addMember(Member(f"M{i}", f"Member {i}"))
+    return lib
+
+def holds_of(lib):
+    return sorted((h.member_id, h.isbn, h.placed, h.expires, h.ready) for h in lib.holds.holds())
+
+def test_fifo_hand_off():
+    print("--- Testing Hold Queues ---")
+    lib = make_library()
+    assert lib.borrowBook("M0", ISBN, now=0)[0]
+    assert lib.placeHold("M0", ISBN, now=1) == (False, "Member already has this book.")
+    assert lib.placeHold("M1", makeISBN(2), now=1) == (False, "Copies are available; borrow it instead.")
+    for i in (1, 2, 3):
+        assert lib.placeHold(f"M{i}", ISBN, now=i) == (True, f"Hold placed; position {i} in the queue.")
+    assert lib.placeHold("M1", ISBN, now=4) == (False, "Member already has a hold on this book.")
+    assert lib.holdQueueLength(ISBN) == 3 and lib.holdCount("M1") == 1
+
+    # The returned copy is set aside for the first holder, not shelved
+    assert lib.returnBooks("M0", ISBN, now=10) == (True, "Book returned successfully; set aside for M1.")
+    assert lib.isbnSearch(ISBN).available_copies == 0
+    assert lib.borrowBook("M4", ISBN, now=11) == (False, "No copies available.")
+    assert lib.borrowBook("M2", ISBN, now=11) == (False, "No copies available.")
+    assert lib.borrowBook("M1", ISBN, now=11)[0]
+    assert lib.holdCount("M1") == 0 and lib.holdQueueLength(ISBN) == 2
+
+    # A cancelled hold is skipped; cancelling a set-aside copy passes it on
+    assert lib.cancelHold("M2", ISBN, now=12) == (True, "Hold cancelled.")
+    assert lib.cancelHold("M2", ISBN, now=12) == (False, "No hold found for this book.")
+    assert lib.returnBooks("M1", ISBN, now=13)[1].endswith("set aside for M3.")
+    assert lib.placeHold("M4", ISBN, now=14)[0]
+    assert lib.cancelHold("M3", ISBN, now=15)[0]
+    assert [h.member_id for h in lib.holds.holds() if h.ready] == ["M4"]
+    assert lib.cancelHold("M4", ISBN, now=16)[0]
+    assert lib.isbnSearch(ISBN).available_copies == 1 and lib.holdQueueLength(ISBN) == 0
+    print("✓ Returned copies go to holders in FIFO order.")
+
+def test_expiry():
+    lib = make_library()
+    lib.borrowBook("M0", ISBN, now=0)
+    lib.placeHold("M1", ISBN, now=0)
+    lib.placeHold("M2", ISBN, now=DAY)
+    lib.placeHold("M3", ISBN, now=20 * DAY)
+    # M1's hold lapses before the copy comes back, so M2 is next
+    assert lib.returnBooks("M0", ISBN, now=30.5 * DAY)[1].endswith("set aside for M2.")
+    assert lib.holdCount("M1") == 0
+    # M2 does not collect within the pickup period, so the copy moves on to M3
+    assert lib.expireHolds(now=32 * DAY) == (True, "0 holds expired.")
+    assert lib.expireHolds(now=33 * DAY) == (True, "1 holds expired.")
+    assert [(h.member_id, h.ready, h.expires) for h in lib.holds.holds()] == [("M3", True, 35 * DAY)]
+    # Borrowing runs due expiry first: M3 missed the pickup too, so the copy is shelved for anyone
+    assert lib.borrowBook("M4", ISBN, now=36 * DAY)[0]
+    assert lib.holdQueueLength(ISBN) == 0 and list(lib.holds.holds()) == []
+    print("✓ Lapsed holds and uncollected copies expire in deadline order.")
+
+def test_limits_and_many_holds():
+    lib = make_library(n_members=3000)
+    for i in range(6):
+        lib.addBook(Book(makeISBN(100 + i), f"Book {i}", "Author", 2000, "Misc", 0))
+    for i in range(5):
+        assert lib.placeHold("M0", makeISBN(100 + i), now=0)[0]
+    assert lib.placeHold("M0", makeISBN(105), now=0) == (False, "Member has reached the 5-hold limit.")
+
+    lib.borrowBook("M0", ISBN, now=0)
+    for i in range(1, 3000):
+        lib.placeHold(f"M{i}", ISBN, now=i)
+    # Cancel every other hold; the survivors still receive the copy in order
+    for i in range(1, 3000, 2):
+        lib.cancelHold(f"M{i}", ISBN, now=3000)
+    assert lib.holdQueueLength(ISBN) == 1499
+    holder, now = "M0", 4000
+    for expected in range(2, 3000, 2):
+        msg = lib.returnBooks(holder, ISBN, now=now)[1]
+        assert msg.endswith(f"set aside for M{expected}.")
+        holder = f"M{expected}"
+        assert lib.borrowBook(holder, ISBN, now=now)[0]
+        now += 1
+    assert lib.returnBooks(holder, ISBN, now=now) == (True, "Book returned successfully.")
+    # The drained queue is dropped
+    assert lib.holds.queues.get(lib.isbnSearch(ISBN).isbn) is None
+    print("✓ 3000 holds on one book are served in order.")
+
+def test_replay_and_snapshot():
+    with tempfile.TemporaryDirectory() as tmp:
+        log, snap = os.path.join(tmp, "library.wal"), os.path.join(tmp, "library.snap")
+        lib = make_library()
+        lib.openLog(log)
+        lib.borrowBook("M0", ISBN, now=0)
+        for i in (1, 2, 3, 4):
+            lib.placeHold(f"M{i}", ISBN, now=i)
+        lib.cancelHold("M2", ISBN, now=5)
+        lib.returnBooks("M0", ISBN, now=6)
+        lib.expireHolds(now=6 + 3 * DAY)
+        expected = holds_of(lib)
+        assert [h[0] for h in expected] == ["M3", "M4"]
+        lib.closeLog()
+
+        replayed = make_library()
+        replayed.openLog(log)
+        assert holds_of(replayed) == expected
+        assert replayed.compactLog(snap)[0]
+        replayed.closeLog()
+
+        restored = LibrarySystem(hold_period=30 * DAY, pickup_period=2 * DAY)
+        assert restored.load_snapshot(snap)[0]
+        assert holds_of(restored) == expected
+        assert restored.holdQueueLength(ISBN) == 1 and restored.holdCount("M4") == 1
+        # The restored queues behave like the originals
+        assert restored.borrowBook("M4", ISBN, now=7 + 3 * DAY) == (False, "No copies available.")
+        assert restored.borrowBook("M3", ISBN, now=7 + 3 * DAY)[0]
+        assert restored.returnBooks("M3", ISBN, now=8 + 3 * DAY)[1].endswith("set aside for M4.")
+    print("✓ Holds survive log replay and snapshots.")
+
+if __name__ == "__main__":
+    test_fifo_hand_off()
+    test_expiry()
+    test_limits_and_many_holds()
+    test_replay_and_snapshot()
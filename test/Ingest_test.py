@@ -0,0 +1,102 @@
+import sys
+import os
+import csv
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.System import LibrarySystem
+from src.Isbn import makeISBN
+
+BOOK_ROWS = [
+    ["ISBN", "Title", "Author", "Year", "Category", "TotalCopies"],
+    ["9780134685991", "Effective Python", "Brett Slatkin", "2019", "Programming", "3"],
+    ["9780132350884", "Clean Code", "Robert Martin", "2008", "Programming", "five"],
+    ["9780596009205", "Head First Design Patterns", "Eric Freeman", "2004", "Design", "2"],
+    ["", "No ISBN", "Nobody", "2000", "Design", "1"],
+    ["9780134685991", "Effective Python Again", "Brett Slatkin", "2020", "Programming", "1"],
+    ["9780201633610", "Design Patterns", "Erich Gamma", "1994", "Computer Science", "4"],
+]
+
+def write_csv(path, rows):
+    with open(path, mode='w', encoding='utf-8', newline='') as file:
+        csv.writer(file).writerows(rows)
+
+def test_books_with_bad_rows():
+    print("--- Testing Streaming Book Ingestion ---")
+    with tempfile.TemporaryDirectory() as tmp:
+        books_path = os.path.join(tmp, "feed.csv")
+        reject_path = os.path.join(tmp, "rejects.csv")
+        write_csv(books_path, BOOK_ROWS)
+
+        lib = LibrarySystem()
+        calls = []
+        success, msg = lib.loadBooksCSV(books_path, reject_path=reject_path, batch_size=2,
+                                        progress=lambda *counts: calls.append(counts))
+        print(msg)
+        assert success
+        assert "Successfully loaded 3 books" in msg and "3 rows rejected" in msg
+        assert [b.isbn for b in lib.allSort()] == [9780134685991, 9780201633610, 9780596009205]
+        # One progress call per batch of two rows, with running totals
+        assert calls == [(2, 1, 1), (4, 2, 2), (6, 3, 3)]
+
+        with open(reject_path, encoding='utf-8') as file:
+            rejects = list(csv.DictReader(file))
+        assert [r["Line"] for r in rejects] == ["3", "5", "6"]
+        assert "TotalCopies" in rejects[0]["Error"]
+        assert "missing ISBN" in rejects[1]["Error"]
+        assert "duplicate ISBN" in rejects[2]["Error"]
+        assert rejects[2]["Title"] == "Effective Python Again"
+
+        # The bulk loader shares the same parser and reject report
+        bulk = LibrarySystem()
+        success, msg = bulk.bulkLoadBooksCSV(books_path)
+        assert success and "Successfully loaded 3 books (2 rows rejected)" in msg
+
+def test_members_and_errors():
+    print("--- Testing Streaming Member Ingestion ---")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "people.csv")
+        write_csv(path, [["MemberID", "Name"], ["M-1", "Ali"], ["M-2", ""], ["M-1", "Ali Again"], ["M-3", "Sara"]])
+        lib = LibrarySystem()
+        success, msg = lib.loadMembersCSV(path)
+        print(msg)
+        assert success and msg == "Successfully registered 2 members (2 rows rejected)."
+        assert lib.member_db.search("M-1").name == "Ali"
+
+        success, msg = lib.loadBooksCSV(os.path.join(tmp, "nowhere.csv"))
+        assert not success and msg == "Error: nowhere.csv file not found."
+
+        success, msg = lib.loadBooksCSV(path)
+        assert not success and "missing column" in msg
+
+def test_parallel_matches_serial():
+    print("--- Testing Parallel Book Ingestion ---")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "feed.csv")
+        rows = [BOOK_ROWS[0]]
+        for i in range(300):
+            copies = "x" if i % 50 == 7 else str(i % 4)
+            rows.append([makeISBN((i * 7919) % 1000), f"Title {i}", f"Author {i % 13}", "2001", "Test", copies])
+        write_csv(path, rows)
+
+        serial = LibrarySystem()
+        serial_rejects = os.path.join(tmp, "serial_rejects.csv")
+        serial.loadBooksCSV(path, reject_path=serial_rejects)
+
+        parallel = LibrarySystem()
+        parallel_rejects = os.path.join(tmp, "parallel_rejects.csv")
+        success, msg = parallel.parallelLoadBooksCSV(path, workers=2, reject_path=parallel_rejects)
+        print(msg)
+        assert success and "(6 rows rejected)" in msg
+        assert [b.isbn for b in parallel.allSort()] == [b.isbn for b in serial.allSort()]
+        assert len(parallel.authorSearch("Author 3")) == len(serial.authorSearch("Author 3"))
+
+        def reject_lines(report):
+            with open(report, encoding='utf-8') as file:
+                return [r["Line"] for r in csv.DictReader(file) if "TotalCopies" in r["Error"]]
+        assert reject_lines(parallel_rejects) == reject_lines(serial_rejects)
+
+if __name__ == "__main__":
+    test_books_with_bad_rows()
+    test_members_and_errors()
+    test_parallel_matches_serial()
@@ -0,0 +1,75 @@
+import sys
+import os
+import csv
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Isbn import parseISBN, isbnKey, boundKey, formatISBN, makeISBN
+from src.System import LibrarySystem
+
+def test_parse_and_normalise():
+    print("--- Testing ISBN Parsing ---")
+    # ISBN-10, hyphenated and ISBN-13 spellings of one book share a key
+    for spelling in ("9780132350884", "978-0-13-235088-4", "0132350882", "0-13-235088-2", " 0132350882 ", 9780132350884):
+        assert parseISBN(spelling) == 9780132350884, spelling
+    assert parseISBN("080442957X") == parseISBN("080442957x") == 9780804429573
+    assert formatISBN(parseISBN("0-13-235088-2")) == "9780132350884"
+
+    for bad in ("9780132350885", "0132350881", "1234567890123", "978013235088", "97801323508840",
+                "978013235088X", "", "ISBN", "９７８０１３２３５０８８４", True):
+        try:
+            parseISBN(bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {bad!r}")
+
+    assert isbnKey("0-13-235088-2") == 9780132350884 and isbnKey("nope") is None
+    assert boundKey("9780200000000") == 9780200000000
+    keys = [parseISBN(makeISBN(i)) for i in (0, 1, 2, 999_999_999)]
+    assert keys == sorted(keys) and formatISBN(keys[0]) == makeISBN(0)
+    print("✓ ISBN-10/13 spellings normalise to one checked integer key.")
+
+def test_any_spelling_finds_the_book():
+    lib = LibrarySystem()
+    lib.loadBooksCSV('data/books.csv')
+    lib.loadMembersCSV('data/members.csv')
+    book = lib.isbnSearch("0-13-235088-2")
+    assert book is lib.isbnSearch("9780132350884") and book.title == "clean code"
+    assert lib.isbnSearch("9780132350885") is None
+
+    assert lib.borrowBook("2024-EE-001", "0132350882")[0]
+    assert lib.returnBooks("2024-EE-001", "978-0-13-235088-4")[0]
+    assert lib.borrowBook("2024-EE-001", "not an isbn") == (False, "Invalid ISBN.")
+    print("✓ Lookups, borrows and returns accept any spelling.")
+
+def test_duplicates_caught_on_load():
+    rows = [
+        ["ISBN", "Title", "Author", "Year", "Category", "TotalCopies"],
+        ["9780132350884", "Clean Code", "Robert Martin", "2008", "Programming", "2"],
+        ["0-13-235088-2", "Clean Code (ISBN-10)", "Robert Martin", "2008", "Programming", "1"],
+        ["9780132350885", "Bad Check Digit", "Nobody", "2008", "Programming", "1"],
+        ["0201633612", "Design Patterns", "Erich Gamma", "1994", "Computer Science", "4"],
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "feed.csv")
+        reject_path = os.path.join(tmp, "rejects.csv")
+        with open(path, mode='w', encoding='utf-8', newline='') as file:
+            csv.writer(file).writerows(rows)
+
+        lib = LibrarySystem()
+        success, msg = lib.loadBooksCSV(path, reject_path=reject_path)
+        assert success and "Successfully loaded 2 books" in msg and "2 rows rejected" in msg
+        with open(reject_path, encoding='utf-8') as file:
+            errors = [r["Error"] for r in csv.DictReader(file)]
+        assert sorted(errors) == ["duplicate ISBN 9780132350884", "invalid ISBN '9780132350885': wrong check digit"]
+        assert [b.isbn for b in lib.allSort()] == [9780132350884, 9780201633610]
+
+        bulk = LibrarySystem()
+        success, msg = bulk.bulkLoadBooksCSV(path)
+        assert success and "Successfully loaded 2 books" in msg and "1 duplicate ISBNs skipped" in msg
+    print("✓ An ISBN-10 repeating an ISBN-13 is caught as a duplicate.")
+
+if __name__ == "__main__":
+    test_parse_and_normalise()
+    test_any_spelling_finds_the_book()
+    test_duplicates_caught_on_load()
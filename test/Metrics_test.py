@@ -0,0 +1,105 @@
+import sys
+import os
+import json
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Metrics import Histogram, BOUNDS, toJSON, toPrometheus
+from src.Models import Book, Member
+from src.Isbn import makeISBN
+from src.Avl import AVLTree
+from src.HashTable import HashTable
+from src.System import LibrarySystem, INSTRUMENTED
+
+def test_histogram():
+    print("--- Testing Metrics ---")
+    histogram = Histogram()
+    assert histogram.quantile(0.5) is None
+    for _ in range(90):
+        histogram.observe(3e-6)  # (2.5 us, 5 us] bucket
+    for _ in range(10):
+        histogram.observe(20.0)  # beyond the last bound
+    assert histogram.count == 100 and abs(histogram.sum - (90 * 3e-6 + 200)) < 1e-9
+    assert 2.5e-6 < histogram.quantile(0.5) <= 5e-6
+    assert histogram.quantile(0.99) == BOUNDS[-1]
+    buckets = dict(histogram.buckets())
+    assert buckets["2.5e-06"] == 0 and buckets["5e-06"] == 90 and buckets["10"] == 90 and buckets["+Inf"] == 100
+    # A value on a bound belongs to that bound's bucket (le = "less than or equal")
+    edge = Histogram()
+    edge.observe(1e-05)
+    assert dict(edge.buckets())["1e-05"] == 1
+    print("✓ Histogram buckets and quantiles behave like Prometheus'.")
+
+def test_structure_health():
+    tree = AVLTree()
+    root = None
+    for key in (1, 2, 3):  # ascending inserts need one left rotation
+        root = tree.insertIter(root, key, None)
+    stats = tree.stats(root)
+    assert (stats["nodes"], stats["height"], stats["rotations_left"], stats["rotations_right"]) == (3, 2, 1, 0)
+    for key in (0, -1):
+        root = tree.insert(root, key, None)
+    assert tree.rotations_right == 1 and tree.stats(root)["min_height"] == 3
+
+    table = HashTable(size=8)
+    for i in range(40):
+        table.insert(f"k{i}", i)
+    stats = table.stats()
+    chains = stats["chains"]
+    assert sum(length * n for length, n in chains.items()) == 40
+    assert sum(chains.values()) == table.size + table.old_size
+    assert max(chains) == stats["max_chain"]
+    print("✓ AVL rotations and hash chain distributions are reported.")
+
+def make_library(**options):
+    lib = LibrarySystem(**options)
+    for i in range(20):
+        lib.addBook(Book(makeISBN(i), f"Title {i}", f"Author {i % 4}", 2000, "Science", 1))
+    lib.addMember(Member("M1", "Member 1"))
+    return lib
+
+def test_operation_metrics():
+    lib = make_library()
+    # Off by default: the class methods are called directly
+    assert lib.metrics is None and "borrowBook" not in vars(lib)
+    assert lib.stats()["operations"] == {}
+
+    lib.enableMetrics()
+    assert all(name in vars(lib) for name in INSTRUMENTED)
+    assert lib.borrowBook("M1", makeISBN(1))[0]
+    assert not lib.borrowBook("M1", makeISBN(1))[0]
+    assert not lib.returnBooks("M2", makeISBN(1))[0]
+    lib.authorSearch("author 1")
+    ops = lib.stats()["operations"]
+    assert ops["borrowBook"]["calls"] == 2 and ops["borrowBook"]["failures"] == 1
+    assert ops["returnBooks"]["failures"] == 1
+    # Nested calls are counted too: authorSearch looks each book up by ISBN
+    assert ops["authorSearch"]["calls"] == 1 and "listByAuthor" not in ops
+    assert ops["borrowBook"]["p50_us"] <= ops["borrowBook"]["p99_us"]
+
+    stats = lib.stats()
+    assert stats["counts"] == {"books": 20, "members": 1, "loans": 1, "holds": 0}
+    assert set(stats["hash_tables"]) == {"member_db", "author_index", "category_index", "year_index"}
+    assert stats["hash_tables"]["year_index"]["count"] == 1  # every book is from 2000
+    assert stats["avl_trees"]["catalog"]["rotations_left"] > 0  # ascending ISBNs were inserted one by one
+    assert json.loads(toJSON(stats))["operations"]["borrowBook"]["calls"] == 2
+
+    text = toPrometheus(stats)
+    assert 'library_operation_duration_seconds_count{operation="borrowBook"} 2' in text
+    assert 'library_operation_failures_total{operation="borrowBook"} 1' in text
+    assert 'library_operation_duration_seconds_bucket{operation="borrowBook",le="+Inf"} 2' in text
+    assert 'library_hash_table_load_factor{table="member_db"} 0.02' in text
+    assert 'library_hash_table_keys{table="year_index"} 1' in text
+    assert 'library_avl_rotations_total{tree="catalog",direction="left"}' in text
+    for line in text.splitlines():
+        assert line.startswith("# ") or len(line.rsplit(" ", 1)) == 2
+
+    lib.disableMetrics()
+    assert lib.metrics is None and "borrowBook" not in vars(lib)
+    assert lib.returnBooks("M1", makeISBN(1))[0]
+    assert make_library(metrics=True).stats()["operations"]["addBook"]["calls"] == 20
+    print("✓ Calls, failures and latencies are recorded only while metrics are on.")
+
+if __name__ == "__main__":
+    test_histogram()
+    test_structure_health()
+    test_operation_metrics()
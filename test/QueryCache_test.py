@@ -0,0 +1,136 @@
+import sys
+import os
+import random
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.QueryCache import QueryCache
+from src.Models import Book, Member
+from src.Isbn import makeISBN
+from src.System import LibrarySystem
+
+def test_lru_and_tags():
+    print("--- Testing Query Cache ---")
+    cache = QueryCache(capacity=3)
+    for i in range(3):
+        cache.put(("q", i), [i], (("tag", i % 2),))
+    assert cache.get(("q", 0)) == [0]  # q0 is now the most recently used
+    cache.put(("q", 3), [3], (("tag", 1),))
+    assert cache.get(("q", 1)) is None  # q1 was least recently used
+    assert len(cache) == 3 and cache.evictions == 1
+
+    assert cache.invalidate(("tag", 1)) == 1  # only q3 is left with tag 1
+    assert cache.get(("q", 3)) is None and cache.get(("q", 2)) == [2]
+    assert cache.invalidate(("tag", 7)) == 0
+
+    # A result computed before an invalidation is not stored
+    version = cache.version
+    cache.invalidate(("tag", 0))
+    cache.put(("q", 9), [9], (), version)
+    assert cache.get(("q", 9)) is None
+    cache.put(("q", 9), [9], (), cache.version)
+    assert cache.get(("q", 9)) == [9]
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["invalidations"]) == (3, 3, 1, 3)
+    cache.clear()
+    assert len(cache) == 0 and cache.tags == {}
+    QueryCache(capacity=0).put("k", 1, ())
+    print("✓ LRU order, eviction and tag invalidation work.")
+
+def make_library(cache_size):
+    lib = LibrarySystem(cache_size=cache_size)
+    lib.bulkAddBooks(Book(makeISBN(i), f"Title {i % 40}", f"Author {i % 25}", 1990 + i % 30,
+                          ("Fiction", "Science", "History")[i % 3], i % 3) for i in range(300))
+    for i in range(20):
+        lib.addMember(Member(f"M{i}", f"Member {i}"))
+    return lib
+
+def snapshot(books):
+    return None if books is None else [(b.isbn, b.available_copies) for b in books]
+
+def test_matches_uncached_library():
+    rng = random.Random(5)
+    cached, plain = make_library(64), make_library(0)
+    next_isbn = 300
+    for step in range(3000):
+        r = rng.random()
+        if r < 0.5:
+            name, args = rng.choice([
+                ("authorSearch", (f"author {rng.randrange(27)}",)),
+                ("listByAuthor", (f" Author {rng.randrange(27)}",)),
+                ("titleSearchAll", (f"title {rng.randrange(42)}",)),
+                ("titlePrefixSearch", (f"title {rng.randrange(5)}", 5)),
+                ("keywordSearch", (rng.choice(["science", "title 3", "author 7 fiction"]), 5)),
+                ("findBooks", ()),
+                ("listAll", ()),
+                ("listByMember", (f"M{rng.randrange(22)}",)),
+            ])
+            if name == "findBooks":
+                query = dict(category=rng.choice([None, "science", "History"]),
+                             author=rng.choice([None, f"Author {rng.randrange(27)}"]),
+                             year_from=rng.choice([None, 2000]), year_to=rng.choice([None, 2001, 2010]),
+                             available_only=rng.random() < 0.5)
+                assert snapshot(cached.findBooks(**query)) == snapshot(plain.findBooks(**query))
+            else:
+                assert snapshot(getattr(cached, name)(*args)) == snapshot(getattr(plain, name)(*args))
+        elif r < 0.75:
+            pair = (f"M{rng.randrange(20)}", makeISBN(rng.randrange(next_isbn)))
+            assert cached.borrowBook(*pair, now=step) == plain.borrowBook(*pair, now=step)
+        elif r < 0.97:
+            member = f"M{rng.randrange(20)}"
+            loans = list(plain.member_db.search(member).borrowedBooks)
+            isbn = rng.choice(loans) if loans else makeISBN(0)
+            assert cached.returnBooks(member, isbn, now=step) == plain.returnBooks(member, isbn, now=step)
+        else:
+            fields = [(makeISBN(next_isbn + i), f"Title {rng.randrange(42)}", f"Author {rng.randrange(27)}",
+                       rng.choice([2001, 2005, 2015]), rng.choice(["Science", "Poetry"]), rng.randrange(2))
+                      for i in range(rng.choice([1, 1, 3]))]
+            for lib in (cached, plain):
+                if len(fields) == 1:
+                    lib.addBook(Book(*fields[0]))
+                else:
+                    lib.bulkAddBooks([Book(*f) for f in fields])
+            next_isbn += len(fields)
+    stats = cached.cacheStats()
+    assert stats["hits"] > 0 and stats["evictions"] > 0 and stats["invalidations"] > 0
+    assert plain.cacheStats()["size"] == 0
+    print(f"✓ Cached results match an uncached library ({stats['hit_rate']:.0%} hit rate).")
+
+def test_invalidation_is_precise():
+    lib = make_library(100)
+    lib.authorSearch("Author 1")
+    lib.authorSearch("Author 2")
+    lib.listByMember("M1")
+    lib.listByMember("M2")
+    lib.borrowBook("M1", makeISBN(1))  # 1 copy of this book: the member list and "available" change
+    assert ("member", "M1") not in lib.cache.entries and ("member", "M2") in lib.cache.entries
+    assert ("author", "author 1") in lib.cache.entries
+    lib.addBook(Book(makeISBN(1000), "New", "Author 1", 2020, "Science", 1))
+    assert ("author", "author 1") not in lib.cache.entries and ("author", "author 2") in lib.cache.entries
+    assert lib.isbnSearch(makeISBN(1000)) in lib.authorSearch("author 1")
+    # An add only drops the prefix, category, year and author entries it matches
+    lib.titlePrefixSearch("title 1")
+    lib.titlePrefixSearch("title 2")
+    lib.findBooks(category="History")
+    lib.findBooks(category="Fiction")
+    lib.findBooks(year_from=1990, year_to=1995)
+    lib.findBooks(year_from=2010, year_to=2019)
+    lib.findBooks(author="Author 3", category="Fiction")
+    cached = set(lib.cache.entries)
+    lib.addBook(Book(makeISBN(1001), "Title 2b", "Author 4", 2012, "History", 0))
+    dropped = cached - set(lib.cache.entries)
+    assert dropped == {("prefix", "title 2", 10), ("find", "history", None, None, None, False),
+                       ("find", None, 2010, 2019, None, False)}
+    lib.bulkAddBooks([Book(makeISBN(1002), "Other", "Author 3", 1993, "Poetry", 0)])
+    dropped = cached - dropped - set(lib.cache.entries)
+    assert dropped == {("find", None, 1990, 1995, None, False), ("find", "fiction", None, None, "author 3", False)}
+    assert ("find", "fiction", None, None, None, False) in lib.cache.entries
+    # The caller gets its own list
+    lib.authorSearch("author 2").clear()
+    assert lib.authorSearch("author 2")
+    print("✓ Writes only drop the cached results they affect.")
+
+if __name__ == "__main__":
+    test_lru_and_tags()
+    test_matches_uncached_library()
+    test_invalidation_is_precise()
@@ -0,0 +1,118 @@
+import sys
+import os
+import asyncio
+import json
+import socket
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.System import LibrarySystem
+from src.Server import LibraryServer
+
+def make_library():
+    lib = LibrarySystem()
+    lib.loadBooksCSV('data/books.csv')
+    lib.loadMembersCSV('data/members.csv')
+    return lib
+
+async def send_all(reader, writer, requests):
+    """
+    Pipelines every request before reading any response.
+    """
+    writer.write("".join(json.dumps(r) + "\n" for r in requests).encode())
+    await writer.drain()
+    return [json.loads(await reader.readline()) for _ in requests]
+
+def test_requests_and_pipelining():
+    print("--- Testing Library Server ---")
+
+    async def scenario():
+        server = LibraryServer(make_library(), port=0)
+        await server.start()
+        reader, writer = await asyncio.open_connection(server.host, server.port)
+
+        responses = await send_all(reader, writer, [
+            {"id": 1, "op": "ping"},
+            {"id": 2, "op": "isbn", "args": {"isbn": "9780132350884"}},
+            {"id": 3, "op": "borrow", "args": {"member_id": "2024-EE-001", "isbn": "9780132350884"}},
+            {"id": 4, "op": "report", "args": {"kind": "member", "key": "2024-EE-001"}},
+            {"id": 5, "op": "return", "args": {"member_id": "2024-EE-001", "isbn": "9780132350884"}},
+            {"id": 6, "op": "return", "args": {"member_id": "2024-EE-001", "isbn": "9780132350884"}},
+            {"id": 7, "op": "keyword", "args": {"query": "clean code", "limit": 3}},
+            {"id": 8, "op": "report", "args": {"kind": "sorted", "offset": 0, "limit": 5}},
+            {"id": 9, "op": "nope"},
+            {"id": 10, "op": "isbn", "args": {"wrong": 1}},
+        ])
+        assert [r["id"] for r in responses] == list(range(1, 11))
+        assert responses[0]["result"] == "pong"
+        copies = responses[1]["result"]["available_copies"]
+        assert responses[2]["ok"]
+        assert [b["isbn"] for b in responses[3]["result"]] == ["9780132350884"]
+        assert responses[4]["ok"] and not responses[5]["ok"]
+        assert server.library.isbnSearch("9780132350884").available_copies == copies
+        assert responses[6]["result"][0]["title"] == "clean code"
+        assert len(responses[7]["result"]) == 5
+        assert not responses[8]["ok"] and "unknown op" in responses[8]["error"]
+        assert not responses[9]["ok"]
+
+        # A malformed line is answered and the connection keeps working
+        writer.write(b"{not json\n")
+        assert not json.loads(await reader.readline())["ok"]
+        assert (await send_all(reader, writer, [{"id": 11, "op": "ping"}]))[0]["id"] == 11
+
+        # A badly typed argument fails inside the library, not in the server
+        responses = await send_all(reader, writer, [
+            {"id": 12, "op": "ping"},
+            {"id": 13, "op": "title", "args": {"title": 5}},
+            {"id": 14, "op": "title", "args": {"title": "clean code"}},
+        ])
+        assert [r["id"] for r in responses] == [12, 13, 14]
+        assert responses[0]["ok"] and not responses[1]["ok"] and responses[2]["ok"]
+        assert responses[2]["result"][0]["title"] == "clean code"
+
+        responses = await send_all(reader, writer, [
+            {"id": 15, "op": "borrow", "args": {"member_id": "2024-EE-002", "isbn": "0132350882"}},
+            {"id": 16, "op": "overdue"},
+            {"id": 17, "op": "overdue", "args": {"now": 10 ** 12}},
+        ])
+        assert responses[1]["result"] == []
+        assert [(l["member_id"], l["isbn"]) for l in responses[2]["result"]] == [("2024-EE-002", "9780132350884")]
+
+        writer.close()
+        await writer.wait_closed()
+        await server.close()
+
+    asyncio.run(scenario())
+    print("✓ Pipelined requests are answered in order.")
+
+def test_backpressure():
+    async def scenario():
+        server = LibraryServer(make_library(), port=0, high_water=1024)
+        await server.start()
+        # Small client-side buffers so that an unread connection fills up quickly
+        sock = socket.socket()
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+        sock.connect((server.host, server.port))
+        reader, writer = await asyncio.open_connection(sock=sock, limit=16 * 1024)
+        request = json.dumps({"op": "report", "args": {"kind": "sorted", "limit": 20}}) + "\n"
+
+        # Send a lot without reading: the server must stop reading from us
+        writer.write(request.encode() * 3000)
+        await asyncio.sleep(0.5)
+        served_while_stalled = server.requests
+        assert served_while_stalled < 3000
+
+        # Once the client reads, everything is answered
+        for _ in range(3000):
+            assert json.loads(await reader.readline())["ok"]
+        assert server.requests == 3000
+
+        writer.close()
+        await writer.wait_closed()
+        await server.close()
+
+    asyncio.run(scenario())
+    print("✓ The server stops reading from a client that does not read its responses.")
+
+if __name__ == "__main__":
+    test_requests_and_pipelining()
+    test_backpressure()
@@ -0,0 +1,89 @@
+import sys
+import os
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Models import Book
+from src.System import LibrarySystem
+
+def test_snapshot_round_trip():
+    print("--- Testing Snapshot Save / Load ---")
+    lib = LibrarySystem()
+    lib.loadBooksCSV('data/books.csv')
+    lib.loadMembersCSV('data/members.csv')
+    lib.addBook(Book("9780306406157", "Ünïcode Ťitle", "Zoë Author", 2021, "Languages", 1))
+    lib.borrowBook("2024-EE-001", "9780306406157")
+    lib.borrowBook("2024-EE-001", "9780132350884")
+    lib.borrowBook("2024-EE-003", "9780132350884")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "library.snap")
+        success, msg = lib.save_snapshot(path)
+        print(msg)
+        assert success
+
+        restored = LibrarySystem()
+        success, msg = restored.load_snapshot(path)
+        print(msg)
+        assert success
+
+        original = lib.listAllSorted()
+        copy = restored.listAllSorted()
+        assert [(b.isbn, b.title, b.author, b.category, str(b.year), b.available_copies) for b in copy] == \
+               [(b.isbn, b.title, b.author, b.category, str(b.year), b.available_copies) for b in original]
+        assert restored.listByMember("2024-EE-001") == [restored.isbnSearch("9780306406157"),
+                                                        restored.isbnSearch("9780132350884")]
+        assert restored.titleSearch("ünïcode ťitle").isbn == 9780306406157
+        # Loans keep their checkout and due times and are rescheduled
+        loans = lambda system: [(l.member_id, l.isbn, l.checkout, l.due) for l in system.overdueLoans(float("inf"))]
+        assert len(loans(restored)) == 3 and loans(restored) == loans(lib)
+        assert restored.listAll() == [b for b in copy if b.available_copies > 0]
+        assert restored.member_db.search("2024-EE-020").name == lib.member_db.search("2024-EE-020").name
+        assert restored.returnBooks("2024-EE-003", "9780132350884")[0]
+
+        # Loading twice, or into a system that already has data, is refused
+        assert not restored.load_snapshot(path)[0]
+
+def test_corrupt_snapshot():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "library.snap")
+        lib = LibrarySystem()
+        lib.loadBooksCSV('data/books.csv')
+        lib.save_snapshot(path)
+
+        with open(path, "r+b") as file:
+            file.seek(200)
+            file.write(b"\xff\xff\xff")
+        success, msg = LibrarySystem().load_snapshot(path)
+        print(msg)
+        assert not success and "checksum" in msg
+
+        with open(path, "wb") as file:
+            file.write(b"not a snapshot at all, just text....")
+        assert not LibrarySystem().load_snapshot(path)[0]
+        assert LibrarySystem().load_snapshot(os.path.join(tmp, "missing.snap")) == \
+               (False, "Error: missing.snap file not found.")
+
+def test_long_strings_and_oversized_values():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "library.snap")
+        lib = LibrarySystem()
+        title = "long title " * 7000
+        assert lib.addBook(Book("9780306406157", title, "Zoë Author", 2021, "Languages", 1))[0]
+        assert lib.save_snapshot(path)[0]
+        restored = LibrarySystem()
+        assert restored.load_snapshot(path)[0]
+        assert restored.isbnSearch("9780306406157").title == lib.isbnSearch("9780306406157").title
+
+        # A value the format cannot hold is reported, and the old snapshot stays
+        lib.isbnSearch("9780306406157").available_copies = 2 ** 40
+        success, msg = lib.save_snapshot(path)
+        print(msg)
+        assert not success and "Could not write snapshot" in msg
+        assert LibrarySystem().load_snapshot(path)[0]
+        assert sorted(os.listdir(tmp)) == ["library.snap"]
+
+if __name__ == "__main__":
+    test_snapshot_round_trip()
+    test_corrupt_snapshot()
+    test_long_strings_and_oversized_values()
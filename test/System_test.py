@@ -1,10 +1,12 @@
 import sys
 import os
+import random
 # Adjust path to import from src
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.Models import Book, Member
 from src.System import LibrarySystem
+from src.Isbn import formatISBN
 
 def run_tests():
     lib = LibrarySystem()
@@ -73,5 +75,241 @@ def run_tests():
     print(f"Return: {msg}")
     print("✓ Return operations verified.")
 
+def test_bulk_load():
+    print("\n--- 6. Testing Bulk Load Against Row-by-Row Load ---")
+    serial = LibrarySystem()
+    serial.loadBooksCSV('data/books.csv')
+    bulk = LibrarySystem()
+    bulk.addBook(Book("9780134685991", "Pre-existing Copy", "Someone", 2000, "Test", 1))
+    success, msg = bulk.bulkLoadBooksCSV('data/books.csv')
+    print(f"Bulk: {msg}")
+    assert success
+
+    serial_isbns = [b.isbn for b in serial.allSort()]
+    bulk_isbns = [b.isbn for b in bulk.allSort()]
+    assert bulk_isbns == serial_isbns
+    # The book that was already in the catalog wins over the CSV duplicate
+    assert bulk.isbnSearch("9780134685991").title == "pre-existing copy"
+    assert bulk.authorSearch("Robert Martin")
+    assert bulk.titleSearch("Clean Code").isbn == 9780132350884
+
+    success, msg = bulk.bulkLoadBooksCSV('data/missing.csv')
+    assert not success and "missing.csv" in msg
+    print("✓ Bulk load matches the row-by-row catalog.")
+
+def test_paging_and_ranges():
+    print("\n--- 7. Testing Catalog Paging and ISBN Ranges ---")
+    lib = LibrarySystem()
+    lib.loadBooksCSV('data/books.csv')
+    everything = [b.isbn for b in lib.listAllSorted()]
+    assert lib.bookCount() == len(everything)
+    assert [b.isbn for b in lib.listSortedPage(0, 10)] == everything[:10]
+    assert [b.isbn for b in lib.listSortedPage(45, 10)] == everything[45:]
+    in_range = [b.isbn for b in lib.rangeByISBN("9780200000000", "9780399999999")]
+    assert in_range == [i for i in everything if 9780200000000 <= i <= 9780399999999]
+    assert in_range
+    print(f"✓ Paging over {len(everything)} books verified.")
+
+def test_lazy_reports():
+    print("\n--- 8. Testing Lazy Report Iterators ---")
+    lib = LibrarySystem()
+    lib.loadBooksCSV('data/books.csv')
+    lib.loadMembersCSV('data/members.csv')
+    everything = lib.listAllSorted()
+
+    cursor = lib.iterAllSorted()
+    first_three = [next(cursor) for _ in range(3)]
+    assert first_three == everything[:3]
+
+    resume_at = everything[20].isbn
+    assert list(lib.iterAllSorted(start=resume_at)) == everything[20:]
+    # Resuming between two keys starts at the next larger ISBN
+    assert next(lib.iterAllSorted(start=resume_at + 1)) is everything[21]
+    # A bound that is not a number gives an empty report, as in rangeByISBN
+    assert list(lib.iterAllSorted(start="abc")) == list(lib.iterAll(start="abc")) == lib.rangeByISBN("abc", "9")
+    assert lib.rangeByISBN("abc", "9") == []
+
+    first = everything[0]
+    for i in range(first.available_copies):
+        assert lib.borrowBook(f"2024-EE-{i + 10:03d}", first.isbn)[0]
+    assert list(lib.iterAll()) == lib.listAll() == everything[1:]
+    assert list(lib.iterByAuthor("robert martin")) == lib.listByAuthor("Robert Martin")
+
+    lib.borrowBook("2024-EE-002", everything[5].isbn)
+    assert list(lib.iterByMember("2024-EE-002")) == [everything[5]]
+    assert list(lib.iterByMember("nobody")) == []
+    assert lib.listByMember("nobody") is None
+    print("✓ Iterators match the list reports and can resume or stop early.")
+
+def test_availability_index():
+    print("\n--- 9. Testing Availability Index ---")
+    lib = LibrarySystem()
+    lib.bulkLoadBooksCSV('data/books.csv')
+    lib.loadMembersCSV('data/members.csv')
+    lib.addBook(Book("9780000000002", "Out Of Print", "Nobody", 1900, "History", 0))
+    total = lib.bookCount()
+    assert lib.availableCount() == total - 1
+
+    book = lib.isbnSearch("9780596009205")  # 2 copies
+    assert lib.borrowBook("2024-EE-001", book.isbn)[0]
+    assert lib.availableCount() == total - 1, "Still one copy left"
+    assert lib.borrowBook("2024-EE-002", book.isbn)[0]
+    assert lib.availableCount() == total - 2
+    assert book not in lib.listAll()
+
+    assert lib.returnBooks("2024-EE-001", book.isbn)[0]
+    assert lib.availableCount() == total - 1
+    assert book in lib.listAll()
+    assert lib.listAll() == [b for b in lib.listAllSorted() if b.available_copies > 0]
+    print("✓ Availability index follows borrows and returns.")
+
+def test_title_editions_and_prefix():
+    print("\n--- 10. Testing Multi-Edition Titles and Prefix Search ---")
+    lib = LibrarySystem()
+    lib.loadBooksCSV('data/books.csv')
+    lib.addBook(Book("9780132350891", "Clean Code", "Robert Martin", 2025, "Programming", 1))
+    editions = lib.titleSearchAll("clean code")
+    assert sorted(b.isbn for b in editions) == [9780132350884, 9780132350891]
+    assert lib.titleSearch("Clean Code") is not None
+
+    suggestions = [b.title for b in lib.titlePrefixSearch("clean", limit=5)]
+    print(f"Suggestions for 'clean': {suggestions}")
+    assert suggestions == ["clean architecture", "clean code", "clean code"]
+    assert [b.title for b in lib.titlePrefixSearch("learning", limit=2)] == ["learning android", "learning java"]
+    print("✓ Every edition is kept and prefixes autocomplete.")
+
+    results = lib.keywordSearch("python programming", limit=5)
+    print(f"Keyword 'python programming': {[b.title for b in results]}")
+    assert results and all("python" in b.title for b in results[:3])
+    lib.addBook(Book("9780000000019", "Zymurgy Handbook", "Ann Brewer", 2020, "Hobbies", 1))
+    assert [b.title for b in lib.keywordSearch("zymurgy")] == ["zymurgy handbook"]
+
+    assert lib.fuzzyAuthorSearch("Robert Martn")[0] == "robert martin"
+    assert lib.fuzzyAuthorSearch("ann brewr")[0] == "ann brewer", "Authors added later are indexed too"
+
+def test_compound_queries():
+    print("\n--- 11. Testing Category / Year Compound Queries ---")
+    lib = LibrarySystem()
+    lib.loadBooksCSV('data/books.csv')
+    lib.loadMembersCSV('data/members.csv')
+    everything = lib.listAllSorted()
+
+    def brute(category=None, year_from=None, year_to=None, author=None, available_only=False):
+        return [b for b in everything
+                if (category is None or b.category.lower() == category.lower())
+                and (year_from is None or int(b.year) >= year_from)
+                and (year_to is None or int(b.year) <= year_to)
+                and (author is None or b.author == author.lower())
+                and (not available_only or b.available_copies > 0)]
+
+    programming = lib.findBooks(category="programming", year_from=2008, year_to=2014)
+    print(f"Programming 2008-2014: {len(programming)} books")
+    assert programming == brute("Programming", 2008, 2014) and programming
+
+    golang = lib.isbnSearch("9780134190440")
+    for i in range(golang.available_copies):
+        lib.borrowBook(f"2024-EE-{i + 1:03d}", golang.isbn)
+    queries = [
+        dict(category="Programming", year_from=2015, available_only=True),
+        dict(year_to=1990),
+        dict(author="Robert Martin", year_from=2010),
+        dict(category="database", author="Alan Beaulieu"),
+        dict(available_only=True),
+        dict(category="No Such Category"),
+    ]
+    for query in queries:
+        assert lib.findBooks(**query) == brute(**query), query
+    assert golang not in lib.findBooks(category="Programming", available_only=True)
+    assert lib.findBooks() == everything
+    print("✓ Compound queries match a full scan.")
+
+def test_batched_checkouts():
+    print("\n--- Testing Batched Borrow / Return ---")
+    lib = LibrarySystem()
+    lib.loadBooksCSV('data/books.csv')
+    lib.loadMembersCSV('data/members.csv')
+    reference = LibrarySystem()
+    reference.loadBooksCSV('data/books.csv')
+    reference.loadMembersCSV('data/members.csv')
+
+    isbns = [formatISBN(b.isbn) for b in lib.listAllSorted()]
+    rng = random.Random(4)
+    pairs = [(f"2024-EE-00{rng.randrange(1, 6)}", rng.choice(isbns)) for _ in range(60)]
+    pairs.append(("2024-EE-001", "0000000000000"))  # not an ISBN
+    pairs.append(("2024-EE-001", "9780000000002"))  # unknown book
+    pairs.append(("NOBODY", isbns[0]))  # unknown member
+
+    # Same outcome as applying the requests one by one in ISBN order
+    results = lib.borrowMany(pairs)
+    order = sorted(range(len(pairs)), key=lambda i: pairs[i][1])
+    expected = [None] * len(pairs)
+    for i in order:
+        expected[i] = reference.borrowBook(*pairs[i])
+    assert results == expected
+    assert results[-3] == (False, "Invalid ISBN.")
+    assert results[-2] == (False, "Book not found.") and results[-1] == (False, "Member not found.")
+    assert [(b.isbn, b.available_copies) for b in lib.listAllSorted()] == \
+           [(b.isbn, b.available_copies) for b in reference.listAllSorted()]
+
+    returns = pairs[:30] + pairs[:5]  # the repeats fail: already returned
+    results = lib.returnMany(returns)
+    expected = [None] * len(returns)
+    for i in sorted(range(len(returns)), key=lambda i: returns[i][1]):
+        expected[i] = reference.returnBooks(*returns[i])
+    assert results == expected
+    for member_id in ("2024-EE-001", "2024-EE-002", "2024-EE-003"):
+        assert sorted(lib.member_db.search(member_id).borrowedBooks) == \
+               sorted(reference.member_db.search(member_id).borrowedBooks)
+    assert lib.listAll() == [b for b in lib.listAllSorted() if b.available_copies > 0]
+    print("✓ borrowMany/returnMany match the per-call loop.")
+
+def test_compact_records():
+    # Per-book objects use __slots__, so none of them carries a __dict__
+    lib = LibrarySystem()
+    lib.loadBooksCSV('data/books.csv')
+    lib.loadMembersCSV('data/members.csv')
+    trie_node = lib.title_index._find("clean code")
+    records = [
+        lib.isbnSearch("9780132350884"),
+        lib.member_db.search("2024-EE-001"),
+        lib.catalog.searchIter(lib.root, 9780132350884),
+        next(node for node in lib.member_db.table if node),
+        next(lib.author_index.authors()),
+        trie_node,
+        trie_node.isbn_list_head,
+    ]
+    for record in records:
+        assert record is not None and not hasattr(record, "__dict__"), type(record).__name__
+
+def test_overdue_loans():
+    lib = LibrarySystem(loan_period=100)
+    lib.loadBooksCSV('data/books.csv')
+    lib.loadMembersCSV('data/members.csv')
+    assert lib.borrowBook("2024-EE-001", "9780132350884", now=0)[0]  # due at 100
+    assert lib.borrowBook("2024-EE-002", "9780596009205", now=50)[0]  # due at 150
+    assert lib.borrowBook("2024-EE-001", "9780134190440", now=10, due=60)[0]
+    assert lib.borrowBook("2024-EE-001", "9780132350884", now=20) == (False, "Member already has this book.")
+
+    assert lib.nextOverdue(now=59) is None
+    loan = lib.nextOverdue(now=60)
+    assert (loan.member_id, loan.isbn, loan.checkout) == ("2024-EE-001", 9780134190440, 10)
+    assert [l.due for l in lib.overdueLoans(now=120)] == [60, 100]
+    assert lib.member_db.search("2024-EE-001").borrowedBooks[9780132350884].due == 100
+
+    # Returned loans leave the queue
+    assert lib.returnBooks("2024-EE-001", "9780134190440")[0]
+    assert lib.nextOverdue(now=120).isbn == 9780132350884
+    assert [l.isbn for l in lib.overdueLoans(now=1000)] == [9780132350884, 9780596009205]
+    print("✓ Overdue loans are read from the due queue in due order.")
+
 if __name__ == "__main__":
-    run_tests()
\ No newline at end of file
+    run_tests()
+    test_bulk_load()
+    test_paging_and_ranges()
+    test_lazy_reports()
+    test_availability_index()
+    test_title_editions_and_prefix()
+    test_compound_queries()
+    test_batched_checkouts()
+    test_compact_records()
+    test_overdue_loans()
\ No newline at end of file
@@ -0,0 +1,64 @@
+import sys
+import os
+import math
+import random
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.TextIndex import InvertedIndex, tokenize
+
+def brute_force_bm25(docs, query, k1=1.2, b=0.75):
+    """Scores every document directly from the BM25 formula."""
+    n = len(docs)
+    avg = sum(len(t) for t in docs.values()) / n
+    scores = {}
+    for term in set(tokenize(query)):
+        df = sum(1 for tokens in docs.values() if term in tokens)
+        if not df:
+            continue
+        idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+        for isbn, tokens in docs.items():
+            tf = tokens.count(term)
+            if tf:
+                norm = k1 * (1 - b + b * len(tokens) / avg)
+                scores[isbn] = scores.get(isbn, 0.0) + idf * tf * (k1 + 1) / (tf + norm)
+    return scores
+
+def test_keyword_ranking():
+    index = InvertedIndex()
+    print("--- Testing Inverted Index ---")
+    index.add("1", "Fluent Python", "Luciano Ramalho", "Programming")
+    index.add("2", "Python for Data Analysis", "Wes McKinney", "Data Science")
+    index.add("3", "Clean Code", "Robert Martin", "Programming")
+    assert not index.add("1", "Duplicate", "Ignored", "")
+    assert len(index) == 3
+
+    results = index.search("python data")
+    print(f"'python data': {results}")
+    assert [isbn for isbn, _ in results] == ["2", "1"], "Matching both words ranks first"
+    assert index.search("PYTHON")[0][0] in ("1", "2")
+    assert index.search("cobol") == []
+    assert index.search("") == []
+
+def test_pruned_search_matches_brute_force():
+    rng = random.Random(3)
+    vocab = [f"w{i}" for i in range(60)]
+    weights = [1 / (i + 1) for i in range(60)]  # skewed, like real titles
+    index = InvertedIndex()
+    docs = {}
+    for i in range(1500):
+        tokens = rng.choices(vocab, weights, k=rng.randint(2, 9))
+        docs[str(i)] = tokens
+        index.add(str(i), " ".join(tokens))
+
+    for query in ["w0 w1", "w0 w40", "w2 w3 w59", "w0 w1 w2 w3 w4", "w55"]:
+        expected = brute_force_bm25(docs, query)
+        got = index.search(query, limit=10)
+        best = sorted(expected.values(), reverse=True)[:10]
+        assert [round(s, 9) for _, s in got] == [round(s, 9) for s in best], query
+        for isbn, score in got:
+            assert abs(expected[isbn] - score) < 1e-9
+    print("✓ Pruned BM25 top-10 matches brute force.")
+
+if __name__ == "__main__":
+    test_keyword_ranking()
+    test_pruned_search_matches_brute_force()
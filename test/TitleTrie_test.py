@@ -0,0 +1,78 @@
+import sys
+import os
+import random
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.TitleTrie import TitleTrie
+
+def test_title_trie():
+    trie = TitleTrie()
+    print("--- Testing Title Trie ---")
+
+    print("\n1. Testing several ISBNs under one title...")
+    trie.insert("Clean Code", "111")
+    trie.insert("  CLEAN CODE ", "222")
+    assert trie.search("clean code") == ["222", "111"], "Both editions should be kept"
+    assert len(trie) == 1
+
+    print("\n2. Testing titles that share prefixes (edge splits)...")
+    for title, isbn in [("Clean Coder", "333"), ("Clean", "444"), ("Clean Architecture", "555"), ("Cleaning", "666")]:
+        trie.insert(title, isbn)
+    assert trie.search("clean") == ["444"]
+    assert trie.search("clean coder") == ["333"]
+    assert trie.search("clea") == []
+    assert trie.search("clean code extra") == []
+    assert len(trie) == 5
+
+    print("\n3. Testing prefix queries...")
+    titles = [t for t, _ in trie.prefix("clean c", limit=10)]
+    print(f"Prefix 'clean c': {titles}")
+    assert titles == ["clean code", "clean coder"]
+    assert [t for t, _ in trie.prefix("Clean", limit=3)] == ["clean", "clean architecture", "clean code"]
+    assert trie.prefix("java") == []
+    assert trie.prefix("clean codes") == []
+
+def test_prefix_matches_sorted_scan():
+    rng = random.Random(5)
+    trie = TitleTrie()
+    titles = {}
+    for i in range(2000):
+        title = "".join(rng.choice("abc ") for _ in range(rng.randint(1, 8))).strip() or "a"
+        trie.insert(title, str(i))
+        titles.setdefault(title, []).insert(0, str(i))
+
+    assert len(trie) == len(titles)
+    ordered = sorted(titles)
+    for prefix in ["", "a", "ab", "b c", "cab", "zzz"]:
+        expected = [t for t in ordered if t.startswith(prefix)][:25]
+        got = trie.prefix(prefix, limit=25)
+        assert [t for t, _ in got] == expected, prefix
+        assert all(isbns == titles[t] for t, isbns in got)
+    print("✓ Prefix results match a sorted scan.")
+
+def test_build_sorted_matches_insert():
+    rng = random.Random(9)
+    pairs = []
+    for i in range(3000):
+        title = "".join(rng.choice("ab c") for _ in range(rng.randint(0, 7))).strip()
+        pairs.append((title, str(i)))
+
+    inserted = TitleTrie()
+    for title, isbn in pairs:
+        inserted.insert(title, isbn)
+    built = TitleTrie()
+    built.buildSorted(sorted(pairs, key=lambda p: p[0]))
+
+    assert len(built) == len(inserted)
+    assert built.prefix("", limit=10**6) == inserted.prefix("", limit=10**6)
+    for prefix in ["a", "b c", "ca", "zz"]:
+        assert built.prefix(prefix, limit=50) == inserted.prefix(prefix, limit=50)
+    # A bulk-built trie still accepts ordinary inserts
+    built.insert("ab", "new")
+    assert built.search("ab")[0] == "new"
+    print("✓ Bulk-built trie matches one built by inserts.")
+
+if __name__ == "__main__":
+    test_title_trie()
+    test_prefix_matches_sorted_scan()
+    test_build_sorted_matches_insert()
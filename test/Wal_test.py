@@ -0,0 +1,165 @@
+import sys
+import os
+import errno
+import subprocess
+import tempfile
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Models import Book, Member
+from src.System import LibrarySystem
+from src.Wal import WriteAheadLog, readLog
+
+def state(lib):
+    books = [(b.isbn, b.title, b.available_copies) for b in lib.listAllSorted()]
+    members = sorted((m.member_id, m.name, tuple((loan.isbn, loan.checkout, loan.due) for loan in m.borrowedBooks.values()))
+                     for _, m in lib.member_db.items())
+    return books, members
+
+def test_log_framing_and_torn_tail():
+    print("--- Testing Write-Ahead Log Framing ---")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "library.wal")
+        wal = WriteAheadLog(path, sync_every=4)
+        for i in range(1, 11):
+            wal.append(i, "borrow", "m", str(i))
+        wal.appendMany([[11, "return", "m", "1"], [12, "return", "m", "2"]])
+        wal.close()
+        # 10 appends in groups of 4 -> 2 group syncs, then one for the rest of the batch
+        assert wal.syncs == 3
+
+        records, length = readLog(path)
+        assert [r[0] for r in records] == list(range(1, 13))
+        assert records[10] == [11, "return", "m", "1"]
+        assert length == os.path.getsize(path)
+
+        # A crash in the middle of a write leaves a torn record at the end
+        with open(path, "ab") as file:
+            file.write(b"\x30\x00\x00\x00\x01\x02")
+        records, _ = readLog(path)
+        assert len(records) == 12
+        wal = WriteAheadLog(path)
+        assert len(wal) == length and wal.last_lsn == 12
+        wal.append(13, "borrow", "m", "13")
+        wal.close()
+        assert [r[0] for r in readLog(path)[0]] == list(range(1, 14))
+        print("✓ Torn tail is ignored and cut off before appending.")
+
+def test_process_crash_keeps_unsynced_records():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "library.wal")
+        # The process dies without closing the log, before a group sync is due
+        script = ("import os, sys\n"
+                  "from src.Wal import WriteAheadLog\n"
+                  "wal = WriteAheadLog(sys.argv[1], sync_every=8)\n"
+                  "for i in range(1, 6):\n"
+                  "    wal.append(i, 'borrow', 'm', str(i))\n"
+                  "os._exit(0)\n")
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        subprocess.run([sys.executable, "-c", script, path], cwd=root, check=True)
+        assert [r[0] for r in readLog(path)[0]] == [1, 2, 3, 4, 5]
+        print("✓ Acknowledged records survive a process crash between group syncs.")
+
+def test_failed_write_is_not_replayed():
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, "library.wal")
+        lib = LibrarySystem()
+        lib.loadBooksCSV('data/books.csv')
+        lib.loadMembersCSV('data/members.csv')
+        lib.openLog(log_path)
+        assert lib.borrowBook("2024-EE-001", "9780132350884")[0]
+
+        def full(fd):
+            raise OSError(errno.ENOSPC, "No space left on device")
+        fsync = os.fsync
+        os.fsync = full
+        try:
+            success, msg = lib.borrowBook("2024-EE-002", "9780132350884")
+            assert not success and "Could not log" in msg
+            assert lib.addBook(Book("9780306406157", "Unlogged", "Some Author", 2020, "Testing", 1))[0] is False
+            assert lib.addMember(Member("2024-EE-950", "Unlogged"))[0] is False
+        finally:
+            os.fsync = fsync
+        assert lib.listByMember("2024-EE-002") == [] and lib.isbnSearch("9780306406157") is None
+        assert lib.lsn == 1
+        assert lib.returnBooks("2024-EE-001", "9780132350884")[0]
+        assert [r[0] for r in readLog(log_path)[0]] == [1, 2]
+
+        # Replay rebuilds exactly the live state: the failed borrow is not in the log
+        recovered = LibrarySystem()
+        recovered.loadBooksCSV('data/books.csv')
+        recovered.loadMembersCSV('data/members.csv')
+        assert recovered.openLog(log_path) == (True, "Replayed 2 log records.")
+        assert state(recovered) == state(lib)
+        recovered.closeLog()
+        lib.closeLog()
+        print("✓ A record whose sync failed is cut off and never replayed.")
+
+def test_crash_recovery_and_compaction():
+    print("--- Testing Log Replay and Compaction ---")
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, "library.wal")
+        snap_path = os.path.join(tmp, "library.snap")
+
+        lib = LibrarySystem()
+        lib.loadBooksCSV('data/books.csv')
+        assert lib.save_snapshot(snap_path)[0]
+        assert lib.openLog(log_path, sync_every=3) == (True, "Replayed 0 log records.")
+
+        lib.addMember(Member("2024-EE-900", "New Member"))
+        lib.addBook(Book("9780306406157", "Logged Book", "Some Author", 2020, "Testing", 1))
+        lib.bulkAddBooks([Book("9780000000002", "Bulk Book", "Some Author", 2021, "Testing", 2)])
+        assert lib.borrowBook("2024-EE-900", "9780306406157")[0]
+        assert lib.borrowBook("2024-EE-900", "9780132350884")[0]
+        assert not lib.borrowBook("2024-EE-900", "9780306406157")[0]  # refused, not logged
+        assert lib.returnBooks("2024-EE-900", "9780132350884")[0]
+        assert lib.lsn == 6
+        lib.wal.sync()  # a crash now loses nothing
+
+        recovered = LibrarySystem()
+        assert recovered.load_snapshot(snap_path)[0]
+        assert recovered.openLog(log_path) == (True, "Replayed 6 log records.")
+        assert state(recovered) == state(lib)
+        assert recovered.isbnSearch("9780306406157").available_copies == 0
+        assert recovered.titleSearch("bulk book").isbn == 9780000000002
+
+        # Compaction: the snapshot takes over the log's contents
+        assert lib.compactLog(snap_path)[0]
+        assert readLog(log_path) == ([], 0)
+        assert lib.borrowBook("2024-EE-900", "9780000000002")[0]
+        lib.closeLog()
+
+        recovered.closeLog()
+        recovered = LibrarySystem()
+        recovered.load_snapshot(snap_path)
+        assert recovered.openLog(log_path) == (True, "Replayed 1 log records.")
+        assert state(recovered) == state(lib)
+        recovered.closeLog()
+        print("✓ Snapshot + log replay rebuilds the exact state.")
+
+def test_crash_during_compaction():
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, "library.wal")
+        snap_path = os.path.join(tmp, "library.snap")
+
+        lib = LibrarySystem()
+        lib.loadBooksCSV('data/books.csv')
+        lib.openLog(log_path)
+        lib.addMember(Member("2024-EE-901", "Crash Test"))
+        lib.borrowBook("2024-EE-901", "9780132350884")
+        # Snapshot written, but the process died before the log was truncated
+        lib.save_snapshot(snap_path)
+        lib.closeLog()
+
+        recovered = LibrarySystem()
+        recovered.load_snapshot(snap_path)
+        assert recovered.openLog(log_path) == (True, "Replayed 0 log records.")
+        assert recovered.listByMember("2024-EE-901") == [recovered.isbnSearch("9780132350884")]
+        assert state(recovered) == state(lib)
+        recovered.closeLog()
+
+if __name__ == "__main__":
+    test_log_framing_and_torn_tail()
+    test_process_crash_keeps_unsynced_records()
+    test_failed_write_is_not_replayed()
+    test_crash_recovery_and_compaction()
+    test_crash_during_compaction()